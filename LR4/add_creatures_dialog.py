@@ -12,6 +12,7 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 from ecosystem import EcoSystem
 import configs
+import species_registry
 
 
 class AddCreaturesSignal(QtCore.QObject):
@@ -113,7 +114,7 @@ class Ui_addCreaturesDialog(object):
         self.creatureTypeBox.setCursor(QtGui.QCursor(QtCore.Qt.ArrowCursor))
         self.creatureTypeBox.setStyleSheet("background-color: rgb(224, 224, 255);")
         self.creatureTypeBox.setObjectName("creatureTypeBox")
-        for i in range(7):
+        for i in range(len(species_registry.entries())):
             self.creatureTypeBox.addItem("")
         self.gridLayout.addWidget(self.creatureTypeBox, 4, 1, 1, 1)
         self.creatureAmountSpinBox = QtWidgets.QSpinBox(addCreaturesDialog)
@@ -230,14 +231,8 @@ class Ui_addCreaturesDialog(object):
         item.setText(_translate("MainWindow", "Вид существа"))
         item = self.addedTable.horizontalHeaderItem(1)
         item.setText(_translate("MainWindow", "Количество"))
-        self.creatureTypeBox.setItemText(0, _translate("newCreatureDialog",
-                                                       configs.RussianCreaturesNames.BLUEBERRY.value))
-        self.creatureTypeBox.setItemText(1, _translate("newCreatureDialog", configs.RussianCreaturesNames.HAZEL.value))
-        self.creatureTypeBox.setItemText(2, _translate("newCreatureDialog", configs.RussianCreaturesNames.MAPLE.value))
-        self.creatureTypeBox.setItemText(3, _translate("newCreatureDialog", configs.RussianCreaturesNames.BOAR.value))
-        self.creatureTypeBox.setItemText(4, _translate("newCreatureDialog", configs.RussianCreaturesNames.ELK.value))
-        self.creatureTypeBox.setItemText(5, _translate("newCreatureDialog", configs.RussianCreaturesNames.WOLF.value))
-        self.creatureTypeBox.setItemText(6, _translate("newCreatureDialog", configs.RussianCreaturesNames.BEAR.value))
+        for i, entry in enumerate(species_registry.entries()):
+            self.creatureTypeBox.setItemText(i, _translate("newCreatureDialog", entry.russian_name))
         self.creatureTypeBox.setPlaceholderText(_translate("newCreatureDialog", "Выберите тип существа..."))
         self.addButton.setToolTip(_translate("MainWindow", "Разместить в список на добавление, +"))
         self.addButton.setShortcut(_translate("MainWindow", "+"))
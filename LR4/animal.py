@@ -1,36 +1,55 @@
 #Author Vodohleb04
-import random
+import random_streams
 from abc import ABC
-from typing import Tuple, Dict
+from typing import Dict, Optional, Tuple
 from creature_interfaces import Movable, Dieable, Aging, Eatable, Hunger, Powerful
 from reproduction import GenderReproduction
-from random import randint
 from forest import Forest
 import configs
+import power_tables
 
 
 class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Powerful, ABC):
+    # Parameters of kind are attributes of class, every animal keeps only its own state
+    __slots__ = ("_hectare", "_number", "_gender", "_mother", "_father", "_age", "_hp", "_nutritional_value",
+                 "_food_energy", "_power_coefficient", "_damage", "_sterile_period", "_power", "_power_age")
+
+    # Parameters of kind are given by profile of species (see species_profiles)
+    # _power_tables: Dict[Genders, PowerTable] - basic power of kind by gender and age
+
+    @classmethod
+    def _apply_profile(cls, profile) -> None:
+        """Builds tables of kind from its profile of species (called by species_profiles)"""
+        cls._power_tables = {
+            configs.Genders.MALE: power_tables.growth_table(profile.male_start_power,
+                                                            profile.male_power_function_coefficient,
+                                                            profile.reproduction_age_interval),
+            configs.Genders.FEMALE: power_tables.growth_table(profile.female_start_power,
+                                                              profile.female_power_function_coefficient,
+                                                              profile.reproduction_age_interval)
+        }
 
-    #_sterile_period: int
+    @classmethod
+    def from_dict(cls, info_d: Dict):
+        """Creates creature of kind from dict of its info (used in load of save)"""
+        return cls(unpack_dict_flag=True, info_d=info_d)
 
     def be_eaten(self, nutritional_value: int) -> int:
         """Reduce nutritional value of creature if it is eaten (returns reduced value)
 
         nutritional_value - amount, that other creature want to eat
         """
+        old_nutritional_value = self._nutritional_value
         if self._nutritional_value > nutritional_value:
             self._nutritional_value -= nutritional_value
-            return nutritional_value
         else:
             self._nutritional_value = 0
-            return nutritional_value
+        if self._nutritional_value != old_nutritional_value:
+            self._mark_changed()
+        return nutritional_value
 
-    def die(self) -> None:
-        """Makes creature dead"""
-        if not self.is_dead():
-            self._hunger_per_cycle = 0
-            self._id += "_dead"
-            super().die()
+    def _power_of_age(self, age: int) -> float:
+        return self._power_coefficient * self._power_tables[self._gender][age]
 
     def protect(self, enemy) -> bool:
         """Try to protect from attack of other creature
@@ -38,18 +57,19 @@ class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Power
         enemy: Animal - creature, that tries to attack this creature
         return bool - True, if creature protect itself successfully
         """
-        lucky_chance = randint(0, 1)
+        lucky_chance = random_streams.randint(0, 1)
         if lucky_chance == 1:
             enemy.get_hearted(self._damage)
-            self.get_hearted(enemy._damage * configs.UnprotectedDamageMultiplier.EVERY_ANIMAL_UDM.value)
+            self.get_hearted(enemy._damage * self._unprotected_damage_multiplier)
             return True
         else:
             return False
 
-    def _can_produce_children(self, partner) -> bool:
+    def _can_produce_children(self, partner, kinship) -> bool:
         """Determines if creature can produce children with partner
 
         partner: Animal of the same type
+        kinship: Pedigree of ecosystem
         return True, if creatures can produce children
         """
         if self.is_dead() or partner.is_dead():
@@ -62,7 +82,7 @@ class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Power
             return False
         elif self._sterile_period > 0 or partner._sterile_period > 0:
             return False
-        elif self._are_relatives(partner):
+        elif self._are_relatives(partner, kinship):
             return False
         else:
             return True
@@ -87,58 +107,55 @@ class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Power
         self._sterile_period -= 1
 
         if self._age > self._life_median:
-            chance = randint(0, self._age - self._life_median)
+            chance = random_streams.randint(0, self._age - self._life_median)
             if chance != 0:
                 self.die()
                 return
         self.unexpected_death()
         # TODO Search for food, chance to move in class Forest
 
-    def __find_position_in_forest(self, forest: Forest) -> Tuple[int, int]:
-        """Determines position of creature in forest
+    def choose_destination(self, forest: Forest) -> Optional[Tuple[int, int]]:
+        """Returns number of hectare (vertical number, horizontal number) to move to or None if creature stays
 
         forest - data container for creatures
-        return Tuple[int, int] - vertical index of creature, horizontal index of creature
         """
-        not_found_flag = True
-        i = 0
-        j = 0
-        for hectare_line in forest.hectares:
-            j = 0
-            for hectare in hectare_line:
-                if self in hectare.creations:
-                    not_found_flag = False
-                    break
-                j += 1
-            else:
-                i += 1
-                continue
-            break
-        if not_found_flag:
-            raise ValueError(f"Creature with id {self.id} wasn't found in forest")
-        return i, j
+        if not isinstance(forest, Forest):
+            raise TypeError
+        return self.choose_destination_from(forest.find_position(self), (forest.vertical_length,
+                                                                          forest.horizontal_length))
 
-    def move(self, forest: Forest) -> None:
-        """Move this creature to another hectare of forest
+    def choose_destination_from(self, position: Tuple[int, int], forest_size: Tuple[int, int],
+                                chance_to_move=None) -> Optional[Tuple[int, int]]:
+        """Returns number of hectare (vertical number, horizontal number) to move to or None if creature stays
 
-        forest - data container for creatures
+        position - (vertical number, horizontal number) of hectare where creature is located
+        forest_size - (vertical length, horizontal length) of forest
+        chance_to_move - chance in range [1, 3] drawn beforehand (batched draws of phase), None - creature draws it
         """
-        chance_to_move = randint(1, 3)
+        if chance_to_move is None:
+            chance_to_move = random_streams.randint(1, 3)
         if chance_to_move != 1:
-            return
-        if not isinstance(forest, Forest):
-            raise TypeError
-        vertical_pos, horizontal_pos = self.__find_position_in_forest(forest)
-        vertical_shift = random.randint(-1, 1)
-        horizontal_shift = random.randint(-1, 1)
+            return None
+        vertical_pos, horizontal_pos = position
+        vertical_length, horizontal_length = forest_size
+        vertical_shift = random_streams.randint(-1, 1)
+        horizontal_shift = random_streams.randint(-1, 1)
         while vertical_shift == 0 or\
                 horizontal_shift == 0 or\
-                vertical_pos + vertical_shift >= forest.vertical_length or\
-                horizontal_pos + horizontal_shift >= forest.horizontal_length:
-            vertical_shift = random.randint(-1, 1)
-            horizontal_shift = random.randint(-1, 1)
-        forest.hectares[vertical_pos][horizontal_pos].creations.remove(self)
-        forest.hectares[vertical_pos + vertical_shift][horizontal_pos + horizontal_shift].creations.append(self)
+                vertical_pos + vertical_shift >= vertical_length or\
+                horizontal_pos + horizontal_shift >= horizontal_length:
+            vertical_shift = random_streams.randint(-1, 1)
+            horizontal_shift = random_streams.randint(-1, 1)
+        return vertical_pos + vertical_shift, horizontal_pos + horizontal_shift
+
+    def move(self, forest: Forest) -> None:
+        """Move this creature to another hectare of forest
+
+        forest - data container for creatures
+        """
+        destination = self.choose_destination(forest)
+        if destination is not None:
+            forest.move_creature(self, *destination)
 
     def get_dict_of_info(self) -> dict:
         """Returns dict with parameters of creature
@@ -153,9 +170,9 @@ class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Power
             "hp": self._hp,
             "nutritional_value": self._nutritional_value,
             "food_energy": self._food_energy,
-            "id": self._id,
+            "id": self.id,
             "sterile_period": self._sterile_period,
-            "parents": self._parents
+            "parents": self.parents
         }
 
     def _unpack_info_from_dict(self, info: Dict):
@@ -170,9 +187,9 @@ class Animal(Movable, Dieable, Aging, Eatable, GenderReproduction, Hunger, Power
         self._hp = info["hp"]
         self._nutritional_value = info["nutritional_value"]
         self._food_energy = info["food_energy"]
-        self._id = info["id"]
+        self._set_id(info["id"])
         self._sterile_period = info["sterile_period"]
-        self._parents = info["parents"]
+        self._set_parents(info["parents"])
 
     def stats(self) -> str:
         """Returns string with information about creature conditions
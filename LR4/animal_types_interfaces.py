@@ -4,10 +4,11 @@ from animal import Animal
 from plant import Plant
 from typing import List
 from forest import Hectare
-import random
+import random_streams
 
 
 class Herbivore(Animal, ABC):
+    __slots__ = ()
 
     #_required_nutritional_value: int
 
@@ -18,32 +19,32 @@ class Herbivore(Animal, ABC):
         """
         if isinstance(eatable, Plant):
             if eatable.power() <= self.power():
-                self._food_energy += eatable.be_eaten(self._required_nutritional_value)
+                eaten_value = eatable.be_eaten(self._required_nutritional_value)
+                if eaten_value:
+                    self._food_energy += eaten_value
+                    self._mark_changed()
                 return True
         return False
 
-    def _count_amount_of_eatable_plants(self, creations: List) -> int:
-        """Count amount of eatable plants in creations"""
-        amount_of_plants = 0
-        for creation in creations:
-            if isinstance(creation, Plant) and creation.power() <= self.power():
-                amount_of_plants += 1
-        return amount_of_plants
+    def _eatable_plants(self, hectare: Hectare) -> List[Plant]:
+        """Returns plants of hectare that can be eaten by creature"""
+        power = self.power()
+        return [plant for plant in hectare.creatures_of(Plant) if plant.power() <= power]
 
     def search_for_food(self, hectare: Hectare) -> None:
         """Determines amount of plants to eat and eat it"""
         if not isinstance(hectare, Hectare):
             raise TypeError
         if not self.is_dead():
-            if self._count_amount_of_eatable_plants(hectare.creations) > 0:
-                amount_of_eaten = random.randint(1, self._count_amount_of_eatable_plants(hectare.creations))
-                eaten_counter = 0
-                while eaten_counter < amount_of_eaten:
-                    if Herbivore._eat(self, random.choice(hectare.creations)):
-                        eaten_counter += 1
+            eatable_plants = self._eatable_plants(hectare)
+            if eatable_plants:
+                amount_of_eaten = random_streams.randint(1, len(eatable_plants))
+                for _ in range(amount_of_eaten):
+                    Herbivore._eat(self, random_streams.choice(eatable_plants))
 
 
 class Predator(Animal, ABC):
+    __slots__ = ()
 
     def _eat(self, eatable: Animal) -> bool:
         """Eat some animal"""
@@ -51,35 +52,37 @@ class Predator(Animal, ABC):
             if eatable.power() <= self.power():
                 if not eatable.protect(self):
                     eatable.die()
-                    self._food_energy += eatable.be_eaten(eatable._nutritional_value)
+                    eaten_value = eatable.be_eaten(eatable._nutritional_value)
+                    if eaten_value:
+                        self._food_energy += eaten_value
+                        self._mark_changed()
                 return True
         return False
 
-    def _count_amount_of_eatable(self, creations: List) -> int:
-        """Counts amount of eatable animals in creations"""
-        amount_of_eatable = 0
-        for entity in creations:
-            if isinstance(entity, Animal) and entity.power() <= self.power() and not isinstance(entity, type(self)):
-                amount_of_eatable += 1
-        return amount_of_eatable
+    def _eatable_animals(self, hectare: Hectare) -> List[Animal]:
+        """Returns animals of hectare that can be eaten by creature (animals of other kinds)"""
+        power = self.power()
+        return [animal for animal in hectare.creatures_of(Animal)
+                if not isinstance(animal, type(self)) and animal.power() <= power]
 
     def search_for_food(self, hectare: Hectare) -> None:
         """Find eatable animal in hectare and eat it"""
         if not isinstance(hectare, Hectare):
             raise TypeError
         if not self.is_dead():
-            if self._count_amount_of_eatable(hectare.creations) > 0:
-                while not Predator._eat(self, random.choice(hectare.creations)):
-                    continue
+            eatable_animals = self._eatable_animals(hectare)
+            if eatable_animals:
+                Predator._eat(self, random_streams.choice(eatable_animals))
 
 
 class Omnivorous(Predator, Herbivore, ABC):
+    __slots__ = ()
 
     def search_for_food(self, hectare: Hectare) -> None:
         """Determines type of, and search for it and eat it"""
         if not isinstance(hectare, Hectare):
             raise TypeError
-        food_choice = random.randint(1, 4)
+        food_choice = random_streams.randint(1, 4)
         if food_choice == 1:
             Predator.search_for_food(self, hectare)
         else:
@@ -0,0 +1,266 @@
+#Author Vodohleb04
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import configs
+from columnar_period import columnar_period_available
+from console_renderer import ConsoleViewport
+from ecosystem import EcoSystem
+from tiled_cycle import CyclePlan
+
+
+DEFAULT_SIZES = ((5, 5), (10, 10), (20, 20))
+DEFAULT_POPULATIONS = (1, 4)  # Multipliers of amounts of creatures of BASE_ECOSYSTEM_PARAMETERS
+DEFAULT_CYCLES = 4
+DEFAULT_WORKERS = (1, 2, 4)  # Amounts of worker processes of tiled cycle (scaling of cycle with workers)
+DEFAULT_COLUMNAR_CREATURES = 10 ** 6  # Amount of creatures of world of columnar case (0 - case is skipped)
+COLUMNAR_SIZE = (100, 100)
+DEFAULT_SEED = 2023
+DEFAULT_REPEATS = 3
+FIND_SAMPLE_SIZE = 200
+CYCLE_PHASES = ("_provoke_on_nutrition", "_provoke_animals_on_reproduction",
+                "_provoke_on_non_gender_reproduction_reproduction", "_provoke_on_move", "_period")
+
+
+def _world_parameters(size: Tuple[int, int], population: int) -> Dict:
+    """Returns parameters of world of benchmark
+
+    size - (vertical length, horizontal length) of forest
+    population - multiplier of amounts of creatures of BASE_ECOSYSTEM_PARAMETERS
+    """
+    parameters = dict(configs.BASE_ECOSYSTEM_PARAMETERS)
+    for key in parameters:
+        if key.endswith("_amount"):
+            parameters[key] *= population
+    parameters["forest_vertical_length"], parameters["forest_horizontal_length"] = size
+    return parameters
+
+
+def _new_world(size: Tuple[int, int], population: int, seed: int, cycle_workers=0) -> EcoSystem:
+    """Creates world of benchmark (same seed gives same world)"""
+    ecosystem = EcoSystem(seed=seed, **_world_parameters(size, population))
+    ecosystem.cycle_workers = cycle_workers
+    return ecosystem
+
+
+def _timed(function: Callable, *args) -> float:
+    """Returns time of function call in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def _summary(times: List[float]) -> Dict[str, float]:
+    """Returns statistics of times of operation"""
+    return {"mean": sum(times) / len(times), "min": min(times), "max": max(times), "runs": len(times)}
+
+
+def _measure_world(size: Tuple[int, int], population: int, cycles: int, seed: int,
+                   workers=DEFAULT_WORKERS) -> Tuple[Dict[str, List[float]], int]:
+    """Returns times of operations of ecosystem (one time per cycle) and amount of creatures after cycles
+
+    Phases of cycle are measured on one world, full cycles - on the other world with the same seed, cycles of tiled
+    cycle - on world with the same seed for every amount of workers (the first cycle sends tiles to workers, pull of
+    forest after cycles is measured once)
+    """
+    timings = {phase: [] for phase in CYCLE_PHASES}
+    ecosystem = _new_world(size, population, seed)
+    for _ in range(cycles):
+        plan = CyclePlan(ecosystem.forest, ecosystem.random_stream)
+        for phase in CYCLE_PHASES:
+            timings[phase].append(_timed(getattr(ecosystem, phase), plan))
+
+    for cycle_workers in workers:
+        ecosystem = _new_world(size, population, seed, cycle_workers)
+        timings[f"cycle_{cycle_workers}_workers"] = [_timed(ecosystem.cycle) for _ in range(cycles)]
+        timings[f"pull_forest_{cycle_workers}_workers"] = [_timed(lambda: ecosystem.forest)]
+        ecosystem.cycle_workers = 0  # Worker processes are stopped
+
+    ecosystem = _new_world(size, population, seed)
+    timings["cycle"] = [_timed(ecosystem.cycle) for _ in range(cycles)]
+    creatures_amount = ecosystem.count_creatures_amount()
+
+    timings["count_creatures_amount"] = [_timed(ecosystem.count_creatures_amount) for _ in range(cycles)]
+    ids = [creature.id for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+           for creature in hectare.creations]
+    sample = random.Random(seed).sample(ids, min(len(ids), FIND_SAMPLE_SIZE))
+    if sample:
+        timings["find_creature"] = [_timed(lambda: [ecosystem.find_creature(creature_id) for creature_id in sample])
+                                    / len(sample) for _ in range(cycles)]
+    timings["render_viewport"] = [_timed(ConsoleViewport().render, ecosystem, io.StringIO()) for _ in range(cycles)]
+
+    with tempfile.TemporaryDirectory() as saves_dir:
+        filename = os.path.join(saves_dir, "benchmark.json")
+        timings["save"] = [_timed(ecosystem.save, filename) for _ in range(cycles)]
+        timings["load"] = [_timed(EcoSystem.from_file, filename) for _ in range(cycles)]
+    return timings, creatures_amount
+
+
+def _period_plan(ecosystem: EcoSystem) -> CyclePlan:
+    """Returns plan of cycle of ecosystem whose period can be made without other phases (no offsprings are sown)"""
+    plan = CyclePlan(ecosystem.forest, ecosystem.random_stream)
+    plan.offsprings = [[] for hectare_line in ecosystem.forest.hectares for _ in hectare_line]
+    return plan
+
+
+def columnar_case(creatures: int, cycles: int, seed: int) -> Dict:
+    """Measures periods of world of about creatures creatures with columnar period and with ordinary period
+
+    Only periods are made (aging, deaths and regeneration of creatures, deadly worm every few periods), other phases
+    of cycle don't depend on columnar period. The first columnar period makes columns of species and isn't measured,
+    ordinary periods are measured on the same world after columnar ones
+    """
+    base_population = sum(amount for key, amount in configs.BASE_ECOSYSTEM_PARAMETERS.items()
+                          if key.endswith("_amount"))
+    population = -(-creatures // base_population)
+    ecosystem = _new_world(COLUMNAR_SIZE, population, seed)
+    creatures_amount = ecosystem.count_creatures_amount()
+    timings = {}
+    for columnar_period in (True, False):
+        ecosystem.columnar_period = columnar_period
+        if columnar_period:
+            ecosystem._period(_period_plan(ecosystem))
+        timings["columnar_period" if columnar_period else "period"] = \
+            [_timed(ecosystem._period, _period_plan(ecosystem)) for _ in range(cycles)]
+    return {"size": list(COLUMNAR_SIZE), "population": population, "seed": seed, "cycles": cycles,
+            "creatures": creatures_amount, "timings": {name: _summary(times) for name, times in timings.items()}}
+
+
+def benchmark_case(size: Tuple[int, int], population: int, cycles: int, seed: int, repeats: int,
+                   workers=DEFAULT_WORKERS) -> Dict:
+    """Measures times of operations of ecosystem for one world
+
+    size - (vertical length, horizontal length) of forest
+    population - multiplier of amounts of creatures of BASE_ECOSYSTEM_PARAMETERS
+    cycles - amount of measured cycles
+    seed - seed of world and of its cycles
+    repeats - amount of repeats of measurement (same seed gives the same work, the fastest repeat of every cycle is
+        taken to reduce noise)
+    workers - amounts of worker processes of measured tiled cycles
+    """
+    timings, creatures_amount = _measure_world(size, population, cycles, seed, workers)
+    for _ in range(repeats - 1):
+        repeated_timings, _ = _measure_world(size, population, cycles, seed, workers)
+        for name, times in repeated_timings.items():
+            timings[name] = [min(time_pair) for time_pair in zip(timings[name], times)]
+    return {"size": list(size), "population": population, "seed": seed, "cycles": cycles,
+            "creatures": creatures_amount, "timings": {name: _summary(times) for name, times in timings.items()}}
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, populations=DEFAULT_POPULATIONS, cycles=DEFAULT_CYCLES,
+                  seed=DEFAULT_SEED, repeats=DEFAULT_REPEATS, workers=DEFAULT_WORKERS,
+                  columnar_creatures=DEFAULT_COLUMNAR_CREATURES) -> Dict:
+    """Measures times of operations of ecosystem over grid of sizes of forest and populations and periods of big
+    world with columnar period (if numpy is installed)
+
+    Returns results that can be saved to json and compared with results of other revision (amount of processors is
+    saved to compare scaling of tiled cycle with workers)
+    """
+    cases = []
+    for size in sizes:
+        for population in populations:
+            cases.append(benchmark_case(tuple(size), population, cycles, seed, repeats, workers))
+    if columnar_creatures and columnar_period_available():
+        cases.append(columnar_case(columnar_creatures, cycles, seed))
+    return {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+            "cases": cases}
+
+
+def _case_key(case: Dict) -> Tuple:
+    """Returns key of benchmark case (cases with the same key are compared)"""
+    return tuple(case["size"]), case["population"], case["seed"], case["cycles"]
+
+
+def compare(old_results: Dict, new_results: Dict, threshold: float) -> Tuple[str, bool]:
+    """Compares minimal times of operations of two benchmark results
+
+    threshold - allowed slowdown in percents
+    Returns table of comparison and True if some operation became slower than threshold allows
+    """
+    old_cases = {_case_key(case): case for case in old_results["cases"]}
+    lines = [f"{'size':<10}{'pop':>4} {'operation':<50}{'old, ms':>12}{'new, ms':>12}{'change':>10}"]
+    regression = False
+    for new_case in new_results["cases"]:
+        old_case = old_cases.get(_case_key(new_case))
+        if old_case is None:
+            continue
+        size = "x".join(str(length) for length in new_case["size"])
+        for operation, new_timing in new_case["timings"].items():
+            old_timing = old_case["timings"].get(operation)
+            if old_timing is None:
+                continue
+            old_min, new_min = old_timing["min"], new_timing["min"]
+            change = (new_min - old_min) / old_min * 100 if old_min else 0.0
+            mark = ""
+            if change > threshold:
+                regression = True
+                mark = " !"
+            lines.append(f"{size:<10}{new_case['population']:>4} {operation:<50}{old_min * 1000:>12.3f}"
+                         f"{new_min * 1000:>12.3f}{change:>+9.1f}%{mark}")
+    return "\n".join(lines), regression
+
+
+def _parse_size(size: str) -> Tuple[int, int]:
+    """Parses size of forest from string VxH"""
+    vertical_length, horizontal_length = size.lower().split("x")
+    return int(vertical_length), int(horizontal_length)
+
+
+def main(*args):
+    """Runs benchmark from command line
+
+    Possible args:
+        --output | -o - .json file to save results to
+        --sizes - sizes of forest (VxH)
+        --populations - multipliers of amounts of creatures of BASE_ECOSYSTEM_PARAMETERS
+        --cycles | -k - amount of measured cycles
+        --seed | -s - seed of worlds
+        --repeats | -r - amount of repeats of measurement of every world
+        --workers | -w - amounts of worker processes of measured tiled cycles
+        --columnar-creatures - amount of creatures of world of columnar case (0 - case is skipped)
+        --compare OLD NEW - compares two saved results (exit code 1 if some operation became slower)
+        --threshold - allowed slowdown in percents for --compare
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of Forest Simulator ecosystem")
+    parser.add_argument("--output", "-o", default=None)
+    parser.add_argument("--sizes", nargs="+", type=_parse_size, default=list(DEFAULT_SIZES))
+    parser.add_argument("--populations", nargs="+", type=int, default=list(DEFAULT_POPULATIONS))
+    parser.add_argument("--cycles", "-k", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--seed", "-s", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeats", "-r", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--workers", "-w", nargs="+", type=int, default=list(DEFAULT_WORKERS))
+    parser.add_argument("--columnar-creatures", type=int, default=DEFAULT_COLUMNAR_CREATURES)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), default=None)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    arguments = parser.parse_args(args[1:])
+
+    if arguments.compare:
+        old_filename, new_filename = arguments.compare
+        with open(old_filename, "r") as old_file, open(new_filename, "r") as new_file:
+            table, regression = compare(json.load(old_file), json.load(new_file), arguments.threshold)
+        print(table)
+        return 1 if regression else 0
+
+    results = run_benchmark(arguments.sizes, arguments.populations, arguments.cycles, arguments.seed,
+                            arguments.repeats, arguments.workers, arguments.columnar_creatures)
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(results, output_file, indent="\t")
+    for case in results["cases"]:
+        size = "x".join(str(length) for length in case["size"])
+        print(f"{size} population x{case['population']}: {case['creatures']} creatures")
+        for operation, timing in case["timings"].items():
+            print(f"    {operation:<50}{timing['mean'] * 1000:>12.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv))
@@ -0,0 +1,426 @@
+#Author Vodohleb04
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import repeat
+from operator import attrgetter, or_
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import configs
+import creature_ids
+import species_registry
+from animal import Animal
+from configs import Genders
+
+
+SNAPSHOT_MAGIC = b"FSNAP\x00"
+SNAPSHOT_FORMAT_VERSION = 2
+_HEADER_LENGTH = struct.Struct("<HI")  # Version of format and length of json header after magic
+_ALIGNMENT = 8
+
+# Species of snapshots of version 1 (newer snapshots keep english names of their species in header)
+VERSION_1_SPECIES = ("blueberry", "hazel", "maple", "boar", "elk", "wolf", "bear")
+GENDERS = list(Genders)
+
+# Columns of every creature (name, typecode of array)
+CREATURE_COLUMNS = (("species", "B"), ("flags", "B"), ("row", "I"), ("column", "I"), ("age", "i"), ("id", "q"),
+                    ("hp", "d"), ("nutritional_value", "d"), ("power_coefficient", "d"))
+# Columns of animals only (row number i of these columns - i-th animal of creature columns)
+ANIMAL_COLUMNS = (("gender", "B"), ("damage", "d"), ("food_energy", "d"), ("sterile_period", "i"), ("mother", "q"),
+                  ("father", "q"))
+_ANIMAL_COLUMN_NAMES = {name for name, _ in ANIMAL_COLUMNS}
+FLOAT_FIELDS = ("hp", "nutritional_value", "power_coefficient", "damage", "food_energy")
+_CREATURE_FLOAT_FIELDS = FLOAT_FIELDS[:3]
+_ANIMAL_FLOAT_FIELDS = FLOAT_FIELDS[3:]
+
+DEAD_FLAG = 1
+# Flag of float field that was int in creature (saved to restore type of value)
+INT_FLAGS = {field: 1 << (number + 1) for number, field in enumerate(FLOAT_FIELDS)}
+
+
+def _id_prefix(kind: type, gender: Optional[Genders]) -> str:
+    """Returns part of id of creature of kind before its number (gender - gender of animal, None for plant)"""
+    if gender is None:
+        return kind._id_prefix
+    return kind._id_prefix_of(gender)
+
+
+class _StringTable:
+
+    def __init__(self, strings: Optional[List[str]] = None):
+        """Creates table of ids that can't be packed as numbers (ids are saved as negative numbers -1 - index)"""
+        self.strings = strings if strings is not None else [configs.CREATOR]
+        self._indexes = {string: index for index, string in enumerate(self.strings)}
+
+    def encode(self, name: str, prefix: str) -> int:
+        """Returns number of id (if id is prefix with number) or negative index of id in table"""
+        number = name[len(prefix):]
+        if name.startswith(prefix) and number.isdigit() and str(int(number)) == number:
+            return int(number)
+        index = self._indexes.get(name)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(name)
+            self._indexes[name] = index
+        return -1 - index
+
+    def encode_number(self, number: int, prefix: str) -> int:
+        """Returns code of number of creature (negative numbers of creator and of names are put into table)"""
+        if number >= 0:
+            return number
+        return self.encode(creature_ids.format_id(prefix, number), prefix)
+
+    def decode(self, code: int, prefix: str) -> str:
+        """Returns id from its number or from its negative index in table"""
+        if code >= 0:
+            return f"{prefix}{code}"
+        return self.strings[-1 - code]
+
+    def decode_number(self, code: int, prefix: str) -> int:
+        """Returns number of creature from its code (reverse of encode_number)"""
+        if code >= 0:
+            return code
+        return creature_ids.parse_id(self.strings[-1 - code], prefix)
+
+
+class SnapshotColumns:
+
+    def __init__(self):
+        """Creates empty packed columns of creatures
+
+        columns - name of column -> array of column
+        strings - table of ids that are not prefix with number
+        species - english names of species (values of species column are indexes in it)
+        Columns don't refer to creatures, so they can be written to file in other thread while world keeps changing
+        """
+        self.columns = {name: array(typecode) for name, typecode in CREATURE_COLUMNS + ANIMAL_COLUMNS}
+        self.strings = _StringTable()
+        self.species = [entry.english_name for entry in species_registry.entries()]
+
+    def __len__(self) -> int:
+        """Returns amount of creatures"""
+        return len(self.columns["species"])
+
+
+def _int_flags(values: List, field: str) -> List[int]:
+    """Returns int flag of field for every value that is int"""
+    flag = INT_FLAGS[field]
+    return [flag if type(value) is int else 0 for value in values]
+
+
+def pack_forest(forest) -> SnapshotColumns:
+    """Packs creatures of forest into columns (hectare by hectare, as in streaming save)
+
+    Columns are made from numbers and attributes of creatures, ids are not formatted (only ids from table of names)
+    raise TypeError if creature is not of registered species
+    """
+    packed = SnapshotColumns()
+    columns = packed.columns
+    creatures = []
+    for i, hectare_line in enumerate(forest.hectares):
+        for j, hectare in enumerate(hectare_line):
+            amount = len(hectare.creations)
+            if amount:
+                creatures.extend(hectare.creations)
+                columns["row"].extend(repeat(i, amount))
+                columns["column"].extend(repeat(j, amount))
+    kinds = list(map(type, creatures))
+    species_numbers = {kind: packed.species.index(species_registry.entry_of_kind(kind).english_name)
+                       for kind in set(kinds)}
+    columns["species"].extend(map(species_numbers.__getitem__, kinds))
+    columns["age"].extend(map(attrgetter("_age"), creatures))
+    flags = [DEAD_FLAG if hp <= 0 else 0 for hp in map(attrgetter("_hp"), creatures)]
+    for field in _CREATURE_FLOAT_FIELDS:
+        values = list(map(attrgetter(f"_{field}"), creatures))
+        columns[field].extend(values)
+        flags = list(map(or_, flags, _int_flags(values, field)))
+    strings = packed.strings
+    ids = list(map(attrgetter("_number"), creatures))
+    if min(ids, default=0) < 0:  # Ids from table of names
+        ids = [strings.encode_number(code, creature._own_id_prefix()) if code < 0 else code
+               for code, creature in zip(ids, creatures)]
+    columns["id"].extend(ids)
+
+    animal_numbers = [number for number, kind in enumerate(kinds) if issubclass(kind, Animal)]
+    animals = [creatures[number] for number in animal_numbers]
+    animal_kinds = [kinds[number] for number in animal_numbers]
+    genders = list(map(attrgetter("_gender"), animals))
+    gender_numbers = {gender: number for number, gender in enumerate(GENDERS)}
+    columns["gender"].extend(map(gender_numbers.__getitem__, genders))
+    columns["sterile_period"].extend(map(attrgetter("_sterile_period"), animals))
+    for field in _ANIMAL_FLOAT_FIELDS:
+        values = list(map(attrgetter(f"_{field}"), animals))
+        columns[field].extend(values)
+        for number, flag in zip(animal_numbers, _int_flags(values, field)):
+            flags[number] |= flag
+    for column, parent, gender in (("mother", "_mother", Genders.FEMALE), ("father", "_father", Genders.MALE)):
+        parents = list(map(attrgetter(parent), animals))
+        if min(parents, default=0) < 0:  # Creator or ids from table of names
+            parents = [strings.encode_number(code, _id_prefix(kind, gender)) if code < 0 else code
+                       for code, kind in zip(parents, animal_kinds)]
+        columns[column].extend(parents)
+    columns["flags"].extend(flags)
+    return packed
+
+
+def pack_records(records: Iterable[Dict]) -> SnapshotColumns:
+    """Packs dicts of creatures with their positions (as in streaming save) into columns
+
+    raise ValueError if type of creature is unknown
+    """
+    packed = SnapshotColumns()
+    columns = packed.columns
+    strings = packed.strings
+    for record in records:
+        try:
+            kind = species_registry.entry_by_name(record["type"]).kind
+        except KeyError:
+            raise ValueError(f"Unknown type of creature: {record['type']}")
+        is_animal = issubclass(kind, Animal)
+        gender = Genders(record["gender"]) if is_animal else None
+        creature_id = record["id"]
+        flags = 0
+        if creature_id.endswith(configs.DEAD_ID_SUFFIX):
+            flags |= DEAD_FLAG
+            creature_id = creature_id[:-len(configs.DEAD_ID_SUFFIX)]
+        for field in FLOAT_FIELDS:
+            if field in record and isinstance(record[field], int):
+                flags |= INT_FLAGS[field]
+        columns["species"].append(packed.species.index(record["type"]))
+        columns["flags"].append(flags)
+        columns["row"].append(record["position"][0])
+        columns["column"].append(record["position"][1])
+        columns["age"].append(record["age"])
+        columns["id"].append(strings.encode(creature_id, _id_prefix(kind, gender)))
+        columns["hp"].append(record["hp"])
+        columns["nutritional_value"].append(record["nutritional_value"])
+        columns["power_coefficient"].append(record["power_coefficient"])
+        if is_animal:
+            mother_name, father_name = record["parents"]
+            columns["gender"].append(GENDERS.index(gender))
+            columns["damage"].append(record["damage"])
+            columns["food_energy"].append(record["food_energy"])
+            columns["sterile_period"].append(record["sterile_period"])
+            columns["mother"].append(strings.encode(mother_name, _id_prefix(kind, Genders.FEMALE)))
+            columns["father"].append(strings.encode(father_name, _id_prefix(kind, Genders.MALE)))
+    return packed
+
+
+def is_binary_snapshot(filename: str) -> bool:
+    """Returns True if file starts with magic of binary snapshot"""
+    with open(filename, "rb") as snapshot_file:
+        return snapshot_file.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+
+def _pad(length: int) -> int:
+    """Returns amount of bytes to add to length to align it"""
+    return -length % _ALIGNMENT
+
+
+def write_binary_snapshot(filename: str, ecosystem_info: Dict, id_counters: Dict, packed: SnapshotColumns,
+                          pedigree: Optional[Dict] = None) -> None:
+    """Writes binary snapshot: json header and then packed fixed-width columns of creatures
+
+    filename - file to save to (file is replaced only after the whole snapshot is written)
+    ecosystem_info - general parameters of ecosystem
+    id_counters - id counters of kinds of creatures
+    packed - columns of creatures (pack_forest or pack_records)
+    pedigree - packed pedigree of ecosystem (None - pedigree is not saved)
+    Ids and parents are saved as integer numbers, ids that are not prefix with number are saved to string table
+    """
+    columns = packed.columns
+    header = {"byteorder": sys.byteorder, "ecosystem": ecosystem_info, "id_counters": id_counters,
+              "creatures": len(columns["species"]), "animals": len(columns["gender"]), "species": packed.species,
+              "strings": packed.strings.strings, "columns": []}
+    if pedigree is not None:
+        header["pedigree"] = pedigree
+    # Offsets of columns depend on length of header, header is built again until its length is stable
+    header_bytes = b""
+    while True:
+        offset = len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size + len(header_bytes)
+        offset += _pad(offset)
+        header["columns"] = []
+        for name, typecode in CREATURE_COLUMNS + ANIMAL_COLUMNS:
+            header["columns"].append([name, typecode, offset])
+            size = len(columns[name]) * columns[name].itemsize
+            offset += size + _pad(size)
+        new_header_bytes = json.dumps(header).encode()
+        length_is_stable = len(new_header_bytes) == len(header_bytes)
+        header_bytes = new_header_bytes
+        if length_is_stable:
+            break
+
+    temporary_filename = f"{filename}.tmp"
+    with open(temporary_filename, "wb") as snapshot_file:
+        snapshot_file.write(SNAPSHOT_MAGIC + _HEADER_LENGTH.pack(SNAPSHOT_FORMAT_VERSION, len(header_bytes)))
+        snapshot_file.write(header_bytes)
+        snapshot_file.write(b"\x00" * _pad(snapshot_file.tell()))
+        for name, _, offset in header["columns"]:
+            columns[name].tofile(snapshot_file)
+            snapshot_file.write(b"\x00" * _pad(snapshot_file.tell()))
+    os.replace(temporary_filename, filename)
+
+
+class BinarySnapshotReader:
+
+    def __init__(self, filename: str):
+        """Opens binary snapshot, reads its header and maps its columns to memory
+
+        filename - file with binary snapshot
+        raise ValueError if file is not binary snapshot of known version
+        """
+        self._file = open(filename, "rb")
+        self._mmap = None
+        self._views = []
+        try:
+            prefix = self._file.read(len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size)
+            if len(prefix) != len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size or \
+                    not prefix.startswith(SNAPSHOT_MAGIC):
+                raise ValueError(f"{filename} is not binary snapshot of forest")
+            version, header_length = _HEADER_LENGTH.unpack(prefix[len(SNAPSHOT_MAGIC):])
+            if not 1 <= version <= SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"Unknown version of snapshot: {version}")
+            self._header = json.loads(self._file.read(header_length))
+            try:
+                self._kinds = [species_registry.entry_by_name(species).kind
+                               for species in self._header.get("species", VERSION_1_SPECIES)]
+            except KeyError as ex:
+                raise ValueError(f"Unknown type of creature: {ex.args[0]}")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._columns = {name: self._column(name, typecode, offset)
+                             for name, typecode, offset in self._header["columns"]}
+        except ValueError:
+            self.close()
+            raise
+
+    def _column(self, name: str, typecode: str, offset: int):
+        """Returns column of snapshot (view of mapped file, copy only if byte order of file is different)"""
+        if name in _ANIMAL_COLUMN_NAMES:
+            amount = self._header["animals"]
+        else:
+            amount = self._header["creatures"]
+        size = amount * array(typecode).itemsize
+        if offset + size > len(self._mmap):
+            raise ValueError(f"Snapshot is truncated: column {name} is out of file")
+        if self._header["byteorder"] != sys.byteorder:
+            column = array(typecode, self._mmap[offset:offset + size])
+            column.byteswap()
+            return column
+        view = memoryview(self._mmap)[offset:offset + size]
+        self._views.append(view)
+        column = view.cast(typecode)
+        self._views.append(column)
+        return column
+
+    @property
+    def ecosystem_info(self) -> Dict:
+        """Returns general parameters of ecosystem"""
+        return self._header["ecosystem"]
+
+    @property
+    def id_counters(self) -> Dict:
+        """Returns id counters of kinds of creatures"""
+        return self._header["id_counters"]
+
+    @property
+    def pedigree(self) -> Optional[Dict]:
+        """Returns packed pedigree of ecosystem (None if snapshot has no pedigree)"""
+        return self._header.get("pedigree")
+
+    def _column_values(self, name: str, int_field: Optional[str] = None, flags: Optional[List[int]] = None) -> List:
+        """Returns values of column as list (values of float field that were ints are turned into ints again)
+
+        int_field - float field of column
+        flags - flags of rows of column
+        """
+        values = self._columns[name].tolist()
+        if int_field is not None:
+            int_flag = INT_FLAGS[int_field]
+            values = [int(value) if flag & int_flag else value for value, flag in zip(values, flags)]
+        return values
+
+    def records(self) -> Iterator[Dict]:
+        """Returns records of creatures one by one (as in streaming save), columns are read from mapped file"""
+        for position, creatures in self.hectare_creatures():
+            for creature in creatures:
+                record = creature.get_dict_of_info()
+                record["type"] = species_registry.entry_of(creature).english_name
+                record["position"] = position
+                yield record
+
+    def hectare_creatures(self) -> Iterator[Tuple[Tuple[int, int], List]]:
+        """Creates creatures from columns, returns (position of hectare, creatures of hectare) for every run of
+        neighbour creatures of one hectare (in order of snapshot)
+
+        Creatures are made of numbers and values of columns, ids are not parsed (only ids from table of names),
+        id counters of kinds are not changed
+        """
+        strings = _StringTable(self._header["strings"])
+        flags = self._column_values("flags")
+        species = self._column_values("species")
+        rows = self._column_values("row")
+        columns = self._column_values("column")
+        ages = self._column_values("age")
+        ids = self._column_values("id")
+        hps, nutritional_values, power_coefficients = (self._column_values(field, field, flags)
+                                                       for field in _CREATURE_FLOAT_FIELDS)
+        animal_flags = [flags[number] for number, kind_number in enumerate(species)
+                        if issubclass(self._kinds[kind_number], Animal)]
+        damages, food_energies = (self._column_values(field, field, animal_flags) for field in _ANIMAL_FLOAT_FIELDS)
+        genders = [GENDERS[gender] for gender in self._column_values("gender")]
+        sterile_periods = self._column_values("sterile_period")
+        mothers = self._column_values("mother")
+        fathers = self._column_values("father")
+
+        animal_number = 0
+        position = None
+        creatures = []
+        for number, kind_number in enumerate(species):
+            kind = self._kinds[kind_number]
+            creature = kind.__new__(kind)
+            if issubclass(kind, Animal):
+                gender = genders[animal_number]
+                creature._gender = gender
+                creature._damage = damages[animal_number]
+                creature._food_energy = food_energies[animal_number]
+                creature._sterile_period = sterile_periods[animal_number]
+                creature._mother = strings.decode_number(mothers[animal_number], _id_prefix(kind, Genders.FEMALE))
+                creature._father = strings.decode_number(fathers[animal_number], _id_prefix(kind, Genders.MALE))
+                animal_number += 1
+            else:
+                gender = None
+            code = ids[number]
+            creature._number = code if code >= 0 else strings.decode_number(code, _id_prefix(kind, gender))
+            creature._age = ages[number]
+            creature._hp = hps[number]
+            creature._nutritional_value = nutritional_values[number]
+            creature._power_coefficient = power_coefficients[number]
+            creature_position = (rows[number], columns[number])
+            if creature_position != position:
+                if creatures:
+                    yield position, creatures
+                position = creature_position
+                creatures = []
+            creatures.append(creature)
+        if creatures:
+            yield position, creatures
+
+    def close(self) -> None:
+        """Releases columns and closes mapped file"""
+        for view in reversed(self._views):  # Casts are released before views they are made from
+            view.release()
+        self._views = []
+        self._columns = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -3,19 +3,17 @@ import configs
 from plant import Plant
 import configs
 from typing import List
-import random
+import power_tables
+import species_registry
+import random_streams
 
 
+@species_registry.species(configs.EnglishCreaturesNames.BLUEBERRY.value,
+                          configs.RussianCreaturesNames.BLUEBERRY.value)
 class Blueberry(Plant):
+    __slots__ = ()
 
-    _life_median = configs.LifeMedian.BLUEBERRY_LM.value
-    _max_hp = configs.MaxHP.BLUEBERRY_MHP.value
-    _offspring_dispersion = configs.PlantOffspringDispersion.BLUEBERRY_OD.value
-    _offspring_nutritional_value = configs.NutritionalValue.BLUEBERRY_OFFSPRING_NV.value
-    _hp_reduction = configs.PlantHPReduction.BLUEBERRY_HPR.value
-    _shrub_reduction = configs.PlantShrubReduction.BLUEBERRY_SR.value
-    _start_shrub_nutritional_value = configs.NutritionalValue.START_BLUEBERRY_SNV.value
-    _reproduction_age_interval = configs.ReproductionAgeInterval.BLUEBERRY_RAI.value
+    _id_prefix = configs.IdPrefix.BLUEBERRY_PREF.value
     _id_counter = 0
 
     @staticmethod
@@ -48,35 +46,37 @@ class Blueberry(Plant):
             if not info_d:
                 raise ValueError
             super()._unpack_info_from_dict(info_d)
-            Blueberry._id_counter += 1
             return
 
         self._age = 0
-        self._hp = configs.StartHP.BLUEBERRY_START_HP.value
+        self._hp = self._start_hp
         self._nutritional_value = self._start_shrub_nutritional_value
-        super()._make_power_coefficient(configs.PersonalPowerCoefficientParameters.BLUEBERRY_PPCP)
-        self._id = configs.IdPrefix.BLUEBERRY_PREF.value + str(self._id_counter)
+        super()._make_power_coefficient(self._personal_power_coefficient)
+        self._number = self._id_counter
         Blueberry._id_counter += 1
 
-    def power(self) -> float:
-        if self.is_dead():
-            return 0.0
-        if self.age <= self._life_median:
-            return configs.StartPower.BLUEBERRY_SP.value
-        else:
-            return 3/self.age
+    @classmethod
+    def _apply_profile(cls, profile) -> None:
+        """Builds table of power of blueberry (power is constant until life median, then it falls as 3/age)"""
+        cls._power_table = power_tables.PowerTable((profile.start_power,) * (profile.life_median + 1),
+                                                   lambda age: 3/age)
+
+    def _power_of_age(self, age: int) -> float:
+        """Returns power of blueberry of age (power of blueberry doesn't depend on personal power coefficient)"""
+        return self._power_table[age]
 
     def produce_eatable_offspring(self) -> None:
-        min_amount, max_amount = configs.PlantEatableOffspringPossibleAmount.BLUEBERRY_EOPA.value
-        for i in range(random.randint(min_amount, max_amount)):
+        min_amount, max_amount = self._eatable_offspring_amount
+        for i in range(random_streams.randint(min_amount, max_amount)):
             self._nutritional_value += self._offspring_nutritional_value
+        self._mark_changed()
 
     def reproduction(self) -> List:
-        min_numb, max_numb = configs.ChanceToProduceKids.BLUEBERRY_CTPK.value
-        chance_to_produce = random.randint(min_numb, max_numb)
+        min_numb, max_numb = self._chance_to_produce_kids
+        chance_to_produce = random_streams.randint(min_numb, max_numb)
         if self._can_produce_children() and chance_to_produce != 0:
-            min_amount, max_amount = configs.PossibleKidsAmount.BLUEBERRY_PKA.value
-            grown_amount = random.randint(min_amount, max_amount)
+            min_amount, max_amount = self._possible_kids_amount
+            grown_amount = random_streams.randint(min_amount, max_amount)
             return [Blueberry() for _ in range(grown_amount)]
         return []
 
@@ -86,7 +86,9 @@ class Blueberry(Plant):
             return self._nutritional_value
         else:
             self._nutritional_value -= nutritional_value
-            self.get_hearted(nutritional_value * configs.UnprotectedDamageMultiplier.BLUEBERRY_UDM.value)
+            if nutritional_value:
+                self._mark_changed()
+            self.get_hearted(nutritional_value * self._unprotected_damage_multiplier)
             return nutritional_value
 
     def stats(self) -> str:
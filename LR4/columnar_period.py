@@ -0,0 +1,204 @@
+#Author Vodohleb04
+from random_streams import RandomStream
+from collections import deque
+from itertools import repeat
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional
+
+from animal import Animal
+from plant import Plant
+from forest import Forest
+
+try:
+    import numpy
+except ImportError:  # Columnar period is optional, ecosystem works without numpy
+    numpy = None
+
+
+def columnar_period_available() -> bool:
+    """Returns True if numpy is installed and columnar period can be used"""
+    return numpy is not None
+
+
+def _set_attribute(creatures: List, name: str, values: Iterable) -> None:
+    """Sets attribute name of every creature to its value (loop runs in map, without python code per creature)"""
+    deque(map(setattr, creatures, repeat(name), values), maxlen=0)
+
+
+class SpeciesColumns:
+
+    def __init__(self, species: type):
+        """Creates columnar state of creatures of one species (rows of creatures are set by update)
+
+        species - class of creatures (Blueberry, Wolf, ...)
+
+        Time-depended parameters of creatures are stored in typed numpy arrays (one array per parameter), so period
+        is counted for all creatures of species by batch operations. Columns are kept between periods: rows are
+        ordered by numbers of creatures, age of creatures that stay in forest is taken from column, health and
+        sterile period are read from creatures (other phases of cycle change them). Creatures stay views of this
+        state: results are written back to them by write_back.
+        """
+        self._species = species
+        self._is_animal = issubclass(species, Animal)
+        self._creatures = []
+        self._numbers = numpy.zeros(0, dtype=numpy.int64)  # Numbers of creatures of forest of first rows
+        self.age = numpy.zeros(0, dtype=numpy.int64)
+        self.hp = numpy.zeros(0, dtype=numpy.float64)
+        self.sterile_period = numpy.zeros(0, dtype=numpy.int64) if self._is_animal else None
+        self._died = numpy.zeros(0, dtype=bool)
+        self._regenerated = numpy.zeros(0, dtype=bool)
+
+    def update(self, creatures_by_number: Optional[Dict[int, object]], other_creatures: List) -> None:
+        """Sets rows to creatures of species for next period
+
+        creatures_by_number - index number of creature -> creature of creatures of species in forest (None - numbers
+            of creatures are not unique, rows are made of other_creatures only and age isn't kept)
+        other_creatures - creatures of species that are not in index (offsprings that aren't placed into forest yet)
+        """
+        if creatures_by_number is None:
+            numbers = numpy.zeros(0, dtype=numpy.int64)
+            indexed = []
+        else:
+            numbers = numpy.fromiter(creatures_by_number, dtype=numpy.int64, count=len(creatures_by_number))
+            numbers.sort()
+            indexed = list(map(creatures_by_number.__getitem__, numbers.tolist()))
+        rows = numpy.searchsorted(self._numbers, numbers)
+        kept = rows < len(self._numbers)
+        kept[kept] = self._numbers[rows[kept]] == numbers[kept]
+        age = numpy.empty(len(indexed) + len(other_creatures), dtype=numpy.int64)
+        age[:len(indexed)][kept] = self.age[rows[kept]]
+        new_rows = numpy.flatnonzero(~kept).tolist()
+        age[new_rows] = numpy.fromiter(map(attrgetter("_age"), map(indexed.__getitem__, new_rows)),
+                                       dtype=numpy.int64, count=len(new_rows))
+        age[len(indexed):] = numpy.fromiter(map(attrgetter("_age"), other_creatures), dtype=numpy.int64,
+                                            count=len(other_creatures))
+        self._creatures = indexed + other_creatures
+        self._numbers = numbers
+        self.age = age
+        amount = len(self._creatures)
+        self.hp = numpy.fromiter(map(attrgetter("_hp"), self._creatures), dtype=numpy.float64, count=amount)
+        if self._is_animal:
+            self.sterile_period = numpy.fromiter(map(attrgetter("_sterile_period"), self._creatures),
+                                                 dtype=numpy.int64, count=amount)
+        self._died = numpy.zeros(amount, dtype=bool)
+        self._regenerated = numpy.zeros(amount, dtype=bool)
+
+    def alive(self):
+        """Returns mask of alive creatures"""
+        return self.hp > 0
+
+    def live_time_cycle(self, generator) -> None:
+        """Makes time cycle activities of all creatures of species (same rules as Animal/Plant.live_time_cycle)
+
+        generator - numpy random generator
+        """
+        life_median = self._species._life_median
+        self.age += 1
+        if self._is_animal:
+            self.sterile_period -= 1
+        alive = self.alive()
+
+        old = self.age > life_median
+        old_age_chance = numpy.zeros(len(self.age), dtype=numpy.int64)
+        if old.any():
+            old_age_chance[old] = generator.integers(0, self.age[old] - life_median + 1)
+        died_of_age = old & (old_age_chance != 0)
+
+        unexpected_death = generator.integers(0, 101, size=len(self.age)) == 0
+        died_unexpectedly = ~died_of_age & unexpected_death
+
+        self._died = alive & (died_of_age | died_unexpectedly)
+        if not self._is_animal:
+            self._regenerate(alive & ~self._died)
+
+    def _regenerate(self, alive) -> None:
+        """Regenerates health points of alive plants (same rules as Plant.regenerate)"""
+        regenerated = alive & (self.hp < self._species._max_hp)
+        self.hp[regenerated] = numpy.minimum(self.hp[regenerated] + self._species._hp_reduction,
+                                             self._species._max_hp)
+        self._regenerated = regenerated
+
+    def _write_back_regeneration(self, mark_changed: bool) -> None:
+        """Regenerates plants that regenerated in columns and didn't die (health of plant is counted from its own
+        value as by Plant.regenerate, so it keeps its type)"""
+        regenerated = list(map(self._creatures.__getitem__,
+                               numpy.flatnonzero(self._regenerated & ~self._died).tolist()))
+        hp_reduction, max_hp = self._species._hp_reduction, self._species._max_hp
+        shrub_reduction = self._species._shrub_reduction
+        for creature in regenerated:
+            hp = creature._hp + hp_reduction
+            creature._hp = hp if hp <= max_hp else max_hp
+            creature._nutritional_value += shrub_reduction
+        if mark_changed:
+            for creature in regenerated:
+                creature._mark_changed()
+
+    def write_back(self, mark_changed=True) -> None:
+        """Writes columnar state to creatures, kills creatures that died during the period (dead creatures are moved to
+        dead counters of their hectares by one batch per hectare)
+
+        mark_changed - True if regenerated creatures are marked as changed (changes of forest are tracked), dead
+            creatures are marked by their hectares anyway
+        """
+        _set_attribute(self._creatures, "_age", self.age.tolist())
+        if self._is_animal:
+            _set_attribute(self._creatures, "_sterile_period", self.sterile_period.tolist())
+        else:
+            self._write_back_regeneration(mark_changed)
+        died = list(map(self._creatures.__getitem__, numpy.flatnonzero(self._died).tolist()))
+        _set_attribute(died, "_hp", repeat(0, len(died)))
+        died_by_hectare = {}
+        for creature in died:
+            died_by_hectare.setdefault(creature._hectare, []).append(creature)
+        died_by_hectare.pop(None, None)  # Offsprings are not located in forest yet
+        for hectare, creatures in died_by_hectare.items():
+            hectare.mark_dead_creatures(creatures)
+
+
+def group_by_species(creatures) -> Dict[type, List]:
+    """Groups creatures by their class"""
+    groups = {}
+    for creature in creatures:
+        groups.setdefault(type(creature), []).append(creature)
+    return groups
+
+
+class ColumnarPeriod:
+
+    def __init__(self):
+        """Creates columnar state of creatures of ecosystem
+
+        Columns of every species are kept between periods, so they must be dropped if creatures age in other way
+        (ordinary or tiled period)
+        """
+        self._columns: Dict[type, SpeciesColumns] = {}
+
+    def run(self, forest: Forest, offsprings: List, stream: RandomStream) -> None:
+        """Makes time cycle activities of creatures of forest and of offsprings by batch operations over columnar
+        state of every species
+
+        forest - forest of ecosystem
+        offsprings - creatures that aren't placed into forest yet
+        stream - random stream of ecosystem (numpy generator of period is seeded from it)
+        raise RuntimeError if numpy is not installed
+        """
+        if numpy is None:
+            raise RuntimeError("Columnar period requires numpy")
+        generator = stream.numpy_generator()
+        offsprings_by_species = group_by_species(offsprings)
+        species = set(forest.population()) | set(offsprings_by_species)
+        for kind in sorted(species, key=attrgetter("__module__", "__qualname__")):
+            if not issubclass(kind, (Animal, Plant)):
+                continue
+            columns = self._columns.get(kind)
+            if columns is None:
+                columns = self._columns[kind] = SpeciesColumns(kind)
+            creatures_by_number = forest.creatures_by_number(kind)
+            other_creatures = offsprings_by_species.get(kind, [])
+            if creatures_by_number is None:
+                placed_creatures = [creature for hectare_line in forest.hectares for hectare in hectare_line
+                                    for creature in hectare.creatures_of(kind) if type(creature) is kind]
+                other_creatures = placed_creatures + other_creatures
+            columns.update(creatures_by_number, other_creatures)
+            columns.live_time_cycle(generator)
+            columns.write_back(forest.changes_tracked)
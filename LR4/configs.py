@@ -3,12 +3,28 @@ import enum
 
 CREATOR = "Vodohleb04"
 
+DEAD_ID_SUFFIX = "_dead"  # Added to id of creature after its death
+
+BINARY_SNAPSHOT_EXTENSION = ".fsnap"  # Save to this file is binary snapshot with columns of creatures
+SAVE_FILE_EXTENSIONS = (".json", ".ndjson", BINARY_SNAPSHOT_EXTENSION)  # .json and .ndjson saves are streaming
+SAVE_PROGRESS_STEP = 1000  # Progress of save in background is reported after every SAVE_PROGRESS_STEP creatures
+JOURNAL_COMPACTION_INTERVAL = 20  # Amount of journal entries of autosave after which journal is merged into save
+
 VERSION = "2.3"
 
 BASIC_SAVES_DIR_LINUX_PATH = "./gamedata/saves/"
 
 MESSAGE_DURATION = 3000  # milliseconds
 
+MAP_COLOR_LEVELS = 8  # Amount of shades of hectares of world map (the more creatures, the darker hectare)
+MAP_FULL_COLOR_AMOUNT = 40  # Amount of creatures of hectare that gets the darkest shade
+MAP_STRETCH_MAX_LENGTH = 20  # Map with more hectares in line is scrolled instead of being stretched to window
+MAP_SECTION_SIZE = 140  # pixels, width of column of scrolled map
+CREATURE_LIST_FETCH_BATCH = 100  # Amount of ids of creatures given to list of hectare at once (when it is scrolled)
+KINSHIP_GENERATIONS = 1  # Animals related within it don't produce children (1 - parents and siblings, 2 - cousins...)
+PEDIGREE_GENERATIONS = 8  # Generations of ancestors of creatures of forest kept by pedigree (>= KINSHIP_GENERATIONS)
+PEDIGREE_PRUNE_INTERVAL = 10  # Extinct lineages are removed from pedigree every PEDIGREE_PRUNE_INTERVAL periods
+
 HELP_MESSAGE = f""" Simulation version: {VERSION}
  Forest EcoSystem is a simulation. Forest - field with VxH size
  V - vertical size\tH - horizontal size
@@ -30,6 +46,15 @@ HELP_MESSAGE = f""" Simulation version: {VERSION}
     add creature | add : Adds new creature to the ecosystem
     remove creature | remove : Removes creature by its id from forest
     creature stats : Shows information about creature by its id
+    population : Shows amounts of alive and dead creatures of every kind
+    pedigree : Shows ancestors and descendants of animal by its id
+    relatives : Checks if two animals are relatives within amount of generations
+    view : Shows window of forest (only window is printed after other commands)
+    view all : Shows the whole forest
+    up | down | left | right : Moves window of forest by one page
+    go to | goto : Moves upper left corner of window to hectare
+    view size : Sets amount of lines and columns of hectares in window
+    counts : Switches window between ids of creatures and amounts of creatures in hectares (for large forests)
     wake deadly worm | deadly worm : Wakes deadly worm earlier than expected. Dead creatures will be removed after it.
     apocalypse : The four horsemen are here! Kills every mortal creature in ecosystem. Turns forest into great wasteland
         Apocalypse is likely to happen by chance 
@@ -325,6 +350,18 @@ class AutoPeriodParams(enum.Enum):
     TIME = 6  # seconds
 
 
+class TurboParams(enum.Enum):
+    MAX_FPS = 10  # Widgets are updated at most MAX_FPS times per second in turbo mode
+    SPEED_MEASURE_TIME = 1  # seconds, amount of periods per second is counted over this time
+    MAX_CYCLES_PER_FRAME = 1000  # Limit of periods between two updates of widgets
+
+
+class ConsoleViewParams(enum.Enum):
+    ROWS = 7  # Lines of hectares shown by console at once
+    COLUMNS = 7  # Columns of hectares shown by console at once
+    MAX_CREATURES_IN_CELL = 20  # Ids of creatures shown in one hectare, others are counted in the last line
+
+
 class ReproductionType(enum.Enum):
     NON_GENDER_REPRODUCTION = "non_gender_reproduction"
     GENDER_REPRODUCTION = "gender_reproduction"
@@ -370,6 +407,12 @@ class GuiMessages(enum.Enum):
                                    " существа такой судьбы..."
     WASTELAND_CREATURES_INFO = "Выжженная земля пустоши"
     WASTELAND_MAP_INFO = "Великая пустошь без существ"
+    HECTARE_MAP_INFO = "Существ в гектаре: {}"
+    HECTARE_TOOLTIP = "Гектар ({}, {}): существ - {}"
+    ALL_SPECIES_FILTER = "Все виды"
+    ALL_CREATURES_FILTER = "Живые и мёртвые"
+    ALIVE_CREATURES_FILTER = "Живые"
+    DEAD_CREATURES_FILTER = "Мёртвые"
     FILE_LOADED = "Мир {} загружен..."
     APOCALYPSE = "Семь печатей сняты..."
     MANUAL_DEADLY_WORM = "Вы пробудили смерточервя. Он ворчал, но выполнил свою работу..."
@@ -377,9 +420,14 @@ class GuiMessages(enum.Enum):
     FILE_NOT_CHOSEN = "Файл не был выбран"
     CREATURES_ADDED = "Добавление существ завершено..."
     PAUSE_MESSAGE = "Игра приостановлена"
+    TURBO_SPEED = "Турбо-режим: {:.1f} периодов в секунду (всего {})"
     NEW_WORLD_DIALOG_TITLE = "Создать новый мир: {}"
     NEW_WORLD_MESSAGE = "Создан новый мир: {}"
     FILE_SAVED = "Мир сохранён в файле {}"
+    FILE_SAVING = "Мир сохраняется в файл {}..."
+    FILE_LOADING = "Мир загружается из файла {}..."
+    FILE_IO_ERROR = "Ошибка работы с файлом {}: {}"
+    FILE_IO_BUSY = "Дождитесь окончания работы с файлом"
     LEAVE_WORLD = "Вы покинули мир"
 
 
@@ -0,0 +1,38 @@
+#Author Vodohleb04
+import pytest
+
+import configs
+from ecosystem import EcoSystem
+
+
+WORLD_PARAMETERS = {"forest_vertical_length": 5, "forest_horizontal_length": 6, "blueberry_amount": 40,
+                    "hazel_amount": 30, "maple_amount": 20, "boar_amount": 15, "elk_amount": 15, "wolf_amount": 10,
+                    "bear_amount": 8}
+
+
+def reset_id_counters() -> None:
+    """Starts id counters of every species from zero (counters are shared by every ecosystem of process)"""
+    EcoSystem._unpack_id_counters({f"{name.value}_id_counter": 0 for name in configs.EnglishCreaturesNames})
+
+
+def make_world(seed: int, cycles: int, cycle_workers=0) -> EcoSystem:
+    """Returns seeded world after cycles made by cycle_workers (id counters start from zero)"""
+    reset_id_counters()
+    ecosystem = EcoSystem(seed=seed, **WORLD_PARAMETERS)
+    ecosystem.cycle_workers = cycle_workers
+    for _ in range(cycles):
+        ecosystem.cycle()
+    return ecosystem
+
+
+@pytest.fixture(scope="class")
+def seeded_worlds(request) -> None:
+    """Gives test class WORLD_PARAMETERS and make_world - factory of seeded worlds"""
+    request.cls.world_parameters = WORLD_PARAMETERS
+    request.cls.make_world = staticmethod(make_world)
+
+
+@pytest.fixture
+def fresh_id_counters() -> None:
+    """Starts id counters of every species from zero before test"""
+    reset_id_counters()
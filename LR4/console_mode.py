@@ -1,11 +1,16 @@
 #Author Vodohleb04
 import enum
 import os
+import sys
 
 import configs
+from console_renderer import ConsoleViewport
 from ecosystem import EcoSystem
 
 
+_viewport = ConsoleViewport()  # Window of forest printed after commands
+
+
 class ExitCodes(enum.Enum):
     NORMAL_END_SAVED = 0
     NORMAL_END_NOT_SAVED = 1
@@ -156,9 +161,9 @@ def save_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> str:
     """
     if not ecosystem_exists_flag:
         raise TypeError("EcoSystem doesn't exists")
-    filename = input("Input the name of .json file to save your game):\t")
-    if not filename.endswith(".json"):
-        raise ValueError(f"{filename} is not .json file")
+    filename = input("Input the name of .json (.ndjson, .fsnap) file to save your game):\t")
+    if not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+        raise ValueError(f"{filename} is not .json, .ndjson or .fsnap file")
     ecosystem.save(filename)
     return filename
 
@@ -176,9 +181,9 @@ def load_command(ecosystem, ecosystem_exists_flag: bool) -> None:
             os.system("clear")
             print(ex.message)
             input("Press Enter to continue")
-    filename = input("Input the name of .json file with saved game to load your game):\t")
-    if not filename.endswith(".json"):
-        raise ValueError(f"{filename} is not .json file")
+    filename = input("Input the name of .json (.ndjson, .fsnap) file with saved game to load your game):\t")
+    if not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+        raise ValueError(f"{filename} is not .json, .ndjson or .fsnap file")
     ecosystem.load(filename)
 
 
@@ -192,7 +197,7 @@ def period_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
         raise TypeError("EcoSystem doesn't exists")
     ecosystem.cycle()
     os.system("clear")
-    print(ecosystem)
+    show_world(ecosystem)
 
 
 def add_creature_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
@@ -231,6 +236,36 @@ def creature_stats_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) ->
     print(ecosystem.console_creature_stats(lower_creature_id))
 
 
+def pedigree_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Prints to console ancestors and descendants of animal
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    creature_id = input("Input id of animal to show its pedigree:\t")
+    generations = input_ecosystem_parameter("amount of generations to show")
+    print(ecosystem.console_pedigree(creature_id.lower(), generations))
+
+
+def relatives_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Prints to console if two animals are relatives within amount of generations
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    first_id = input("Input id of the first animal:\t").lower()
+    second_id = input("Input id of the second animal:\t").lower()
+    generations = input_ecosystem_parameter("amount of generations")
+    if ecosystem.are_relatives(first_id, second_id, generations):
+        print(f"{first_id} and {second_id} are relatives within {generations} generations.")
+    else:
+        print(f"{first_id} and {second_id} are not relatives within {generations} generations.")
+
+
 def define_creature_type(ecosystem: EcoSystem, creature_type_command: str, ecosystem_exists_flag: bool) -> None:
     """Defines type of creature
 
@@ -268,6 +303,17 @@ def define_creature_type(ecosystem: EcoSystem, creature_type_command: str, ecosy
             wrong_command = True
 
 
+def population_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Prints to console amounts of alive and dead creatures of every kind
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    print(ecosystem.console_population_summary())
+
+
 def remove_creature_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
     """Removes creature from ecosystem
 
@@ -280,7 +326,7 @@ def remove_creature_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -
     lower_creature_id = creature_id.lower()
     ecosystem.remove_creature(lower_creature_id)
     os.system("clear")
-    print(ecosystem)
+    show_world(ecosystem)
     print(f"Creature \"{creature_id}\" was removed.")
 
 
@@ -294,7 +340,7 @@ def wake_deadly_worm_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool)
         raise TypeError("EcoSystem doesn't exists")
     ecosystem.provoke_deadly_worm()
     os.system("clear")
-    print(ecosystem)
+    show_world(ecosystem)
     print("Deadly worm did his job.")
 
 
@@ -308,10 +354,84 @@ def apocalypse_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> Non
         raise TypeError("EcoSystem doesn't exists")
     ecosystem.apocalypse()
     os.system("clear")
-    print(ecosystem)
+    show_world(ecosystem)
     print("Now You're become Death, the destroyer of worlds!")
 
 
+def show_world(ecosystem: EcoSystem) -> None:
+    """Prints window of forest to console (table is written to console line by line)
+
+    ecosystem - data controller part of program
+    """
+    _viewport.render(ecosystem, sys.stdout)
+
+
+def page_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool, vertical_pages: int,
+                 horizontal_pages: int) -> None:
+    """Moves window of forest by pages and prints it
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    vertical_pages - pages down (negative - up)
+    horizontal_pages - pages right (negative - left)
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    _viewport.page(vertical_pages, horizontal_pages,
+                   (ecosystem.forest.vertical_length, ecosystem.forest.horizontal_length))
+    os.system("clear")
+    show_world(ecosystem)
+
+
+def go_to_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Moves upper left corner of window of forest to hectare and prints window
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    str_with_hectare_number = input("Input hectare number in form: \'vertical number\', 'horizontal number'):\t")
+    hectare_number = [int(p) for p in str_with_hectare_number.replace(" ", "").split(",")]
+    if not len(hectare_number) == 2:
+        raise ValueError(f"Incorrect input {str_with_hectare_number}")
+    _viewport.go_to(hectare_number[0], hectare_number[1],
+                    (ecosystem.forest.vertical_length, ecosystem.forest.horizontal_length))
+    os.system("clear")
+    show_world(ecosystem)
+
+
+def view_size_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Sets size of window of forest and prints window
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    rows, columns = 0, 0
+    while rows < 1:
+        rows = input_ecosystem_parameter("amount of lines of hectares in window")
+    while columns < 1:
+        columns = input_ecosystem_parameter("amount of columns of hectares in window")
+    _viewport.resize(rows, columns)
+    os.system("clear")
+    show_world(ecosystem)
+
+
+def counts_command(ecosystem: EcoSystem, ecosystem_exists_flag: bool) -> None:
+    """Switches window of forest between ids of creatures and amounts of creatures of hectares and prints it
+
+    ecosystem - data controller part of program
+    ecosystem_exists_flag - true if ecosystem already exists and game is already started
+    """
+    if not ecosystem_exists_flag:
+        raise TypeError("EcoSystem doesn't exists")
+    _viewport.switch_counts()
+    os.system("clear")
+    show_world(ecosystem)
+
+
 def define_command(command: str, ecosystem=None | EcoSystem) -> EcoSystem:
     """Defines inputted command
 
@@ -329,7 +449,8 @@ def define_command(command: str, ecosystem=None | EcoSystem) -> EcoSystem:
         help_command()
     elif lower_command == "start new game" or lower_command == "start game" or lower_command == "start":
         ecosystem = start_command(ecosystem, ecosystem_exists_flag)
-        print(ecosystem)
+        _viewport.go_to(0, 0, (ecosystem.forest.vertical_length, ecosystem.forest.horizontal_length))
+        show_world(ecosystem)
     elif lower_command == "exit game" or lower_command == "exit":
         exit_command(ecosystem, ecosystem_exists_flag)
     elif lower_command == "save game" or lower_command == "save":
@@ -337,12 +458,19 @@ def define_command(command: str, ecosystem=None | EcoSystem) -> EcoSystem:
         print(f"Game saved to file \"{filename}\".")
     elif lower_command == "load game" or lower_command == "load":
         load_command(ecosystem, ecosystem_exists_flag)
+        _viewport.go_to(0, 0, (ecosystem.forest.vertical_length, ecosystem.forest.horizontal_length))
         os.system("clear")
-        print(ecosystem)
+        show_world(ecosystem)
     elif lower_command == "period":
         period_command(ecosystem, ecosystem_exists_flag)
     elif lower_command == "creature stats":
         creature_stats_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "population":
+        population_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "pedigree":
+        pedigree_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "relatives":
+        relatives_command(ecosystem, ecosystem_exists_flag)
     elif lower_command == "add creature" or lower_command == "add":
         add_creature_command(ecosystem, ecosystem_exists_flag)
     elif lower_command == "remove creature" or lower_command == "remove":
@@ -351,6 +479,28 @@ def define_command(command: str, ecosystem=None | EcoSystem) -> EcoSystem:
         wake_deadly_worm_command(ecosystem, ecosystem_exists_flag)
     elif lower_command == "apocalypse":
         apocalypse_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "view":
+        if not ecosystem_exists_flag:
+            raise TypeError("EcoSystem doesn't exists")
+        show_world(ecosystem)
+    elif lower_command == "view all":
+        if not ecosystem_exists_flag:
+            raise TypeError("EcoSystem doesn't exists")
+        ecosystem.render(sys.stdout)
+    elif lower_command == "up":
+        page_command(ecosystem, ecosystem_exists_flag, -1, 0)
+    elif lower_command == "down":
+        page_command(ecosystem, ecosystem_exists_flag, 1, 0)
+    elif lower_command == "left":
+        page_command(ecosystem, ecosystem_exists_flag, 0, -1)
+    elif lower_command == "right":
+        page_command(ecosystem, ecosystem_exists_flag, 0, 1)
+    elif lower_command == "go to" or lower_command == "goto":
+        go_to_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "view size":
+        view_size_command(ecosystem, ecosystem_exists_flag)
+    elif lower_command == "counts":
+        counts_command(ecosystem, ecosystem_exists_flag)
     else:
         print(f"Unknown command: {command}")
         raise GameEndedException(exit_code=ExitCodes.REMOVABLE_INPUT_ERROR)
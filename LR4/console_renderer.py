@@ -0,0 +1,160 @@
+#Author Vodohleb04
+from typing import List, Optional, TextIO, Tuple
+
+import configs
+from forest import Forest
+
+
+WASTELAND_CELL = "great_wasteland"
+
+
+def _window(length: int, start: int, size: Optional[int]) -> range:
+    """Returns numbers of lines (or columns) of window
+
+    length - amount of lines in forest
+    start - number of the first line of window
+    size - amount of lines in window (None - every line from start)
+    """
+    start = max(0, min(start, length))
+    if size is None:
+        return range(start, length)
+    return range(start, min(length, start + size))
+
+
+def _write_table(stream: TextIO, label_width: int, columns: range, cell_width: int, lines) -> None:
+    """Writes table of hectares to stream
+
+    label_width - width of column with numbers of lines of hectares
+    columns - numbers of columns of hectares in window
+    cell_width - width of cell of hectare
+    lines - (number of line of hectares, texts of cells of every text line of this line of hectares)
+    Every text line is joined once and written to stream at once
+    """
+    separator = "-" * label_width + "+" + ("-" * cell_width + "+") * len(columns) + "\n"
+    stream.write(" " * label_width + "|" + "".join(f"{j:<{cell_width}}|" for j in columns) + "\n")
+    for i, text_lines in lines:
+        stream.write(separator)
+        label = str(i)
+        for cells in text_lines:
+            stream.write(f"{label:<{label_width}}|" + "".join(f"{cell:<{cell_width}}|" for cell in cells) + "\n")
+            label = ""
+
+
+def _creature_lines(forest: Forest, i: int, columns: range, max_creatures: Optional[int]) -> List[List[str]]:
+    """Returns text lines of line of hectares (one id of creature of every hectare per text line)
+
+    max_creatures - amount of creatures of hectare to show (others are counted in the last text line)
+    """
+    hectares = [forest.hectares[i][j].creations for j in columns]
+    depth = max((len(creations) for creations in hectares), default=0)
+    shown_depth = depth if max_creatures is None else min(depth, max_creatures)
+    text_lines = [[creations[k].id if k < len(creations) else "" for creations in hectares]
+                  for k in range(shown_depth)]
+    if shown_depth < depth:
+        text_lines.append([f"+{len(creations) - shown_depth} more" if len(creations) > shown_depth else ""
+                           for creations in hectares])
+    return text_lines or [[""] * len(columns)]
+
+
+def render_forest(forest: Forest, wasteland: bool, stream: TextIO, top=0, left=0, rows=None, columns=None,
+                  counts=False, max_creatures=None) -> None:
+    """Writes table of window of forest to stream
+
+    forest - forest to show
+    wasteland - True if there is no creatures in forest
+    stream - text stream to write to (console or buffer)
+    top, left - number of the first line and column of hectares of window
+    rows, columns - size of window in hectares (None - to the end of forest)
+    counts - True to show amount of creatures of every hectare instead of their ids
+    max_creatures - amount of ids shown in one hectare (None - every id)
+    Only hectares of window are read, so time of writing doesn't depend on size of forest
+    """
+    row_numbers = _window(forest.vertical_length, top, rows)
+    column_numbers = _window(forest.horizontal_length, left, columns)
+    label_width = len(str(forest.vertical_length))
+    column_label_width = len(str(column_numbers[-1])) if column_numbers else 0
+
+    if wasteland:
+        lines = [(i, [[WASTELAND_CELL] * len(column_numbers)]) for i in row_numbers]
+        cell_width = max(len(WASTELAND_CELL), column_label_width)
+    elif counts:
+        lines = [(i, [[str(len(forest.hectares[i][j].creations)) for j in column_numbers]]) for i in row_numbers]
+        cell_width = max([len(cell) for _, text_lines in lines for cell in text_lines[0]] + [column_label_width])
+    else:
+        lines = [(i, _creature_lines(forest, i, column_numbers, max_creatures)) for i in row_numbers]
+        cell_width = max([len(cell) for _, text_lines in lines for cells in text_lines for cell in cells] +
+                         [column_label_width])
+    _write_table(stream, label_width, column_numbers, cell_width, lines)
+
+
+class ConsoleViewport:
+
+    def __init__(self, rows=configs.ConsoleViewParams.ROWS.value, columns=configs.ConsoleViewParams.COLUMNS.value):
+        """Creates window of forest shown by console
+
+        rows, columns - size of window in hectares
+        raise ValueError if size of window < 1
+        """
+        self._top = 0
+        self._left = 0
+        self._rows = 1
+        self._columns = 1
+        self._counts = False
+        self.resize(rows, columns)
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        """Returns number of the upper left hectare of window"""
+        return self._top, self._left
+
+    @property
+    def counts(self) -> bool:
+        """Returns True if window shows amounts of creatures instead of their ids"""
+        return self._counts
+
+    def resize(self, rows: int, columns: int) -> None:
+        """Sets size of window in hectares
+
+        raise ValueError if size of window < 1
+        """
+        if rows < 1 or columns < 1:
+            raise ValueError(f"Size of window must be >= 1, {rows}x{columns} got instead")
+        self._rows = rows
+        self._columns = columns
+
+    def switch_counts(self) -> None:
+        """Switches window between ids of creatures and amounts of creatures of hectares"""
+        self._counts = not self._counts
+
+    def go_to(self, vertical_number: int, horizontal_number: int, forest_size: Tuple[int, int]) -> None:
+        """Moves upper left corner of window to hectare (window doesn't leave forest)
+
+        forest_size - (vertical length, horizontal length) of forest
+        """
+        self._top = max(0, min(vertical_number, forest_size[0] - self._rows))
+        self._left = max(0, min(horizontal_number, forest_size[1] - self._columns))
+
+    def page(self, vertical_pages: int, horizontal_pages: int, forest_size: Tuple[int, int]) -> None:
+        """Moves window by pages (one page - size of window)
+
+        vertical_pages - pages down (negative - up)
+        horizontal_pages - pages right (negative - left)
+        forest_size - (vertical length, horizontal length) of forest
+        """
+        self.go_to(self._top + vertical_pages * self._rows, self._left + horizontal_pages * self._columns,
+                   forest_size)
+
+    def render(self, ecosystem, stream: TextIO) -> None:
+        """Writes window of forest of ecosystem to stream
+
+        If window doesn't show the whole forest, line with shown hectares is written after table
+        """
+        forest = ecosystem.forest
+        self.go_to(self._top, self._left, (forest.vertical_length, forest.horizontal_length))
+        ecosystem.render(stream, self._top, self._left, self._rows, self._columns, self._counts,
+                         configs.ConsoleViewParams.MAX_CREATURES_IN_CELL.value)
+        bottom = min(forest.vertical_length, self._top + self._rows)
+        right = min(forest.horizontal_length, self._left + self._columns)
+        if self._top > 0 or self._left > 0 or bottom < forest.vertical_length or right < forest.horizontal_length:
+            stream.write(f"Shown lines {self._top}-{bottom - 1} of {forest.vertical_length}, "
+                         f"columns {self._left}-{right - 1} of {forest.horizontal_length}\n")
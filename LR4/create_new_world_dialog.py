@@ -13,6 +13,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 from ecosystem import EcoSystem
 from typing import Dict
 import configs
+import species_registry
 
 
 class NewWorldAcceptedSignals(QtCore.QObject):
@@ -85,8 +86,8 @@ class Ui_newWorldDialog(object):
         self.creatureTypeBox.setToolTip("")
         self.creatureTypeBox.setStyleSheet("background-color: rgb(224, 224, 255);")
         self.creatureTypeBox.setObjectName("creatureTypeBox")
-        for i in range(7):
-                self.creatureTypeBox.addItem("")
+        for i in range(len(species_registry.entries())):
+            self.creatureTypeBox.addItem("")
         self.gridLayout.addWidget(self.creatureTypeBox, 8, 0, 1, 2)
         self.horizontalLengthSpinBox = QtWidgets.QSpinBox(newWorldDialog)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
@@ -310,13 +311,8 @@ class Ui_newWorldDialog(object):
         item.setText(_translate("newWorldDialog", "Количество"))
         self.verticalLengthSpinBox.setToolTip(_translate("newWorldDialog", "Размер мира по вертикали"))
         self.verticalLengthSpinBox.setSpecialValueText(_translate("newWorldDialog", "Размер мира по вертикали"))
-        self.creatureTypeBox.setItemText(0, _translate("newWorldDialog", configs.RussianCreaturesNames.BLUEBERRY.value))
-        self.creatureTypeBox.setItemText(1, _translate("newWorldDialog", configs.RussianCreaturesNames.HAZEL.value))
-        self.creatureTypeBox.setItemText(2, _translate("newWorldDialog", configs.RussianCreaturesNames.MAPLE.value))
-        self.creatureTypeBox.setItemText(3, _translate("newWorldDialog", configs.RussianCreaturesNames.BOAR.value))
-        self.creatureTypeBox.setItemText(4, _translate("newWorldDialog", configs.RussianCreaturesNames.ELK.value))
-        self.creatureTypeBox.setItemText(5, _translate("newWorldDialog", configs.RussianCreaturesNames.WOLF.value))
-        self.creatureTypeBox.setItemText(6, _translate("newWorldDialog", configs.RussianCreaturesNames.BEAR.value))
+        for i, entry in enumerate(species_registry.entries()):
+            self.creatureTypeBox.setItemText(i, _translate("newWorldDialog", entry.russian_name))
         self.horizontalLengthSpinBox.setToolTip(_translate("newWorldDialog", "Размер мира по горизонтали"))
         self.horizontalLengthSpinBox.setSpecialValueText(_translate("newWorldDialog", "Размер леса по горизонтали"))
         self.removeCreaturesButton.setShortcut(_translate("newWorldDialog", "-"))
@@ -0,0 +1,68 @@
+#Author Vodohleb04
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import configs
+
+
+CREATOR_NUMBER = -1  # Number of parent of creatures that were not born (created by CREATOR)
+
+_names: List[str] = []  # Ids that are not prefix with number (from saves), their numbers are -2, -3, ...
+_numbers: Dict[str, int] = {}
+_names_lock = threading.Lock()  # Saves are loaded and compacted in background threads
+
+
+def format_id(prefix: str, number: int) -> str:
+    """Returns id of creature made of prefix of its kind and its number
+
+    prefix - prefix of ids of kind (with gender for animals)
+    number - number of creature (CREATOR_NUMBER - creator, other negative numbers - ids from table of names)
+    """
+    if number >= 0:
+        return f"{prefix}{number}"
+    if number == CREATOR_NUMBER:
+        return configs.CREATOR
+    return _names[-number - 2]
+
+
+def parse_id(creature_id: str, prefix: str) -> int:
+    """Returns number of creature by its id (reverse of format_id)
+
+    creature_id - id without suffix of dead creature
+    prefix - prefix of ids of kind (with gender for animals)
+    Ids that are not prefix with number are put into table of names, so every id of save is kept as it is
+    """
+    if creature_id == configs.CREATOR:
+        return CREATOR_NUMBER
+    number = creature_id[len(prefix):]
+    if creature_id.startswith(prefix) and number.isdigit() and str(int(number)) == number:
+        return int(number)
+    return intern_name(creature_id)
+
+
+def intern_name(creature_id: str) -> int:
+    """Returns number of id from table of names (id is put into table if it is not there yet)"""
+    with _names_lock:
+        if creature_id not in _numbers:
+            _numbers[creature_id] = -len(_names) - 2
+            _names.append(creature_id)
+        return _numbers[creature_id]
+
+
+
+def split_id(creature_id: str) -> Tuple[str, Optional[int]]:
+    """Returns (prefix, number) of id that is prefix with number, (id, None) for other ids
+
+    creature_id - id without suffix of dead creature
+    """
+    prefix = creature_id.rstrip("0123456789")
+    number = creature_id[len(prefix):]
+    if number and str(int(number)) == number:
+        return prefix, int(number)
+    return creature_id, None
+
+
+def named_number(creature_id: str) -> Optional[int]:
+    """Returns number of id from table of names or None if id is not there (table is not changed)"""
+    with _names_lock:
+        return _numbers.get(creature_id)
@@ -1,13 +1,13 @@
 #Author Vodohleb04
+import random_streams
 from abc import ABC, abstractmethod
 from typing import Tuple
-from random import randint
 
 from forest import Hectare
-from configs import PersonalPowerCoefficientParameters
 
 
 class Aging(ABC):
+    __slots__ = ()
 
     # _age: int
     @property
@@ -22,10 +22,19 @@ class Aging(ABC):
 
 
 class Dieable(ABC):
+    __slots__ = ()
 
     # _life_median: int
     # _hp: int
     # _start_hp: int
+    # _hectare: Hectare where creature is located (set by Hectare)
+
+    def __new__(cls, *args, **kwargs):
+        """Creates creature that is not located in any hectare yet"""
+        creature = super().__new__(cls)
+        creature._hectare = None
+        return creature
+
     @property
     def hp(self) -> int:
         """Returns health points of creature"""
@@ -35,9 +44,16 @@ class Dieable(ABC):
         """Reduce health of creature after getting damaged"""
         if self._hp > damage:
             self._hp -= damage
+            if damage:
+                self._mark_changed()
         else:
             self.die()
 
+    def _mark_changed(self) -> None:
+        """Tells hectare of creature that state of creature was changed not by aging (for journal of saves)"""
+        if self._hectare is not None:
+            self._hectare.mark_changed(self)
+
     def is_dead(self) -> bool:
         """Checks if creature is dead"""
         return self._hp <= 0
@@ -46,15 +62,18 @@ class Dieable(ABC):
         """Kills creature"""
         if not self.is_dead():
             self._hp = 0
+            if self._hectare is not None:
+                self._hectare.mark_dead(self)
 
     def unexpected_death(self) -> None:
         """Random death of creature"""
-        chance_to_die = randint(0, 100)
+        chance_to_die = random_streams.randint(0, 100)
         if chance_to_die == 0:
             self.die()
 
 
 class Eatable(ABC):
+    __slots__ = ()
 
     # _nutritional_value: int
     @abstractmethod
@@ -64,10 +83,19 @@ class Eatable(ABC):
 
 
 class Powerful(ABC):
+    __slots__ = ()
 
     # _power_coefficient: float
     # _damage
-    @abstractmethod
+    # _power: float - power of creature counted for age _power_age
+
+    def __new__(cls, *args, **kwargs):
+        """Creates creature whose power is not counted yet"""
+        creature = super().__new__(cls)
+        creature._power = 0.0
+        creature._power_age = None
+        return creature
+
     def power(self) -> float:
         """Count power of this creature
 
@@ -78,32 +106,32 @@ class Powerful(ABC):
             personal power coefficient - minimal and maximal values depends on type of creature, can variate from
                 creature to creature of the same type
             age of creature
+        Power is counted once for every age of creature (dead creature has no power)
         """
-        raise NotImplementedError
-
-    @staticmethod
-    def __ppcp_parser(ppcp_of_class: PersonalPowerCoefficientParameters) -> Tuple[int, int, int]:
-        """Sets values to count power coefficient for creature
+        if self._hp <= 0:
+            return 0.0
+        if self._power_age != self._age:
+            self._power = self._power_of_age(self._age)
+            self._power_age = self._age
+        return self._power
 
-        This values determines interval of personal power coefficient for type of creatures (depends on type)
+    @abstractmethod
+    def _power_of_age(self, age: int) -> float:
+        """Returns power of alive creature of age (basic power of kind from table of power with personal power
+        coefficient)
         """
-        if not isinstance(ppcp_of_class, PersonalPowerCoefficientParameters):
-            raise TypeError
-        min_numerator = ppcp_of_class.value["min_numerator"]
-        max_numerator = ppcp_of_class.value["max_numerator"]
-        denominator = ppcp_of_class.value["denominator"]
-        return min_numerator, max_numerator, denominator
-
-    def _make_power_coefficient(self, ppcp_of_class: PersonalPowerCoefficientParameters) -> None:
+        raise NotImplementedError
+
+    def _make_power_coefficient(self, ppcp_of_class: Tuple[float, float, float]) -> None:
         """Sets personal power coefficient of creature
 
+        ppcp_of_class - (min numerator, max numerator, denominator) of personal power coefficient of kind (from
+            profile of species)
         Maximal and minimal power coefficient depends on type of creature but coefficient can variete from one creature
             to another
         """
-        if not isinstance(ppcp_of_class, PersonalPowerCoefficientParameters):
-            raise TypeError
-        min_numerator, max_numerator, denominator = Powerful.__ppcp_parser(ppcp_of_class)
-        self._power_coefficient = randint(min_numerator, max_numerator) / denominator
+        min_numerator, max_numerator, denominator = ppcp_of_class
+        self._power_coefficient = random_streams.randint(min_numerator, max_numerator) / denominator
 
     @abstractmethod
     def protect(self, enemy) -> bool:
@@ -117,6 +145,7 @@ class Powerful(ABC):
 
 
 class Movable(ABC):
+    __slots__ = ()
     # Only for animals
 
     @abstractmethod
@@ -127,8 +156,17 @@ class Movable(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def choose_destination(self, forest):
+        """Returns number of hectare (vertical number, horizontal number) to move to or None to stay
+
+        forest: Forest - data container for creatures
+        """
+        raise NotImplementedError
+
 
 class Hunger(ABC):
+    __slots__ = ()
     # Only for animals
 
     @property
@@ -139,16 +177,23 @@ class Hunger(ABC):
         """
         return self._food_energy
 
+    @property
+    def hunger_per_cycle(self) -> float:
+        """Returns food energy that creature loses every period (dead creature doesn't lose it)"""
+        return 0 if self.is_dead() else self._hunger_per_cycle
+
     def cycle_starvation(self) -> None:
         """Reduces food energy of creature
 
         Value of reducing food energy depends on type of creature
         """
-        if self._food_energy > self._hunger_per_cycle:
-            self._food_energy -= self._hunger_per_cycle
+        hunger_per_cycle = self.hunger_per_cycle
+        self._mark_changed()
+        if self._food_energy > hunger_per_cycle:
+            self._food_energy -= hunger_per_cycle
         else:
             self._food_energy = 0
-            self.get_hearted(self._hunger_per_cycle / 5)
+            self.get_hearted(hunger_per_cycle / 5)
 
     @abstractmethod
     def search_for_food(self, hectare: Hectare):
@@ -0,0 +1,151 @@
+#Author Vodohleb04
+import difflib
+from typing import List, Optional, Tuple
+
+from PyQt5 import QtCore, QtGui
+
+import configs
+
+
+class CreatureListModel(QtCore.QAbstractListModel):
+
+    def __init__(self, parent=None):
+        """Creates model of list of creatures of selected hectare (one row per id of creature)
+
+        Ids are given to view of list by batches (CREATURE_LIST_FETCH_BATCH rows) when list is scrolled down, so
+        crowded hectare doesn't make thousands of rows at once. Creatures can be filtered by species and by life
+        """
+        super().__init__(parent)
+        self._ids = ()  # ids of selected hectare
+        self._species = ()  # english names of species of these creatures
+        self._wasteland = False
+        self._species_filter = None
+        self._alive_filter = None
+        self._shown = []  # ids passed through filters
+        self._fetched = 0  # amount of shown ids given to view of list
+        self._brush = QtGui.QBrush(QtGui.QColor(244, 224, 255))
+        self._brush.setStyle(QtCore.Qt.SolidPattern)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        """Returns amount of rows given to view of list"""
+        if parent.isValid():
+            return 0
+        return self._fetched
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        """Returns id of creature or background of row"""
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._shown[index.row()]
+        if role == QtCore.Qt.BackgroundRole:
+            return self._brush
+        return None
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        """Returns True if some shown ids are not given to view of list yet"""
+        return not parent.isValid() and self._fetched < len(self._shown)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        """Gives the next batch of ids to view of list"""
+        if parent.isValid():
+            return
+        amount = min(configs.CREATURE_LIST_FETCH_BATCH, len(self._shown) - self._fetched)
+        if amount <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._fetched, self._fetched + amount - 1)
+        self._fetched += amount
+        self.endInsertRows()
+
+    def creature_id(self, row: int) -> Optional[str]:
+        """Returns id of creature in row (None if row is empty or shows wasteland)"""
+        if self._wasteland or not 0 <= row < self._fetched:
+            return None
+        return self._shown[row]
+
+    def set_filter(self, species: Optional[str], alive: Optional[bool]) -> None:
+        """Shows only creatures that pass filters
+
+        species - english name of species to show (None - every species)
+        alive - True to show alive creatures, False to show dead creatures, None to show both
+        """
+        self._species_filter = species
+        self._alive_filter = alive
+        self.beginResetModel()
+        self._shown = self._filtered()
+        self._fetched = min(configs.CREATURE_LIST_FETCH_BATCH, len(self._shown))
+        self.endResetModel()
+
+    def set_creatures(self, ids: Tuple[str, ...], species: Tuple[str, ...], wasteland: bool, reset: bool) -> None:
+        """Shows creatures of hectare
+
+        ids - ids of creatures of hectare
+        species - english names of species of these creatures
+        wasteland - True if there is no creatures in forest
+        reset - True if another hectare is shown (list starts from the first batch)
+        Otherwise new list is compared with shown one: only inserted, removed and renamed (died) rows are changed,
+        so given rows and selection of other creatures stay the same
+        """
+        self._ids, self._species, self._wasteland = ids, species, wasteland
+        new_shown = self._filtered()
+        if reset:
+            self.beginResetModel()
+            self._shown = new_shown
+            self._fetched = min(configs.CREATURE_LIST_FETCH_BATCH, len(self._shown))
+            self.endResetModel()
+        elif new_shown != self._shown:
+            self._apply_changes(new_shown)
+
+    def _filtered(self) -> List[str]:
+        """Returns ids of creatures that pass filters (text of wasteland if forest is empty)"""
+        if self._wasteland:
+            return [configs.GuiMessages.WASTELAND_CREATURES_INFO.value]
+        return [creature_id for creature_id, species in zip(self._ids, self._species)
+                if (self._species_filter is None or species == self._species_filter) and
+                (self._alive_filter is None or
+                 creature_id.endswith(configs.DEAD_ID_SUFFIX) != self._alive_filter)]
+
+    def _apply_changes(self, new_shown: List[str]) -> None:
+        """Turns shown ids into new_shown, view of list is told only about changes of given rows
+
+        Rows inserted right after the last given row are given only if every row was given before (up to the first
+        batch), others are fetched by view of list when it is scrolled down
+        """
+        matcher = difflib.SequenceMatcher(None, self._shown, new_shown, autojunk=False)
+        # Changes are applied from the end of list, so rows of not applied changes stay valid
+        for tag, old_start, old_end, new_start, new_end in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            common_length = min(old_end - old_start, new_end - new_start)
+            if common_length:
+                self._shown[old_start:old_start + common_length] = new_shown[new_start:new_start + common_length]
+                last_changed = min(old_start + common_length, self._fetched) - 1
+                if old_start <= last_changed:
+                    self.dataChanged.emit(self.index(old_start), self.index(last_changed),
+                                          [QtCore.Qt.DisplayRole])
+
+            removed_start, removed_end = old_start + common_length, old_end
+            if removed_start < removed_end:
+                given_end = min(removed_end, self._fetched)
+                if removed_start < given_end:
+                    self.beginRemoveRows(QtCore.QModelIndex(), removed_start, given_end - 1)
+                del self._shown[removed_start:removed_end]
+                if removed_start < given_end:
+                    self._fetched -= given_end - removed_start
+                    self.endRemoveRows()
+
+            inserted = new_shown[new_start + common_length:new_end]
+            if inserted:
+                position = old_start + common_length
+                if position < self._fetched:
+                    given = len(inserted)
+                elif self._fetched == len(self._shown):
+                    given = min(len(inserted), max(configs.CREATURE_LIST_FETCH_BATCH - self._fetched, 0))
+                else:
+                    given = 0
+                if given:
+                    self.beginInsertRows(QtCore.QModelIndex(), position, position + given - 1)
+                self._shown[position:position] = inserted
+                if given:
+                    self._fetched += given
+                    self.endInsertRows()
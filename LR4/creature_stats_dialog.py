@@ -385,12 +385,32 @@ class Ui_creatureStatsDialog(object):
         self.removeAnimalButton.setStyleSheet("background-color: rgb(224, 224, 255);")
         self.removeAnimalButton.setObjectName("removeAnimalButton")
         self.gridLayout.addWidget(self.removeAnimalButton, 9, 3, 1, 1)
+        if creature_reproduction_type == configs.ReproductionType.GENDER_REPRODUCTION:
+            self.pedigreeButton = QtWidgets.QPushButton(creatureStatsDialog)
+            self.pedigreeButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+            self.pedigreeButton.setStyleSheet("background-color: rgb(224, 224, 255);")
+            self.pedigreeButton.setObjectName("pedigreeButton")
+            self.gridLayout.addWidget(self.pedigreeButton, 9, 2, 1, 1)
 
         self.retranslateUi(creatureStatsDialog, ecosystem, creature, creature_reproduction_type)
         self.diaologButtonBox.accepted.connect(creatureStatsDialog.accept)  # type: ignore
         self.diaologButtonBox.rejected.connect(creatureStatsDialog.reject)  # type: ignore
         QtCore.QMetaObject.connectSlotsByName(creatureStatsDialog)
         self.removeAnimalButton.clicked.connect(lambda: self.remove_creature(creatureStatsDialog, ecosystem, creature))
+        if creature_reproduction_type == configs.ReproductionType.GENDER_REPRODUCTION:
+            self.pedigreeButton.clicked.connect(lambda: self.show_pedigree(ecosystem, creature))
+
+    def show_pedigree(self, ecosystem: EcoSystem, creature):
+        pedigree_msg_box = QtWidgets.QMessageBox()
+        pedigree_msg_box.setWindowTitle(f"Родословная существа {creature.id}")
+        try:
+            pedigree_msg_box.setText(ecosystem.console_pedigree(creature.id))
+        except ValueError as error:  # Creature was removed from forest while dialog was opened
+            pedigree_msg_box.setText(str(error))
+        pedigree_msg_box.setIcon(QtWidgets.QMessageBox.Information)
+        pedigree_msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
+        pedigree_msg_box.adjustSize()
+        pedigree_msg_box.exec()
 
     def remove_creature(self, creatureStatsDialog, ecosystem: EcoSystem, creature):
         before_delete_msg_box = QtWidgets.QMessageBox()
@@ -434,6 +454,8 @@ class Ui_creatureStatsDialog(object):
             self.fatherContainer.setText(_translate("creatureStatsDialog", creature.father))
             self.motherLabel.setText(_translate("creatureStatsDialog", "Мать:"))
             self.MotherContainer.setText(_translate("creatureStatsDialog", creature.mother))
+            self.pedigreeButton.setToolTip(_translate("creatureStatsDialog", "Показывает предков и потомков существа"))
+            self.pedigreeButton.setText(_translate("creatureStatsDialog", "Родословная"))
         self.removeAnimalButton.setToolTip(_translate("creatureStatsDialog", "Безвозвратно уничтожает существо Del"))
         self.removeAnimalButton.setStatusTip(_translate("creatureStatsDialog", "Безвозвратно уничтожает существо Del"))
         self.removeAnimalButton.setWhatsThis(_translate("creatureStatsDialog", "Безвозвратно уничтожает существо Del"))
@@ -1,49 +1,52 @@
 #Author Vodohleb04
 import random
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Set, TextIO
 
 import animal_types_interfaces
 import configs
-from forest import Forest
-from blueberry import Blueberry
-from hazel import Hazel
-from maple import Maple
-from boar import Boar
-from elk import Elk
-from wolf import Wolf
-from bear import Bear
+from forest import Forest, ForestChanges
+# Modules of species register their classes in species_registry
+import blueberry
+import hazel
+import maple
+import boar
+import elk
+import wolf
+import bear
 from creature_interfaces import Movable, Hunger, Aging, Dieable
 from reproduction import GenderReproduction, NonGenderReproduction, Reproduction
 from plant import Plant
 from animal import Animal
+from columnar_period import ColumnarPeriod, columnar_period_available
+from tiled_cycle import tiled_cycle, ResidentTiles, CyclePlan, feed_hectare, breed_hectare, sow_hectare, choose_moves, \
+    age_hectare
+from random_streams import RandomStream
+import random_streams
+from pedigree import Pedigree
+import io
 import json
+import streaming_save
+import binary_snapshot
+import console_renderer
+from save_journal import SaveJournal
+import save_journal
+import species_registry
 
 
 class EcoSystem:
 
+    _columnar_period = False
+    _cycle_workers = 0
+    _resident_tiles = None  # Tiles of forest kept by worker processes (cycle_workers > 1)
+
     @staticmethod
     def _define_creature_type(creature) -> str:
-        """Returns name of creature from EnglishCreaturesNames
+        """Returns english name of species of creature
 
         creature - creature from ecosystem
         raise TypeError if creature\'s type not defined
         """
-        if isinstance(creature, Blueberry):
-            return configs.EnglishCreaturesNames.BLUEBERRY.value
-        elif isinstance(creature, Hazel):
-            return configs.EnglishCreaturesNames.HAZEL.value
-        elif isinstance(creature, Maple):
-            return configs.EnglishCreaturesNames.MAPLE.value
-        elif isinstance(creature, Boar):
-            return configs.EnglishCreaturesNames.BOAR.value
-        elif isinstance(creature, Elk):
-            return configs.EnglishCreaturesNames.ELK.value
-        elif isinstance(creature, Wolf):
-            return configs.EnglishCreaturesNames.WOLF.value
-        elif isinstance(creature, Bear):
-            return configs.EnglishCreaturesNames.BEAR.value
-        else:
-            raise TypeError(f"Not part of ecosystem: {type(creature)}")
+        return species_registry.entry_of(creature).english_name
 
     @staticmethod
     def _save_creature_to_dict(creature) -> Dict:
@@ -63,26 +66,15 @@ class EcoSystem:
 
         kwargs - dict with amount of creatures of different types
         """
-        kwargs[f"{configs.EnglishCreaturesNames.BLUEBERRY.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.BLUEBERRY.value}_amount", 20)
-        kwargs[f"{configs.EnglishCreaturesNames.HAZEL.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.HAZEL.value}_amount", 10)
-        kwargs[f"{configs.EnglishCreaturesNames.MAPLE.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.MAPLE.value}_amount", 10)
-        kwargs[f"{configs.EnglishCreaturesNames.BOAR.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.BOAR.value}_amount", 12)
-        kwargs[f"{configs.EnglishCreaturesNames.ELK.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.ELK.value}_amount", 6)
-        kwargs[f"{configs.EnglishCreaturesNames.WOLF.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.WOLF.value}_amount", 12)
-        kwargs[f"{configs.EnglishCreaturesNames.BEAR.value}_amount"] = kwargs.get(
-            f"{configs.EnglishCreaturesNames.BEAR.value}_amount", 6)
+        for entry in species_registry.entries():
+            amount_key = f"{entry.english_name}_amount"
+            kwargs[amount_key] = kwargs.get(amount_key, configs.BASE_ECOSYSTEM_PARAMETERS.get(amount_key, 0))
         for key, value in kwargs.items():
             if key.endswith("_amount"):
                 new_key = key.replace("_amount", "")
                 for _ in range(value):
-                    random_line_number = random.randint(0, self.forest.vertical_length - 1)
-                    random_column_number = random.randint(0, self.forest.horizontal_length - 1)
+                    random_line_number = self._random.randint(0, self.forest.vertical_length - 1)
+                    random_column_number = self._random.randint(0, self.forest.horizontal_length - 1)
                     self.fill_creatures(new_key, 1, (random_line_number, random_column_number))
 
     def _unpack_creatures(self, creatures_info_dicts: List[Dict]) -> None:
@@ -91,169 +83,184 @@ class EcoSystem:
         creatures_info_dict - List of dicts. Dicts contain data about creatures and their stats
         """
         for creature_info_dict in creatures_info_dicts:
-            i, j = creature_info_dict["position"]
-            if creature_info_dict["type"] == configs.EnglishCreaturesNames.BLUEBERRY.value:
-                self._forest.hectares[i][j].creations.append(Blueberry(unpack_dict_flag=True,
-                                                                       info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.HAZEL.value:
-                self._forest.hectares[i][j].creations.append(Hazel(unpack_dict_flag=True, info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.MAPLE.value:
-                self._forest.hectares[i][j].creations.append(Maple(unpack_dict_flag=True, info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.BOAR.value:
-                self._forest.hectares[i][j].creations.append(Boar(unpack_dict_flag=True, info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.ELK.value:
-                self._forest.hectares[i][j].creations.append(Elk(unpack_dict_flag=True, info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.WOLF.value:
-                self._forest.hectares[i][j].creations.append(Wolf(unpack_dict_flag=True, info_d=creature_info_dict))
-            elif creature_info_dict["type"] == configs.EnglishCreaturesNames.BEAR.value:
-                self._forest.hectares[i][j].creations.append(Bear(unpack_dict_flag=True, info_dict=creature_info_dict))
-            else:
-                raise ValueError
+            self._unpack_creature(creature_info_dict)
+
+    def _unpack_creature(self, creature_info_dict: Dict) -> None:
+        """Unpack creature from dict and emplace it into forest (used in load of save)
+
+        creature_info_dict - dict with data about creature, its stats and position
+        raise ValueError if type of creature is unknown
+        """
+        i, j = creature_info_dict["position"]
+        try:
+            entry = species_registry.entry_by_name(creature_info_dict["type"])
+        except KeyError:
+            raise ValueError(f"Unknown type of creature: {creature_info_dict['type']}")
+        creature = entry.unpack(creature_info_dict)
+        if isinstance(creature, GenderReproduction):
+            self._pedigree.record(creature)
+        self._forest.hectares[i][j].append_creature(creature)
 
     @staticmethod
     def _unpack_id_counters(id_counters_dict) -> None:
         """Rewrites id_counters of creatures type (used in load .json file)
 
-        id_counters_dict - dict with new id_counters of creatures
+        id_counters_dict - dict with new id_counters of creatures (species that are not in dict get 0)
         """
-        Blueberry.rewrite_id_counter(id_counters_dict["blueberry_id_counter"])
-        Hazel.rewrite_id_counter(id_counters_dict["hazel_id_counter"])
-        Maple.rewrite_id_counter(id_counters_dict["maple_id_counter"])
-        Boar.rewrite_id_counter(id_counters_dict["boar_id_counter"])
-        Elk.rewrite_id_counter(id_counters_dict["elk_id_counter"])
-        Wolf.rewrite_id_counter(id_counters_dict["wolf_id_counter"])
-        Bear.rewrite_id_counter(id_counters_dict["bear_id_counter"])
+        for entry in species_registry.entries():
+            entry.kind.rewrite_id_counter(id_counters_dict.get(entry.id_counter_key, 0))
 
     def __init__(self, filename="", unpack_dict_flag=False, *args, **kwargs):
         """Creates ecosystem
         filename - file to save ecosystem
         unpack_dict_flag - True when need to unpack parameters of ecosystem from dict
         args - creatures stats
-        kwargs - params of ecosystem
+        kwargs - params of ecosystem (seed - seed of random stream of ecosystem, if not set - drawn from random;
+            pedigree - packed pedigree of ecosystem from save; fill - False to leave forest empty, default True;
+            install_id_counters - False to keep unpacked id counters until install_id_counters(), default True)
 
         EcoSystem - data controller part of program
+        Every ecosystem owns its random stream: creatures draw numbers from it, its state is saved with ecosystem.
+        Stream is active only while creatures of ecosystem draw numbers (fill, cycle), then previous stream is
+        restored
         """
-        if filename and not filename.endswith(".json"):
-            raise ValueError(f"Unknown type of file: {filename} (expected.json)")
+        if filename and not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+            raise ValueError(f"Unknown type of file: {filename} (expected {' or '.join(configs.SAVE_FILE_EXTENSIONS)})")
+        self._close_resident_tiles()  # World of ecosystem is replaced (load)
         self._filename = filename
         kwargs["forest_vertical_length"] = kwargs.get("forest_vertical_length", 4)
         kwargs["forest_horizontal_length"] = kwargs.get("forest_horizontal_length", 4)
         kwargs["deadly_worm_sleep_interval"] = kwargs.get("deadly_worm_sleep_interval", 5)
         if unpack_dict_flag:
             kwargs["deadly_worm_sleep_counter"] = kwargs.get("deadly_worm_sleep_counter", 5)
-        self._forest = Forest(vertical_length=kwargs["forest_vertical_length"],
-                              horizontal_length=kwargs["forest_horizontal_length"])
+        self._own_forest = Forest(vertical_length=kwargs["forest_vertical_length"],
+                                  horizontal_length=kwargs["forest_horizontal_length"])
         self._deadly_worm_sleep_interval = kwargs["deadly_worm_sleep_interval"]
+        self._periods_count = kwargs.get("periods_count", 0)
+        self._journal = None
+        self._columnar_state = None  # Columns of creatures of columnar period (kept between periods)
+        self._loaded_id_counters = None  # Id counters of unpacked world that are not installed yet
+        self._random = RandomStream(kwargs["seed"] if "seed" in kwargs else random.getrandbits(64))
+        if unpack_dict_flag and "random_state" in kwargs:
+            self._random.unpack_state(kwargs["random_state"])
+        if unpack_dict_flag and "pedigree" in kwargs:
+            self._pedigree = Pedigree.unpack(kwargs["pedigree"])
+        else:
+            self._pedigree = Pedigree()
         if unpack_dict_flag:
             self._deadly_worm_sleep_counter = kwargs["deadly_worm_sleep_counter"]
-            EcoSystem._unpack_id_counters(args[0])
-            self._unpack_creatures(args[1:])
+            self._unpack_creatures(args[1:])  # Unpacked creatures don't change id counters
+            self._loaded_id_counters = args[0]
+            if kwargs.get("install_id_counters", True):
+                self.install_id_counters()
             return
         self._deadly_worm_sleep_counter = self._deadly_worm_sleep_interval
-        self._fill_forest_with_creatures(**kwargs)
+        if kwargs.pop("fill", True):
+            self._fill_forest_with_creatures(**kwargs)
 
-    def _find_max_id_size(self) -> int:
-        """Finds the longest id of creatures at forest"""
-        max_id_size = 0
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if max_id_size < len(creature.id):
-                        max_id_size = len(creature.id)
-        return max_id_size
+    @classmethod
+    def from_file(cls, filename, install_id_counters=True) -> "EcoSystem":
+        """Returns ecosystem loaded from file (no random world is made before load)
 
-    def _find_max_amount_in_hectare(self) -> int:
-        """Find the maximal amount of creatures in hectare at forest"""
-        max_amount = 0
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                if len(hectare.creations) > max_amount:
-                    max_amount = len(hectare.creations)
-        return max_amount
+        filename - .json, .ndjson or .fsnap file to load ecosystem from
+        install_id_counters - False to keep id counters of loaded world until install_id_counters() (load in other
+            thread must not change id counters of world that is running now)
+        raise ValueError if type of file is not .json, .ndjson or .fsnap
+        """
+        ecosystem = cls(fill=False)
+        ecosystem.load(filename, install_id_counters)
+        return ecosystem
+
+    def install_id_counters(self) -> None:
+        """Rewrites id counters of creatures types with id counters of loaded world (does nothing if they are
+        installed already)"""
+        if self._loaded_id_counters is not None:
+            EcoSystem._unpack_id_counters(self._loaded_id_counters)
+            self._loaded_id_counters = None
+
+    def __getstate__(self) -> dict:
+        """Copies of ecosystem are not in journal mode (journal belongs to the original ecosystem) and have no resident
+        tiles (forest is pulled from them before copy)"""
+        self._pull_forest()
+        state = self.__dict__.copy()
+        state["_journal"] = None
+        state.pop("_resident_tiles", None)
+        return state
+
+    @property
+    def _forest(self) -> Forest:
+        """Returns forest of ecosystem (states of creatures are pulled from resident tiles if they are older)"""
+        self._pull_forest()
+        return self._own_forest
+
+    def _pull_forest(self) -> None:
+        """Pulls states of creatures from resident tiles of workers to forest if forest is older than tiles"""
+        if self._resident_tiles is not None and self._resident_tiles.is_stale:
+            self._resident_tiles.pull()
+
+    def _close_resident_tiles(self) -> None:
+        """Stops worker processes of resident tiles (forest must be pulled before if it is still used)"""
+        if self._resident_tiles is not None:
+            self._resident_tiles.close()
+            self._resident_tiles = None
+
+    def _population(self) -> Dict[type, Tuple[int, int]]:
+        """Returns (amount of alive creatures, amount of dead creatures) for every kind of creatures of forest
+
+        Counters of resident tiles are used if forest isn't pulled from them yet (forest is not pulled)
+        """
+        if self._resident_tiles is not None and self._resident_tiles.is_stale:
+            return self._resident_tiles.population()
+        return self._own_forest.population()
+
+    def render(self, stream: TextIO, top=0, left=0, rows=None, columns=None, counts=False,
+               max_creatures=None) -> None:
+        """Writes table of window of forest to stream (arguments are described in console_renderer.render_forest)"""
+        console_renderer.render_forest(self._forest, self.is_wasteland(), stream, top, left, rows, columns, counts,
+                                       max_creatures)
 
     def __str__(self):
-        from math import log10
-        if self.is_wasteland():
-            return self._show_wasteland()
-        max_id = self._find_max_id_size()
-        max_amount_in_hectare = self._find_max_amount_in_hectare()
-        res_str = f"{'':<{int(log10(self.forest.vertical_length) + 1)}}|"
-        for i in range(self.forest.horizontal_length):
-            res_str += f"{i:<{max_id}}|"
-        res_str += "\n"
-
-        for i in range(self.forest.vertical_length):
-            res_str += ("-" * int(log10(self.forest.vertical_length) + 1)) + "+"
-            for _ in range(self.forest.horizontal_length):
-                res_str += ("-" * max_id) + "+"
-            res_str += "\n"
-
-            print_number = True
-            for k in range(max_amount_in_hectare):
-                vertical_number_of_hectare = str(i) if print_number else ""
-                print_number = False
-                res_str += f"{vertical_number_of_hectare:<{int(log10(self.forest.vertical_length) + 1)}}|"
-                for j in range(self._forest.horizontal_length):
-                    try:
-                        res_str += f"{str(self.forest.hectares[i][j].creations[k]):<{max_id}}|"
-                    except IndexError:
-                        res_str += f"{'':<{max_id}}|"
-                res_str += f"\n"
-        return res_str
+        stream = io.StringIO()
+        self.render(stream)
+        return stream.getvalue()
 
     def is_wasteland(self) -> bool:
         """Defines if ecosystem became wasteland
 
         True - if there is no creatures in ecosystem
         """
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, Plant) or isinstance(creature, Animal):
-                        return False
-        return True
-
-    def _show_wasteland(self) -> str:
-        from math import log10
-        max_id = len("great_wasteland")
-        res_str = f"{'':<{int(log10(self.forest.vertical_length) + 1)}}|"
-        for i in range(self.forest.horizontal_length):
-            res_str += f"{i:<{max_id}}|"
-        res_str += "\n"
-        for i in range(self.forest.vertical_length):
-            res_str += ("-" * int(log10(self.forest.vertical_length) + 1)) + "+"
-            for _ in range(self.forest.horizontal_length):
-                res_str += ("-" * max_id) + "+"
-            res_str += "\n"
-            res_str += f"{i:<{int(log10(self.forest.vertical_length) + 1)}}|"
-            for _ in range(self.forest.horizontal_length):
-                res_str += "great_wasteland|"
-            res_str += "\n"
-        return res_str
+        return not any(alive + dead for kind, (alive, dead) in self._population().items()
+                       if issubclass(kind, (Plant, Animal)))
 
-    def _provoke_on_move(self) -> None:
-        """Provoke movable creatures to change their position"""
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, Movable):
-                        creature.move(self._forest)
+    def _provoke_on_move(self, plan: CyclePlan) -> None:
+        """Provoke movable creatures to change their position
 
-    def _provoke_on_nutrition(self) -> None:
-        """Provoke creatures to find food"""
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, Hunger):
-                        creature.search_for_food(hectare)
+        plan - plan of current cycle, moves are planned to it and committed after period
+        Destinations are chosen by creatures at their positions before the phase.
+        Chances to move are drawn by one batch for all creatures of hectare
+        """
+        forest_size = (self._forest.vertical_length, self._forest.horizontal_length)
+        for hectare in plan.hectares():
+            plan.moves.extend((hectare.creations[place], destination)
+                              for place, destination in choose_moves(hectare, forest_size))
 
-    def _provoke_animals_on_reproduction(self) -> None:
-        """Provoke animals to make children (find partner to try to make children with)"""
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, GenderReproduction):
-                        hectare.extend_hectare(creature.reproduction(hectare))
+    def _provoke_on_nutrition(self, plan: CyclePlan) -> None:
+        """Provoke creatures to find food
+
+        plan - plan of current cycle
+        """
+        for hectare in plan.hectares():
+            feed_hectare(hectare)
+
+    def _provoke_animals_on_reproduction(self, plan: CyclePlan) -> None:
+        """Provoke animals to make children (find partner to try to make children with)
+
+        plan - plan of current cycle
+        Children are added to hectares after animals of hectare tried, so they are not provoked in the cycle of their
+        birth
+        """
+        for hectare in plan.hectares():
+            self._pedigree.record_creatures(breed_hectare(hectare, self._pedigree))
 
     def _find_position_in_forest(self, creature: Reproduction) -> Tuple[int, int]:
         """Defines number of hectare where creation is located
@@ -262,83 +269,144 @@ class EcoSystem:
         returns Tuple(vertical_number_of_hectare, horizontal_number_of_hectare)
         raise ValueError if creature is not exists
         """
-        not_found_flag = True
-        i = 0
-        j = 0
-        for hectare_line in self.forest.hectares:
-            j = 0
-            for hectare in hectare_line:
-                if creature in hectare.creations:
-                    not_found_flag = False
-                    break
-                j += 1
-            else:
-                i += 1
-                continue
-            break
-        if not_found_flag:
-            raise ValueError(f"Creature with id {creature.id} wasn't found in forest")
-        return i, j
-
-    def _disperse_offsprings(self, offsprings: List[NonGenderReproduction], parent_pos: Tuple[int, int]) -> None:
-        """Disperse offsprings in forest on their dispersion distance
-
-        offsprings - list of new NonGenderReproduction creatures
-        parent_pos - position of the parent creature(base position to disperse from)
-        raise TypeError if creature in offsprings is not NonGenderReproduction creature
-        """
-        vert_pos, horiz_pos = parent_pos
-        for offspring in offsprings:
-            if not isinstance(offspring, NonGenderReproduction):
-                raise TypeError(f'Offspring must be NonGenderReproduction creature. {type(offspring)} got instead')
-            vertical_shift = random.randint(-offspring.offspring_dispersion, offspring.offspring_dispersion)
-            horizontal_shift = random.randint(-offspring.offspring_dispersion, offspring.offspring_dispersion)
-            while vert_pos + vertical_shift >= self.forest.vertical_length or \
-                    horiz_pos + horizontal_shift >= self.forest.horizontal_length:
-                vertical_shift = random.randint(-1, 1)
-                horizontal_shift = random.randint(-1, 1)
-            self.forest.hectares[vert_pos + vertical_shift][horiz_pos + horizontal_shift].creations.append(offspring)
-
-    def _provoke_on_non_gender_reproduction_reproduction(self) -> None:
-        """Provokes NonGenderReproduction creatures to make children"""
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, NonGenderReproduction):
-                        offsprings = creature.reproduction()
-                        parent_position = self._find_position_in_forest(creature)
-                        self._disperse_offsprings(offsprings=offsprings, parent_pos=parent_position)
+        return self._forest.find_position(creature)
 
-    def _period(self) -> None:
-        """Change creatures time-depended parameters and tries to wake deadly_worm"""
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, Aging):
-                        creature.live_time_cycle()
+    def _provoke_on_non_gender_reproduction_reproduction(self, plan: CyclePlan) -> None:
+        """Provokes NonGenderReproduction creatures to make children
+
+        plan - plan of current cycle, offsprings are planned to it and dispersed after period, so they are not
+            provoked in the cycle of their birth
+        """
+        forest_size = (self._forest.vertical_length, self._forest.horizontal_length)
+        for hectare in plan.hectares():
+            plan.offsprings.append(sow_hectare(hectare, forest_size))
+
+    @property
+    def columnar_period(self) -> bool:
+        """Returns True if time-depended parameters of creatures are changed by batch operations (needs numpy)"""
+        return self._columnar_period
+
+    @columnar_period.setter
+    def columnar_period(self, flag: bool) -> None:
+        """Turns on/off columnar period (stays after load of ecosystem)
+
+        raise RuntimeError if numpy is not installed
+        """
+        if flag and not columnar_period_available():
+            raise RuntimeError("Columnar period requires numpy")
+        self._columnar_period = flag
+        self._columnar_state = None
+
+    @property
+    def random_stream(self) -> RandomStream:
+        """Returns random stream of ecosystem"""
+        return self._random
+
+    def reseed(self, seed) -> None:
+        """Restarts random stream of ecosystem from seed (e.g. to get different runs of one loaded world)"""
+        self._random.seed(seed)
+
+    @property
+    def cycle_workers(self) -> int:
+        """Returns amount of worker processes of tiled cycle (0 - cycle is made phase by phase for whole forest)"""
+        return self._cycle_workers
+
+    @cycle_workers.setter
+    def cycle_workers(self, workers: int) -> None:
+        """Sets amount of worker processes of tiled cycle (stays after load of ecosystem)
+
+        0 - cycle is made phase by phase for whole forest, 1 - hectare by hectare in main process,
+        n > 1 - hectare by hectare in n processes that keep strips of forest between cycles (every hectare has its own
+        random substream, so same seed gives same result for any amount of workers)
+        Tiled cycle doesn't use columnar period
+        raise ValueError if workers < 0
+        """
+        if workers < 0:
+            raise ValueError(f"Amount of workers must be >= 0, {workers} got instead")
+        if workers != self._cycle_workers:
+            self._pull_forest()
+            self._close_resident_tiles()
+        self._cycle_workers = workers
+
+    def _period(self, plan: CyclePlan) -> None:
+        """Change creatures time-depended parameters, commits plan of cycle and tries to wake deadly_worm
+
+        plan - plan of current cycle (offsprings age with creatures of hectares of their parents)
+        """
+        if self._columnar_period:
+            if self._columnar_state is None:
+                self._columnar_state = ColumnarPeriod()
+            self._columnar_state.run(self._forest, [offspring for offsprings in plan.offsprings
+                                                    for offspring, _ in offsprings], self._random)
+        else:
+            self._columnar_state = None
+            for hectare, offsprings in zip(plan.hectares(), plan.offsprings):
+                age_hectare(hectare, offsprings)
+        plan.commit()
+        self._periods_count += 1
         self._normal_deadly_worm_period()
 
+    def _deadly_worm_wakes(self) -> bool:
+        """Counts periods of sleep of deadly worm, returns True if it\'s time to wake him"""
+        if self._deadly_worm_sleep_counter == 0:
+            self._deadly_worm_sleep_counter = self._deadly_worm_sleep_interval
+            return True
+        self._deadly_worm_sleep_counter -= 1
+        return False
+
     def _normal_deadly_worm_period(self) -> None:
         """Wake deadly worm if it\'s time to wake him
 
         Deadly worm removes dead creatures from forest
         """
-        if self._deadly_worm_sleep_counter == 0:
+        if self._deadly_worm_wakes():
             self.provoke_deadly_worm()
-            self._deadly_worm_sleep_counter = self._deadly_worm_sleep_interval
-        else:
-            self._deadly_worm_sleep_counter -= 1
+
+    def _prune_pedigree(self, kept_numbers=None) -> None:
+        """Removes extinct lineages from pedigree (animals of forest and their ancestors are kept)
+
+        kept_numbers - numbers of animals of forest and of their parents by kinds (counted by resident tiles), None -
+            they are counted by animals of forest
+        """
+        if kept_numbers is None:
+            kept_numbers = Pedigree.kept_numbers(creature for hectare_line in self._forest.hectares
+                                                 for hectare in hectare_line
+                                                 for creature in hectare.creatures_of(GenderReproduction))
+        self._pedigree.prune_numbers(kept_numbers, configs.PEDIGREE_GENERATIONS)
 
     def cycle(self) -> None:
-        """Provoke creatures on their time cycle activities"""
+        """Provoke creatures on their time cycle activities (creatures draw numbers from random stream of ecosystem)"""
+        with random_streams.activated(self._random):
+            self._cycle()
+
+    def _cycle(self) -> None:
+        """Makes phases of cycle (random stream of ecosystem is active)"""
         if not self.is_wasteland():
-            self._provoke_on_nutrition()
-            self._provoke_animals_on_reproduction()
-            self._provoke_on_non_gender_reproduction_reproduction()
-            self._provoke_on_move()
-            self._period()
+            kept_numbers = None
+            if self._cycle_workers > 1:
+                self._columnar_state = None  # Creatures age without columns
+                if self._resident_tiles is None:
+                    self._resident_tiles = ResidentTiles(self._cycle_workers)
+                prune = (self._periods_count + 1) % configs.PEDIGREE_PRUNE_INTERVAL == 0
+                kept_numbers = self._resident_tiles.cycle(self._own_forest, self._random, self._pedigree,
+                                                          self._deadly_worm_wakes(), prune)
+                self._periods_count += 1
+            elif self._cycle_workers == 1:
+                self._columnar_state = None
+                tiled_cycle(self._forest, self._random, self._pedigree)
+                self._periods_count += 1
+                self._normal_deadly_worm_period()
+            else:
+                plan = CyclePlan(self._forest, self._random)
+                self._provoke_on_nutrition(plan)
+                self._provoke_animals_on_reproduction(plan)
+                self._provoke_on_non_gender_reproduction_reproduction(plan)
+                self._provoke_on_move(plan)
+                self._period(plan)
+            if self._periods_count % configs.PEDIGREE_PRUNE_INTERVAL == 0:
+                self._prune_pedigree(kept_numbers)
             # self.sa
-            apocalypse_chance = random.randint(1, 100000)
+            apocalypse_chance = self._random.randint(1, 100000)
             if apocalypse_chance == 1:
                 self.apocalypse()
 
@@ -355,27 +423,31 @@ class EcoSystem:
         """Removes all dead creatures forcibly (not carries about normal deadly worm periods)"""
         for hectare_line in self._forest.hectares:
             for hectare in hectare_line:
-                not_dead_creatures = [creature for creature in hectare.creations if not creature.is_dead()]
-                hectare.update_hectare(not_dead_creatures)
+                hectare.remove_dead_creatures()
 
     @property
     def forest(self) -> Forest:
         """Returns data container forest"""
         return self._forest
 
+    def take_changed_hectares(self) -> Set[Tuple[int, int]]:
+        """Returns positions of hectares where creatures were added, removed or died since previous call
+
+        If it is called after every cycle - hectares changed by the last cycle. Amount and ids of creatures of other
+        hectares are the same
+        """
+        return self._forest.take_dirty_positions()
+
     def remove_creature(self, creature_id: str) -> None:
         """Removes creature from ecosystem
 
         creature_id - id of creature to remove
         raise ValueError if creature is not exists
         """
-        for hectare_line in self.forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if isinstance(creature, Reproduction) and creature_id == creature.id:
-                        hectare.creations.remove(creature)
-                        return
-        raise ValueError(f"No creature with id {creature_id}")
+        creature = self._forest.find_by_id(creature_id)
+        if creature is None:
+            raise ValueError(f"No creature with id {creature_id}")
+        self._forest.hectare_of(creature).remove_creature(creature)
 
     def fill_creatures(self, creature_type: str, creature_amount: int, hectare_number: Tuple[int, int]) -> None:
         """Adds creatures to ecosystem
@@ -393,22 +465,14 @@ class EcoSystem:
                 not 0 <= hectare_number[1] < self.forest.horizontal_length:
             raise IndexError("Hectare out of forest")
         creature_type = creature_type.lower()
-        if creature_type == configs.EnglishCreaturesNames.BLUEBERRY.value:
-            creatures = [Blueberry() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.HAZEL.value:
-            creatures = [Hazel() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.MAPLE.value:
-            creatures = [Maple() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.BOAR.value:
-            creatures = [Boar() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.ELK.value:
-            creatures = [Elk() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.WOLF.value:
-            creatures = [Wolf() for _ in range(creature_amount)]
-        elif creature_type == configs.EnglishCreaturesNames.BEAR.value:
-            creatures = [Bear() for _ in range(creature_amount)]
-        else:
+        try:
+            kind = species_registry.entry_by_name(creature_type).kind
+        except KeyError:
             raise TypeError(f"Incorrect type of creature: {creature_type}")
+        with random_streams.activated(self._random):
+            creatures = [kind() for _ in range(creature_amount)]
+        if issubclass(kind, GenderReproduction):
+            self._pedigree.record_creatures(creatures)
         self.forest.hectares[hectare_number[0]][hectare_number[1]].extend_hectare(creatures)
 
     @property
@@ -421,25 +485,59 @@ class EcoSystem:
         """Sets new filename
 
         new_filename - new file to save ecosystem
-        raise ValueError if type of file is not .json
+        raise ValueError if type of file is not .json, .ndjson or .fsnap
         """
-        if not new_filename.endswith(".json"):
-            raise ValueError(f"Unknown type of file: {new_filename} (expected \".json\")")
+        if not new_filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+            raise ValueError(f"Unknown type of file: {new_filename} "
+                             f"(expected {' or '.join(configs.SAVE_FILE_EXTENSIONS)})")
         self._filename = new_filename
 
-    def load(self, filename):
+    def load(self, filename, install_id_counters=True):
         """Loads ecosystem from file
 
-        filename - .json file to load ecosystem from
-        raise ValueError if type of file is not .json
+        filename - .json, .ndjson or .fsnap file to load ecosystem from (binary snapshot, streaming save or legacy
+            json save, format is defined by content of file)
+        install_id_counters - False to keep id counters of loaded world until install_id_counters()
+        raise ValueError if type of file is not .json, .ndjson or .fsnap
+        Streaming save is read line by line, creatures of binary snapshot are made directly from columns of file
+        mapped to memory, creatures are emplaced into hectares as soon as they are read
         """
-        if not filename.endswith(".json"):
-            raise ValueError(f"Unknown type of file: {filename} (expected \".json\")")
-        with open(filename, "r") as save_file:
-            loaded_info = json.load(save_file)
-            ecosystem_info = loaded_info[0]
-            unpack_dict_flag = True
-            self.__init__(filename, unpack_dict_flag, *loaded_info[1:], **ecosystem_info)
+        if not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+            raise ValueError(f"Unknown type of file: {filename} (expected {' or '.join(configs.SAVE_FILE_EXTENSIONS)})")
+        self.stop_journal()
+        unpack_dict_flag = True
+        if save_journal.has_journal(filename):
+            ecosystem_info, id_counters, _, creature_info_dicts, kinship = save_journal.replay(filename)
+            self.__init__(filename, unpack_dict_flag, id_counters, *creature_info_dicts, pedigree=kinship.pack(),
+                          install_id_counters=install_id_counters, **ecosystem_info)
+            return
+        if binary_snapshot.is_binary_snapshot(filename):
+            save_reader_type = binary_snapshot.BinarySnapshotReader
+        elif streaming_save.is_ndjson_save(filename):
+            save_reader_type = streaming_save.NdjsonSaveReader
+        else:
+            save_reader_type = None
+        if save_reader_type is not None:
+            with save_reader_type(filename) as save_reader:
+                ecosystem_info = dict(save_reader.ecosystem_info)
+                if save_reader.pedigree is not None:
+                    ecosystem_info["pedigree"] = save_reader.pedigree
+                self.__init__(filename, unpack_dict_flag, save_reader.id_counters,
+                              install_id_counters=install_id_counters, **ecosystem_info)
+                if save_reader_type is binary_snapshot.BinarySnapshotReader:
+                    for (i, j), creatures in save_reader.hectare_creatures():
+                        self._pedigree.record_creatures(creature for creature in creatures
+                                                        if isinstance(creature, GenderReproduction))
+                        self._forest.hectares[i][j].extend_hectare(creatures)
+                else:
+                    for creature_info_dict in save_reader.records():
+                        self._unpack_creature(creature_info_dict)
+        else:
+            with open(filename, "r") as save_file:
+                loaded_info = json.load(save_file)
+                ecosystem_info = loaded_info[0]
+                self.__init__(filename, unpack_dict_flag, *loaded_info[1:], install_id_counters=install_id_counters,
+                              **ecosystem_info)
 
     def _pack_general_data(self) -> List:
         """Emplace params of ecosystem to dict (used to save ecosystem)"""
@@ -448,17 +546,11 @@ class EcoSystem:
                 "deadly_worm_sleep_interval": self._deadly_worm_sleep_interval,
                 "deadly_worm_sleep_counter": self._deadly_worm_sleep_counter,
                 "forest_horizontal_length": self._forest.horizontal_length,
-                "forest_vertical_length": self._forest.vertical_length
+                "forest_vertical_length": self._forest.vertical_length,
+                "random_state": self._random.pack_state(),
+                "periods_count": self._periods_count
             },
-            {
-                "blueberry_id_counter": Blueberry.get_id_counter(),
-                "hazel_id_counter": Hazel.get_id_counter(),
-                "maple_id_counter": Maple.get_id_counter(),
-                "boar_id_counter": Boar.get_id_counter(),
-                "elk_id_counter": Elk.get_id_counter(),
-                "wolf_id_counter": Wolf.get_id_counter(),
-                "bear_id_counter": Bear.get_id_counter()
-            }
+            {entry.id_counter_key: entry.kind.get_id_counter() for entry in species_registry.entries()}
         ]
 
     def _define_autosave_file(self) -> str:
@@ -471,31 +563,150 @@ class EcoSystem:
             filename_indexes.append(0)
         return f"{configs.BASIC_SAVES_DIR_LINUX_PATH}autosave{max(filename_indexes) + 1}.json"
 
-    def save(self, filename="") -> None:
-        """Saves ecosystem
+    @staticmethod
+    def _creature_record(creature, position: Tuple[int, int]) -> Dict:
+        """Makes dict of creature with its position (used to save ecosystem)"""
+        creature_info = EcoSystem._save_creature_to_dict(creature)
+        creature_info["position"] = position
+        return creature_info
 
-        filename - .json file to save ecosystem
-        raise ValueError if filename is not .json file
+    def _creature_records(self):
+        """Generates dicts of creatures with their positions hectare by hectare (used to save ecosystem)"""
+        for i, hectare_line in enumerate(self.forest.hectares):
+            for j, hectare in enumerate(hectare_line):
+                for creature in hectare.creations:
+                    if isinstance(creature, Animal) or isinstance(creature, Plant):
+                        yield EcoSystem._creature_record(creature, (i, j))
+
+    def start_journal(self, filename="", compaction_interval=configs.JOURNAL_COMPACTION_INTERVAL) -> None:
+        """Saves ecosystem and turns on journal mode: next saves to this file append only changes to journal
+
+        filename - .json or .ndjson file to save ecosystem (default - file of ecosystem or new autosave file)
+        compaction_interval - amount of saves after which journal is merged into save in background thread
+            (0 - journal is not merged)
+        raise ValueError if filename is not .json or .ndjson file or compaction_interval < 0
+        Save with journal is loaded by load as usual (journal is applied to save)
+        """
+        filename = self.save_filename(filename)
+        journal = SaveJournal(filename, compaction_interval)
+        self.stop_journal()
+        journal.start(self._forest, self._pedigree, self._periods_count, *self._pack_general_data(),
+                      EcoSystem._creature_record)
+        self._journal = journal
+        self._filename = filename
+
+    def stop_journal(self) -> None:
+        """Turns off journal mode (waits for background compaction, save and its journal stay loadable)"""
+        if self._journal is not None:
+            self._journal.wait_for_compaction()
+            self._forest.track_changes(False)
+            self._pedigree.track_records(False)
+            self._journal = None
+
+    @property
+    def journal_active(self) -> bool:
+        """Returns True if saves of ecosystem to its file append changes to journal"""
+        return self._journal is not None
+
+    def save_filename(self, filename="") -> str:
+        """Returns file that save(filename) writes to (file of ecosystem or new autosave file if filename is empty)
+
+        raise ValueError if filename is not .json, .ndjson or .fsnap file
         """
         if not filename:
             filename = self._filename if self._filename else self._define_autosave_file()
-        if not filename.endswith(".json"):
-            raise ValueError(f"Unknown type of file: {filename} (expected \".json\")")
-        res_lst = self._pack_general_data()
-        i = 0
-        for hectare_line in self.forest.hectares:
-            j = 0
-            for hectare in hectare_line:
-                if hectare.creations:
-                    for creature in hectare.creations:
-                        if isinstance(creature, Animal) or isinstance(creature, Plant):
-                            creature_info = EcoSystem._save_creature_to_dict(creature)
-                            creature_info["position"] = (i, j)
-                            res_lst.append(creature_info)
-                j += 1
-            i += 1
-        with open(filename, "w") as save_file:
-            json.dump(res_lst, save_file, indent="\t")
+        if not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+            raise ValueError(f"Unknown type of file: {filename} (expected {' or '.join(configs.SAVE_FILE_EXTENSIONS)})")
+        return filename
+
+    def save(self, filename="") -> None:
+        """Saves ecosystem
+
+        filename - .json, .ndjson or .fsnap file to save ecosystem
+        raise ValueError if filename is not .json, .ndjson or .fsnap file
+        .json and .ndjson saves are streaming: header line with parameters of ecosystem and then one line per
+        creature, written hectare by hectare (whole world is never kept in memory as one json document)
+        .fsnap save is binary snapshot: packed fixed-width columns of creatures with integer ids
+        In journal mode (start_journal) save to file of journal appends only creatures that were created, changed,
+        moved or removed since previous save
+        """
+        filename = self.save_filename(filename)
+        ecosystem_info, id_counters = self._pack_general_data()
+        if self._journal is not None and filename == self._journal.filename:
+            self._journal.append(self._forest, self._pedigree, self._periods_count, ecosystem_info, id_counters,
+                                 EcoSystem._creature_record)
+            return
+        EcoSystem.write_save(filename, ecosystem_info, id_counters, self._creatures_for_save(filename),
+                             self._pedigree.pack())
+
+    def _creatures_for_save(self, filename: str):
+        """Returns creatures packed for save to file: columns for binary snapshot, generator of dicts for other saves"""
+        if filename.endswith(configs.BINARY_SNAPSHOT_EXTENSION):
+            return binary_snapshot.pack_forest(self._forest)
+        return self._creature_records()
+
+    def snapshot_for_save(self, filename="") -> Tuple[Dict, Dict, object, Dict]:
+        """Returns consistent copy of ecosystem for save: (general parameters, id counters, creatures, packed
+        pedigree)
+
+        filename - file the snapshot is written to (creatures of .fsnap file are packed into columns, creatures of
+            other files - into list of dicts)
+        Snapshot doesn't depend on ecosystem, so it can be written by write_save in other thread while ecosystem
+        keeps changing
+        """
+        ecosystem_info, id_counters = self._pack_general_data()
+        creatures = self._creatures_for_save(filename)
+        if not isinstance(creatures, binary_snapshot.SnapshotColumns):
+            creatures = list(creatures)
+        return ecosystem_info, id_counters, creatures, self._pedigree.pack()
+
+    @staticmethod
+    def write_save(filename: str, ecosystem_info: Dict, id_counters: Dict, creature_info_dicts, pedigree=None,
+                   progress=None) -> None:
+        """Writes save of ecosystem (format is defined by type of file as in save)
+
+        filename - .json, .ndjson or .fsnap file
+        ecosystem_info, id_counters - general parameters and id counters of ecosystem
+        creature_info_dicts - dicts of creatures with positions (list of snapshot or generator) or columns of
+            creatures packed for binary snapshot
+        pedigree - packed pedigree of ecosystem (None - pedigree is made again from parents of animals on load)
+        progress - function that gets percent of written creatures (called only if amount of creatures is known)
+        raise ValueError if filename is not .json, .ndjson or .fsnap file
+        """
+        if not filename.endswith(configs.SAVE_FILE_EXTENSIONS):
+            raise ValueError(f"Unknown type of file: {filename} (expected {' or '.join(configs.SAVE_FILE_EXTENSIONS)})")
+        if progress is not None and isinstance(creature_info_dicts, list):
+            creature_info_dicts = EcoSystem._reporting_progress(creature_info_dicts, progress)
+        save_journal.remove_journal(filename)  # Old journal of file must not be applied to the new save
+        if filename.endswith(configs.BINARY_SNAPSHOT_EXTENSION):
+            if not isinstance(creature_info_dicts, binary_snapshot.SnapshotColumns):
+                creature_info_dicts = binary_snapshot.pack_records(creature_info_dicts)
+            binary_snapshot.write_binary_snapshot(filename, ecosystem_info, id_counters, creature_info_dicts, pedigree)
+            if progress is not None:
+                progress(100)
+        elif isinstance(creature_info_dicts, binary_snapshot.SnapshotColumns):
+            raise ValueError(f"Columns of creatures are written only to binary snapshot, {filename} got instead")
+        else:
+            streaming_save.write_ndjson_save(filename, ecosystem_info, id_counters, creature_info_dicts,
+                                             pedigree=pedigree)
+
+    @staticmethod
+    def _reporting_progress(creature_info_dicts: List[Dict], progress):
+        """Generates dicts of creatures and reports percent of generated ones (each SAVE_PROGRESS_STEP creatures)"""
+        total = len(creature_info_dicts)
+        for number, creature_info in enumerate(creature_info_dicts, 1):
+            yield creature_info
+            if number % configs.SAVE_PROGRESS_STEP == 0 or number == total:
+                progress(number * 100 // total)
+
+    def adopt(self, other: "EcoSystem") -> None:
+        """Replaces world of this ecosystem with world of other ecosystem (other must not be used after it)
+
+        Used to swap in world that was loaded in other thread: objects that keep this ecosystem see new world at once
+        """
+        self.stop_journal()
+        self._close_resident_tiles()
+        self.__dict__ = other.__dict__.copy()
 
     def find_creature(self, creature_id):
         """Finds creature in forest
@@ -506,12 +717,19 @@ class EcoSystem:
         """
         if creature_id == configs.GuiMessages.WASTELAND_CREATURES_INFO.value:
             return configs.GuiMessages.WASTELAND_CREATURES_INFO
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if (isinstance(creature, Animal) or isinstance(creature, Plant)) and creature_id == creature.id:
-                        return creature
-        return None
+        return self._forest.find_by_id(creature_id)
+
+    def find_creature_hectare(self, creature_id: str) -> Tuple[int, int]:
+        """Returns number of hectare where creature is located
+
+        creature_id - id of creature to find
+        returns Tuple(vertical_number_of_hectare, horizontal_number_of_hectare)
+        raise ValueError if creature is not exists
+        """
+        creature = self._forest.find_by_id(creature_id)
+        if creature is None:
+            raise ValueError(f"No creature with id {creature_id}")
+        return self._forest.find_position(creature)
 
     def console_creature_stats(self, creature_id) -> str:
         """Returns str with stats of creature
@@ -521,12 +739,64 @@ class EcoSystem:
 
         used in console mode
         """
-        for hectare_line in self._forest.hectares:
-            for hectare in hectare_line:
-                for creature in hectare.creations:
-                    if (isinstance(creature, Animal) or isinstance(creature, Plant)) and creature_id == creature.id:
-                        return creature.stats()
-        raise ValueError(f"No creature with id {creature_id}")
+        creature = self._forest.find_by_id(creature_id)
+        if creature is None:
+            raise ValueError(f"No creature with id {creature_id}")
+        return creature.stats()
+
+    def _find_animal(self, creature_id: str):
+        """Returns animal with id (creature with pedigree)
+
+        raise ValueError if creature is not exists or it is not an animal
+        """
+        creature = self._forest.find_by_id(creature_id)
+        if creature is None:
+            raise ValueError(f"No creature with id {creature_id}")
+        if not isinstance(creature, GenderReproduction):
+            raise ValueError(f"Creature {creature_id} has no pedigree (only animals have parents)")
+        return creature
+
+    def creature_ancestors(self, creature_id: str, generations=configs.PEDIGREE_GENERATIONS) -> List[List[str]]:
+        """Returns ids of ancestors of animal by generations (the first list - parents, then grandparents...)
+
+        creature_id - id of animal
+        generations - amount of generations to show
+        raise ValueError if creature is not exists or it is not an animal
+        """
+        return self._pedigree.ancestors(self._find_animal(creature_id), generations)
+
+    def creature_descendants(self, creature_id: str, generations=configs.PEDIGREE_GENERATIONS) -> List[List[str]]:
+        """Returns ids of descendants of animal by generations (the first list - children, then grandchildren...)
+
+        creature_id - id of animal
+        generations - amount of generations to show
+        raise ValueError if creature is not exists or it is not an animal
+        """
+        return self._pedigree.descendants(self._find_animal(creature_id), generations)
+
+    def are_relatives(self, first_id: str, second_id: str, generations=configs.KINSHIP_GENERATIONS) -> bool:
+        """Defines if animals are relatives within generations (animals of different kinds are not relatives)
+
+        raise ValueError if creature is not exists or it is not an animal
+        """
+        return self._pedigree.related(self._find_animal(first_id), self._find_animal(second_id), generations)
+
+    def console_pedigree(self, creature_id: str, generations=configs.PEDIGREE_GENERATIONS) -> str:
+        """Returns str with ancestors and descendants of animal by generations
+
+        raise ValueError if creature is not exists or it is not an animal
+
+        used in console mode and in creature stats dialog
+        """
+        res_str = f"Pedigree of {creature_id}\n"
+        for title, generations_ids in (("Ancestors", self.creature_ancestors(creature_id, generations)),
+                                       ("Descendants", self.creature_descendants(creature_id, generations))):
+            res_str += f"{title}:\n"
+            if not generations_ids:
+                res_str += "    none\n"
+            for generation, ids in enumerate(generations_ids, 1):
+                res_str += f"    {generation}: {', '.join(ids)}\n"
+        return res_str
 
     def get_creature_icon_file(self, creature) -> str:
         """Returns file with icon for creature stats dialog
@@ -537,7 +807,7 @@ class EcoSystem:
         """
         if creature.is_dead():
             return configs.CREATURES_ICONS["grave_icon"]
-        return configs.CREATURES_ICONS[f"{self._define_creature_type(creature)}_icon"]
+        return species_registry.entry_of(creature).icon
 
     @staticmethod
     def define_reproduction_type(creature) -> configs.ReproductionType:
@@ -560,22 +830,10 @@ class EcoSystem:
         creature_russian_name - russian name of creature type
         raise ValueError if creature has unexpected type
         """
-        if creature_russian_name == configs.RussianCreaturesNames.BLUEBERRY.value:
-            return configs.EnglishCreaturesNames.BLUEBERRY.value
-        elif creature_russian_name == configs.RussianCreaturesNames.HAZEL.value:
-            return configs.EnglishCreaturesNames.HAZEL.value
-        elif creature_russian_name == configs.RussianCreaturesNames.MAPLE.value:
-            return configs.EnglishCreaturesNames.MAPLE.value
-        elif creature_russian_name == configs.RussianCreaturesNames.BOAR.value:
-            return configs.EnglishCreaturesNames.BOAR.value
-        elif creature_russian_name == configs.RussianCreaturesNames.ELK.value:
-            return configs.EnglishCreaturesNames.ELK.value
-        elif creature_russian_name == configs.RussianCreaturesNames.WOLF.value:
-            return configs.EnglishCreaturesNames.WOLF.value
-        elif creature_russian_name == configs.RussianCreaturesNames.BEAR.value:
-            return configs.EnglishCreaturesNames.BEAR.value
-        else:
-            ValueError(f"Unknown type of creature: {creature_russian_name}")
+        try:
+            return species_registry.entry_by_russian_name(creature_russian_name).english_name
+        except KeyError:
+            raise ValueError(f"Unknown type of creature: {creature_russian_name}")
 
     @staticmethod
     def define_creature_kind(creature) -> str:
@@ -618,16 +876,43 @@ class EcoSystem:
             raise ValueError(f"Неизвестный тип существ: {type(creature)}")
 
     def count_creatures_amount(self) -> int:
-        """Counts amount of creatures in forest
+        """Counts amount of creatures in forest (alive and dead)"""
+        return sum(alive + dead for alive, dead in self._population().values())
 
-        raise TypeError if creature\'s type not defined
+    @staticmethod
+    def _summarize_population(population: Dict[type, Tuple[int, int]]) -> Dict[str, Dict[str, int]]:
+        """Returns {english name of kind: {"alive": amount, "dead": amount}} for every kind of creatures"""
+        summary = {entry.english_name: {"alive": 0, "dead": 0} for entry in species_registry.entries()}
+        for kind, (alive_amount, dead_amount) in population.items():
+            kind_summary = summary[species_registry.entry_of_kind(kind).english_name]
+            kind_summary["alive"] += alive_amount
+            kind_summary["dead"] += dead_amount
+        return summary
+
+    def population_summary(self) -> Dict[str, Dict[str, int]]:
+        """Returns amounts of alive and dead creatures of every kind in forest (live counters are used, no scan)
+
+        returns {english name of kind: {"alive": amount, "dead": amount}}
         """
-        creatures_counter = 0
-        for i in range(self._forest.vertical_length):
-            for j in range(self._forest.horizontal_length):
-                for k in range(len(self._forest.hectares[i][j].creations)):
-                    self._define_creature_type(self._forest.hectares[i][j].creations[k])
-                    creatures_counter += 1
-        return creatures_counter
+        return self._summarize_population(self._population())
 
+    def hectare_population_summary(self, hectare_number: Tuple[int, int]) -> Dict[str, Dict[str, int]]:
+        """Returns amounts of alive and dead creatures of every kind in hectare (live counters are used, no scan)
 
+        hectare_number - (vertical number, horizontal number) of hectare
+        returns {english name of kind: {"alive": amount, "dead": amount}}
+        raise IndexError if number of hectare is out of length of forest
+        """
+        if not 0 <= hectare_number[0] < self.forest.vertical_length or\
+                not 0 <= hectare_number[1] < self.forest.horizontal_length:
+            raise IndexError("Hectare out of forest")
+        return self._summarize_population(self._forest.hectares[hectare_number[0]][hectare_number[1]].population())
+
+    def console_population_summary(self) -> str:
+        """Returns table with amounts of alive and dead creatures of every kind in forest"""
+        res_str = f"{'kind':<12}{'alive':>10}{'dead':>10}\n"
+        for kind_name, kind_summary in self.population_summary().items():
+            res_str += f"{kind_name:<12}{kind_summary['alive']:>10}{kind_summary['dead']:>10}\n"
+        res_str += f"{'total':<12}{self._forest.count_creatures(alive=True):>10}" \
+                   f"{self._forest.count_creatures(alive=False):>10}"
+        return res_str
@@ -1,18 +1,19 @@
 #Author Vodohleb04
-import random
+import random_streams
 from typing import List
 import configs
+import creature_ids
+import species_registry
 from animal_types_interfaces import Herbivore
 from forest import Hectare
 
 
+@species_registry.species(configs.EnglishCreaturesNames.ELK.value, configs.RussianCreaturesNames.ELK.value)
 class Elk(Herbivore):
+    __slots__ = ()
 
-    _life_median = configs.LifeMedian.ELK_LM.value
-    _reproduction_age_interval = configs.ReproductionAgeInterval.ELK_RAI.value
+    _id_prefix = configs.IdPrefix.ELK_PREF.value
     _id_counter = 0
-    _hunger_per_cycle = configs.HungerPerCycle.ELK_HPC.value
-    _required_nutritional_value = configs.RequiredNutritionalValue.ELK_RNV.value
 
     @staticmethod
     def rewrite_id_counter(new_id_counter: int) -> None:
@@ -33,11 +34,12 @@ class Elk(Herbivore):
         """Returns the value of id_counter"""
         return Elk._id_counter
 
-    def __init__(self, mother_name=configs.CREATOR, father_name=configs.CREATOR, unpack_dict_flag=False, info_d=None):
+    def __init__(self, mother_number=creature_ids.CREATOR_NUMBER, father_number=creature_ids.CREATOR_NUMBER,
+                 unpack_dict_flag=False, info_d=None):
         """Creates elk
 
-        mother_name - id of mother (default - CREATOR from config)
-        father_name - id of mother (default - CREATOR from config)
+        mother_number - number of mother (default - CREATOR_NUMBER, creature is created by CREATOR)
+        father_number - number of father (default - CREATOR_NUMBER, creature is created by CREATOR)
         unpack_dict_flag - True when needs to unpack creature from dict
         info_dict - dict with parameters of creature
         """
@@ -45,70 +47,55 @@ class Elk(Herbivore):
             if not info_d:
                 raise ValueError
             super()._unpack_info_from_dict(info_d)
-            Elk._id_counter += 1
             return
 
         self._gender = super()._random_gender()
         if self._gender == configs.Genders.MALE:
-            ppcp_by_gender = configs.PersonalPowerCoefficientParameters.M_ELK_PPCP
+            ppcp_by_gender = self._male_personal_power_coefficient
         else:
-            ppcp_by_gender = configs.PersonalPowerCoefficientParameters.FEM_ELK_PPCP
+            ppcp_by_gender = self._female_personal_power_coefficient
         super()._make_power_coefficient(ppcp_by_gender)
-        self._damage = configs.Damage.ELK_D.value * self._power_coefficient
+        self._damage = self._base_damage * self._power_coefficient
         self._age = 0
-        self._hp = configs.MaxHP.ELK_MHP.value
-        self._nutritional_value = configs.NutritionalValue.ELK_NV.value
+        self._hp = self._max_hp
+        self._nutritional_value = self._start_nutritional_value
         self._food_energy = self._hunger_per_cycle * 2
-        self._id = self._gender.value + "_" + configs.IdPrefix.ELK_PREF.value + "_" + str(self._id_counter)
+        self._number = self._id_counter
         Elk._id_counter += 1
         self._sterile_period = self._reproduction_age_interval[0]
-        self._parents = (mother_name, father_name)
+        self._mother = mother_number
+        self._father = father_number
 
     def _produce_children(self, partner) -> List:
         if partner:
-            min_numb, max_numb = configs.ChanceToProduceKids.ELK_CTPK.value
-            chance_to_produce = random.randint(min_numb, max_numb)
+            min_numb, max_numb = self._chance_to_produce_kids
+            chance_to_produce = random_streams.randint(min_numb, max_numb)
             if chance_to_produce == 1:
-                min_amount, max_amount = configs.PossibleKidsAmount.ELK_PKA.value
-                kids_amount = random.randint(min_amount, max_amount)
-                self._sterile_period = configs.SterilePeriods.ELK_SP.value
-                partner._sterile_period = configs.SterilePeriods.ELK_SP.value
-                mother_name = self.id if self.gender == configs.Genders.FEMALE else partner.id
-                father_name = self.id if self.gender == configs.Genders.MALE else partner.id
-                return [Elk(mother_name=mother_name, father_name=father_name) for _ in range(kids_amount)]
+                min_amount, max_amount = self._possible_kids_amount
+                kids_amount = random_streams.randint(min_amount, max_amount)
+                self._sterile_period = self._kids_sterile_period
+                partner._sterile_period = self._kids_sterile_period
+                self._mark_changed()
+                partner._mark_changed()
+                mother_number = self._number if self.gender == configs.Genders.FEMALE else partner._number
+                father_number = self._number if self.gender == configs.Genders.MALE else partner._number
+                return [Elk(mother_number=mother_number, father_number=father_number) for _ in range(kids_amount)]
         return []
 
-    def _can_produce_children(self, partner) -> bool:
+    def _can_produce_children(self, partner, kinship) -> bool:
         if isinstance(self, Elk) and isinstance(partner, Elk):
-            return super()._can_produce_children(partner)
+            return super()._can_produce_children(partner, kinship)
         else:
             return False
 
-    def _search_for_partner(self, hectare: Hectare):
+    def _search_for_partner(self, hectare: Hectare, kinship):
         if not isinstance(hectare, Hectare):
             raise TypeError
-        for possible_partner in hectare.creations:
-            if isinstance(possible_partner, Elk) and self._can_produce_children(possible_partner):
+        for possible_partner in hectare.creatures_of(Elk, alive=True):
+            if self._can_produce_children(possible_partner, kinship):
                 return possible_partner
         return None
 
-    def power(self) -> float:
-        if self.is_dead():
-            return 0.0
-        if self._gender == configs.Genders.MALE:
-            start_power = configs.StartPower.M_ELK_SP.value
-            k_func_coefficient = configs.PowerFunctionCoefficient.M_ELK_PFC.value
-        else:
-            start_power = configs.StartPower.FEM_ELK_SP.value
-            k_func_coefficient = configs.PowerFunctionCoefficient.FEM_ELK_PFC.value
-
-        if self.age <= self._reproduction_age_interval[0]:  # Progression of power
-            return self._power_coefficient * (start_power + (k_func_coefficient * self.age))
-        elif self.age <= self._reproduction_age_interval[1]:  # Maximal power (const)
-            return self._power_coefficient * (start_power + (k_func_coefficient * self._reproduction_age_interval[0]))
-        else:  # Regression of power
-            return self._power_coefficient * (start_power + (-k_func_coefficient * self._reproduction_age_interval[0]))
-
     def stats(self) -> str:
         return " Kingdom: Animal" \
                "Type: Herbivore" \
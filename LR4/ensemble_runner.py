@@ -0,0 +1,203 @@
+#Author Vodohleb04
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import configs
+import species_profiles
+import species_registry
+from ecosystem import EcoSystem
+
+
+SPECIES = [entry.english_name for entry in species_registry.entries()]
+PERCENTILES = (5, 50, 95)
+
+
+def count_alive_by_species(ecosystem: EcoSystem) -> Dict[str, int]:
+    """Returns amount of alive creatures of every species of ecosystem"""
+    summary = ecosystem.population_summary()
+    return {species: summary[species]["alive"] for species in SPECIES}
+
+
+def _population_row(replica: int, seed: int, cycle: int, ecosystem: EcoSystem) -> Dict:
+    """Returns row of ensemble output: populations of species of replica after cycle"""
+    populations = count_alive_by_species(ecosystem)
+    return {"replica": replica, "seed": seed, "cycle": cycle, **populations, "total": sum(populations.values())}
+
+
+def run_replica(task: Tuple[int, int, int, Optional[str], Optional[Dict], Optional[Dict]]) -> List[Dict]:
+    """Runs one world of ensemble and returns its populations after every cycle (cycle 0 - start of world)
+
+    task - (replica number, seed, amount of cycles, .json file of world to start from or None, parameters of new world,
+        profiles of species or None to keep active profiles)
+    """
+    replica, seed, cycles, world_file, parameters, profiles = task
+    if profiles is not None:
+        species_profiles.activate(profiles)
+    if world_file:
+        ecosystem = EcoSystem.from_file(world_file)
+        ecosystem.reseed(seed)
+    else:
+        ecosystem = EcoSystem(seed=seed, **parameters)
+    rows = [_population_row(replica, seed, 0, ecosystem)]
+    for cycle in range(1, cycles + 1):
+        ecosystem.cycle()
+        rows.append(_population_row(replica, seed, cycle, ecosystem))
+    return rows
+
+
+class EnsembleWriter:
+
+    def __init__(self, filename: str):
+        """Creates writer of populations of ensemble
+
+        filename - .csv or .ndjson (.jsonl) file, rows are written as soon as replica is finished
+        raise ValueError if type of file is unknown
+        """
+        if filename.endswith(".csv"):
+            self._ndjson = False
+        elif filename.endswith(".ndjson") or filename.endswith(".jsonl"):
+            self._ndjson = True
+        else:
+            raise ValueError(f"Unknown type of file: {filename} (expected .csv, .ndjson or .jsonl)")
+        self._file = open(filename, "w", newline="")
+        self._csv_writer = None
+        if not self._ndjson:
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=["replica", "seed", "cycle", *SPECIES, "total"])
+            self._csv_writer.writeheader()
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        """Writes populations of one replica"""
+        for row in rows:
+            if self._ndjson:
+                self._file.write(json.dumps({"replica": row["replica"], "seed": row["seed"], "cycle": row["cycle"],
+                                             "populations": {species: row[species] for species in SPECIES},
+                                             "total": row["total"]}) + "\n")
+            else:
+                self._csv_writer.writerow(row)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes file of writer"""
+        self._file.close()
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Returns percentile of sorted values (linear interpolation between closest ranks)"""
+    if not sorted_values:
+        raise ValueError("Percentile of empty sequence")
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def aggregate(final_rows: List[Dict]) -> Dict[str, Dict[str, float]]:
+    """Returns statistics of final populations of replicas for every species and total amount of creatures
+
+    Statistics - mean, percentiles (p5, p50, p95) and extinction probability (part of replicas where no alive
+    creature of species is left)
+    """
+    statistics = {}
+    for column in [*SPECIES, "total"]:
+        values = sorted(row[column] for row in final_rows)
+        column_statistics = {"mean": sum(values) / len(values)}
+        for percent in PERCENTILES:
+            column_statistics[f"p{percent}"] = percentile(values, percent)
+        column_statistics["extinction_probability"] = sum(1 for value in values if value == 0) / len(values)
+        statistics[column] = column_statistics
+    return statistics
+
+
+def run_ensemble(replicas: int, cycles: int, seed=0, world_file=None, parameters=None, output=None,
+                 processes=None, profiles=None) -> Dict[str, Dict[str, float]]:
+    """Runs replicas independent worlds for cycles cycles and returns statistics of their final populations
+
+    replicas - amount of worlds
+    cycles - amount of cycles of every world
+    seed - seed of the first replica (replica number i gets seed + i)
+    world_file - .json file of world to start from, if None - world is created from parameters
+    parameters - parameters of new world (default - BASE_ECOSYSTEM_PARAMETERS from config)
+    output - .csv or .ndjson (.jsonl) file for populations of every replica after every cycle, None - not written
+    processes - amount of worker processes (default - amount of cpu), 1 - replicas are run in main process
+    profiles - profiles of species of every replica (see species_profiles), None - active profiles
+    raise ValueError if replicas < 1 or cycles < 0
+    """
+    if replicas < 1:
+        raise ValueError(f"Amount of replicas must be >= 1, {replicas} got instead")
+    if cycles < 0:
+        raise ValueError(f"Amount of cycles must be >= 0, {cycles} got instead")
+    if parameters is None:
+        parameters = configs.BASE_ECOSYSTEM_PARAMETERS
+    tasks = [(replica, seed + replica, cycles, world_file, parameters, profiles) for replica in range(replicas)]
+    writer = EnsembleWriter(output) if output else None
+    previous_profiles = species_profiles.active_profiles()
+    final_rows = []
+    try:
+        if processes == 1:
+            results = map(run_replica, tasks)
+            final_rows = _collect(results, writer)
+        else:
+            with multiprocessing.Pool(processes=processes) as pool:
+                final_rows = _collect(pool.imap(run_replica, tasks), writer)
+    finally:
+        species_profiles.activate(previous_profiles)
+        if writer is not None:
+            writer.close()
+    return aggregate(final_rows)
+
+
+def _collect(results, writer: Optional[EnsembleWriter]) -> List[Dict]:
+    """Writes rows of finished replicas and returns their final rows"""
+    final_rows = []
+    for rows in results:
+        if writer is not None:
+            writer.write_rows(rows)
+        final_rows.append(rows[-1])
+    return final_rows
+
+
+def format_statistics(statistics: Dict[str, Dict[str, float]]) -> str:
+    """Returns table of statistics of ensemble"""
+    header = f"{'species':<10}{'mean':>10}" + "".join(f"{'p' + str(percent):>10}" for percent in PERCENTILES) + \
+             f"{'extinct':>10}"
+    lines = [header]
+    for column, column_statistics in statistics.items():
+        lines.append(f"{column:<10}{column_statistics['mean']:>10.2f}" +
+                     "".join(f"{column_statistics['p' + str(percent)]:>10.1f}" for percent in PERCENTILES) +
+                     f"{column_statistics['extinction_probability']:>10.3f}")
+    return "\n".join(lines)
+
+
+def main(*args):
+    """Runs ensemble from command line
+
+    Possible args:
+        --replicas | -n - amount of worlds
+        --cycles | -k - amount of cycles of every world
+        --seed | -s - seed of the first replica
+        --world | -w - .json file of world to start from (default - BASE_ECOSYSTEM_PARAMETERS from config)
+        --output | -o - .csv or .ndjson file for populations after every cycle
+        --processes | -p - amount of worker processes
+        --profiles - .json file of profiles of species (parameters that differ from config)
+    """
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo ensemble of Forest Simulator worlds")
+    parser.add_argument("--replicas", "-n", type=int, required=True)
+    parser.add_argument("--cycles", "-k", type=int, required=True)
+    parser.add_argument("--seed", "-s", type=int, default=0)
+    parser.add_argument("--world", "-w", default=None)
+    parser.add_argument("--output", "-o", default=None)
+    parser.add_argument("--processes", "-p", type=int, default=None)
+    parser.add_argument("--profiles", default=None)
+    arguments = parser.parse_args(args[1:])
+    profiles = species_profiles.load_profiles(arguments.profiles) if arguments.profiles else None
+    statistics = run_ensemble(arguments.replicas, arguments.cycles, seed=arguments.seed, world_file=arguments.world,
+                              output=arguments.output, processes=arguments.processes, profiles=profiles)
+    print(format_statistics(statistics))
+
+
+if __name__ == "__main__":
+    main(*sys.argv)
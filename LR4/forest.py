@@ -1,31 +1,234 @@
 #Author Vodohleb04
-from typing import List
+from collections import deque
+from itertools import repeat
+from typing import Dict, List, Tuple, Optional, Set
+import configs
+import creature_ids
+import species_registry
+
+
+def id_index_key(creature_id: str) -> str:
+    """Returns key of creature id in index (id of creature without suffix that is added after its death)"""
+    if creature_id.endswith(configs.DEAD_ID_SUFFIX):
+        return creature_id[:-len(configs.DEAD_ID_SUFFIX)]
+    return creature_id
 
 
 class Hectare:
 
-    def __init__(self, creations=None):
+    def __init__(self, creations=None, position=None, forest=None):
         """Creates hectare
 
         creations - creations to add to hectare, if None - creates empty Hectare
+        position - (vertical number, horizontal number) of hectare in forest
+        forest - Forest that contains this hectare (keeps index of creatures of forest), None for copy of hectare
         Minimal data container of program - emplace creatures
+        Alive creatures are also sorted into buckets by their kind (class) in order of creations (insertion ordered
+        dicts, so creature leaves its bucket in O(1) when it dies or moves), dead creatures of every kind are counted
         """
         if creations is None:
             creations = []
-        self._creations = creations
+        self._position = position
+        self._forest = forest
+        self._creations = []
+        self._alive_by_kind = {}  # kind of creatures -> {alive creature of kind: None} in order of creations
+        self._dead_by_kind = {}  # kind of creatures -> amount of dead creatures of kind
+        # Creatures of hectare whose state was changed since last take_changes of forest, None - changes are not tracked
+        self._changed_states = None
+        self.extend_hectare(creations)
 
     @property
     def creations(self) -> List:
-        """Returns list of creation, located in hectare"""
+        """Returns list of creation, located in hectare
+
+        List must not be changed directly, use append_creature, remove_creature, extend_hectare, update_hectare
+        """
         return self._creations
 
+    @property
+    def position(self) -> Tuple[int, int]:
+        """Returns (vertical number, horizontal number) of hectare in forest"""
+        return self._position
+
+    def _register(self, creature) -> None:
+        """Adds creature to the buckets of hectare and to the indexes of forest (ids and counters)"""
+        creature._hectare = self
+        kind = type(creature)
+        if creature.is_dead():
+            self._dead_by_kind[kind] = self._dead_by_kind.get(kind, 0) + 1
+        else:
+            bucket = self._alive_by_kind.get(kind)
+            if bucket is None:
+                bucket = self._alive_by_kind[kind] = {}
+            bucket[creature] = None
+        if self._forest is not None:
+            self._forest._index_creature(creature, self._position)
+
+    def _unregister(self, creature, bucket_is_updated=False) -> None:
+        """Removes creature from the buckets of hectare and from the indexes of forest (ids and counters)
+
+        bucket_is_updated - True if alive creature is already removed from its bucket
+        """
+        creature._hectare = None
+        kind = type(creature)
+        dead = creature.is_dead()
+        if dead:
+            self._dead_by_kind[kind] -= 1
+        elif not bucket_is_updated:
+            del self._alive_by_kind[kind][creature]
+        if self._forest is not None:
+            self._forest._unindex_creatures(kind, [creature], int(dead), self._position)
+
+    def _unregister_creatures(self, creatures: List, buckets_are_updated=False) -> None:
+        """Removes creatures from the buckets of hectare and from the indexes of forest (_unregister for batch of
+        creatures, counters and indexes are changed once per kind)
+
+        buckets_are_updated - True if alive creatures are already removed from their buckets
+        """
+        creatures_by_kind = {}
+        for creature in creatures:
+            creatures_by_kind.setdefault(type(creature), []).append(creature)
+        for kind, kind_creatures in creatures_by_kind.items():
+            deque(map(setattr, kind_creatures, repeat("_hectare"), repeat(None)), maxlen=0)
+            alive_creatures = [creature for creature in kind_creatures if not creature.is_dead()]
+            dead_amount = len(kind_creatures) - len(alive_creatures)
+            if dead_amount:
+                self._dead_by_kind[kind] -= dead_amount
+            if alive_creatures and not buckets_are_updated:
+                deque(map(self._alive_by_kind[kind].__delitem__, alive_creatures), maxlen=0)
+            if self._forest is not None:
+                self._forest._unindex_creatures(kind, kind_creatures, dead_amount, self._position)
+
+    def append_creature(self, creature) -> None:
+        """Adds one creature to hectare"""
+        self._creations.append(creature)
+        self._register(creature)
+
+    def remove_creature(self, creature) -> None:
+        """Removes creature from hectare
+
+        raise ValueError if creature is not located in hectare
+        """
+        self._creations.remove(creature)
+        self._unregister(creature)
+
     def update_hectare(self, creations) -> None:
         """Emplace new creations instead of already located there"""
+        self._unregister_creatures(self._creations, buckets_are_updated=True)
+        self._alive_by_kind = {}
+        self._dead_by_kind = {}
         self._creations = creations
+        for creature in self._creations:
+            self._register(creature)
 
     def extend_hectare(self, additional_creations) -> None:
         """Add new creatures to hectare without removing the of old one"""
         self._creations.extend(additional_creations)
+        for creature in additional_creations:
+            self._register(creature)
+
+    def remove_creatures(self, leaving_creatures) -> None:
+        """Removes several creatures from hectare by one pass over its creations
+
+        leaving_creatures - set (or dict) of creatures to remove, creatures that are not located in hectare are ignored
+        Only leaving creatures are unregistered, remaining creatures keep their order and registration
+        """
+        remaining_creatures = [creature for creature in self._creations if creature not in leaving_creatures]
+        if len(remaining_creatures) == len(self._creations):
+            return
+        self._unregister_creatures([creature for creature in leaving_creatures if creature._hectare is self])
+        self._creations = remaining_creatures
+
+    def remove_dead_creatures(self) -> None:
+        """Removes dead creatures of hectare (creatures that are not in alive buckets, hectare without dead creatures
+        stays unchanged)"""
+        if not any(self._dead_by_kind.values()):
+            return
+        alive_creatures = {}
+        for bucket in self._alive_by_kind.values():
+            alive_creatures.update(bucket)
+        self.remove_creatures({creature: None for creature in self._creations if creature not in alive_creatures})
+
+    def mark_changed(self, creature) -> None:
+        """Remembers that state of creature was changed (called by creature when its health, nutritional value, food
+        energy or sterile period is changed not by aging, ignored if changes are not tracked)"""
+        if self._changed_states is not None:
+            self._changed_states.add(creature)
+
+    def mark_dead(self, creature) -> None:
+        """Moves creature from alive bucket to counter of dead creatures of its kind (called when creature dies)"""
+        if self._changed_states is not None:
+            self._changed_states.add(creature)
+        kind = type(creature)
+        alive_bucket = self._alive_by_kind.get(kind)
+        if alive_bucket is not None and creature in alive_bucket:
+            del alive_bucket[creature]
+            self._dead_by_kind[kind] = self._dead_by_kind.get(kind, 0) + 1
+            if self._forest is not None:
+                self._forest._count_death(kind, self._position)
+
+    def mark_dead_creatures(self, creatures: List) -> None:
+        """Moves alive creatures of one kind from their bucket to counter of dead creatures (mark_dead for batch of
+        creatures that died at once, creatures must be located in hectare and be alive before death)"""
+        if not creatures:
+            return
+        if self._changed_states is not None:
+            self._changed_states.update(creatures)
+        kind = type(creatures[0])
+        deque(map(self._alive_by_kind[kind].__delitem__, creatures), maxlen=0)
+        self._dead_by_kind[kind] = self._dead_by_kind.get(kind, 0) + len(creatures)
+        if self._forest is not None:
+            self._forest._count_death(kind, self._position, len(creatures))
+
+    def _kinds_of(self, category: type) -> List[type]:
+        """Returns kinds of creatures of hectare that are subclasses of category"""
+        kinds = [kind for kind, bucket in self._alive_by_kind.items() if bucket and issubclass(kind, category)]
+        kinds.extend(kind for kind, amount in self._dead_by_kind.items()
+                     if amount and kind not in kinds and issubclass(kind, category))
+        return kinds
+
+    def creatures_of(self, category: type, alive: Optional[bool] = None) -> List:
+        """Returns creatures of hectare that are instances of category
+
+        category - class of creatures (kind: Wolf, Blueberry...; kingdom: Animal, Plant; type of nutrition...)
+        alive - True to get only alive creatures, False to get only dead creatures, None to get all of them
+        Creatures are returned in order of creations of hectare
+        """
+        if alive is True:
+            buckets = [bucket for kind, bucket in self._alive_by_kind.items() if bucket and issubclass(kind, category)]
+            if len(buckets) <= 1:
+                return list(buckets[0]) if buckets else []  # Alive creatures of kind are in order of creations
+        kinds = set(self._kinds_of(category))
+        if not kinds:
+            return []
+        if alive is None:
+            return [creature for creature in self._creations if type(creature) in kinds]
+        return [creature for creature in self._creations if type(creature) in kinds and creature.is_dead() != alive]
+
+    def count_of(self, category: type, alive: Optional[bool] = None) -> int:
+        """Returns amount of creatures of hectare that are instances of category
+
+        category - class of creatures (kind: Wolf, Blueberry...; kingdom: Animal, Plant; type of nutrition...)
+        alive - True to count only alive creatures, False to count only dead creatures, None to count all of them
+        """
+        amount = 0
+        if alive is not False:
+            amount += sum(len(bucket) for kind, bucket in self._alive_by_kind.items() if issubclass(kind, category))
+        if alive is not True:
+            amount += sum(count for kind, count in self._dead_by_kind.items() if issubclass(kind, category))
+        return amount
+
+    def population(self) -> Dict[type, Tuple[int, int]]:
+        """Returns (amount of alive creatures, amount of dead creatures) for every kind of creatures of hectare"""
+        kinds = list(self._alive_by_kind) + [kind for kind in self._dead_by_kind if kind not in self._alive_by_kind]
+        return {kind: (len(self._alive_by_kind.get(kind, ())), self._dead_by_kind.get(kind, 0)) for kind in kinds}
+
+    def __getstate__(self) -> dict:
+        """Copies of hectare are detached from forest and don't track changes (forest relinks its own hectares)"""
+        state = self.__dict__.copy()
+        state["_forest"] = None
+        state["_changed_states"] = None
+        return state
 
 
 class Forest:
@@ -39,10 +242,32 @@ class Forest:
             N = vertical_length
             M = horizontal_length
             Every part of matrix is a Hectare. All manipulations implemented in EcoSystem. All data saved in this class.
+        Forest keeps index kind -> number of creature -> creature and counters of alive and dead creatures of every
+        kind, hectares keep them up to date (creature knows its hectare, ids are formatted only when they are shown)
         """
         self._vertical_length = vertical_length
         self._horizontal_length = horizontal_length
-        self._hectares = [[Hectare() for _ in range(horizontal_length)] for _ in range(vertical_length)]
+        self._creatures_by_number = {}  # kind of creatures -> number of creature -> creature
+        self._alive_counts = {}  # kind of creatures -> amount of alive creatures
+        self._dead_counts = {}  # kind of creatures -> amount of dead creatures
+        # (added or removed creatures, positions of hectares where creatures were added or removed) since last
+        # take_changes, None - changes are not tracked (creatures with changed state are kept by their hectares)
+        self._changes = None
+        # Positions of hectares where creatures were added, removed or died since last take_dirty_positions
+        self._dirty_positions = set()
+        # Is increased by every addition, removal and death of creature (copies of forest kept by workers are checked
+        # by it)
+        self._version = 0
+        self._hectares = [[Hectare(position=(i, j), forest=self) for j in range(horizontal_length)]
+                          for i in range(vertical_length)]
+
+    def __setstate__(self, state: dict) -> None:
+        """Relinks copied hectares to copied forest"""
+        self.__dict__.update(state)
+        for hectare_line in self._hectares:
+            for hectare in hectare_line:
+                hectare._forest = self
+                hectare._changed_states = None if self._changes is None else set()
 
     @property
     def hectares(self) -> List[List[Hectare]]:
@@ -58,3 +283,225 @@ class Forest:
     def horizontal_length(self) -> int:
         """Returns amount of columns in matrix (amount of Hectares in horizontal orientation)"""
         return self._horizontal_length
+
+    def _index_creature(self, creature, position: Tuple[int, int]) -> None:
+        """Adds creature to indexes of forest (called by hectare at position)"""
+        kind = type(creature)
+        creatures = self._creatures_by_number.get(kind)
+        if creatures is None:
+            creatures = self._creatures_by_number[kind] = {}
+        creatures[creature._number] = creature
+        counts = self._dead_counts if creature.is_dead() else self._alive_counts
+        counts[kind] = counts.get(kind, 0) + 1
+        self._dirty_positions.add(position)
+        self._version += 1
+        if self._changes is not None:
+            self._changes[0].add(creature)
+            self._changes[1].add(position)
+
+    def _unindex_creatures(self, kind: type, creatures: List, dead_amount: int, position: Tuple[int, int]) -> None:
+        """Removes creatures of kind from indexes of forest (called by hectare at position)
+
+        dead_amount - amount of dead creatures among creatures
+        """
+        creatures_by_number = self._creatures_by_number[kind]
+        for creature in creatures:
+            if creatures_by_number.get(creature._number) is creature:
+                del creatures_by_number[creature._number]
+        if len(creatures) > dead_amount:
+            self._alive_counts[kind] -= len(creatures) - dead_amount
+        if dead_amount:
+            self._dead_counts[kind] -= dead_amount
+        self._dirty_positions.add(position)
+        self._version += 1
+        if self._changes is not None:
+            self._changes[0].update(creatures)
+            self._changes[1].add(position)
+
+    def _count_death(self, kind: type, position: Tuple[int, int], amount=1) -> None:
+        """Moves amount of creatures of kind from alive counter to dead counter (called by hectare at position)"""
+        self._alive_counts[kind] -= amount
+        self._dead_counts[kind] = self._dead_counts.get(kind, 0) + amount
+        self._dirty_positions.add(position)
+        self._version += 1
+
+    def take_dirty_positions(self) -> Set[Tuple[int, int]]:
+        """Returns positions of hectares where creatures were added, removed or died since last call
+
+        Used to redraw only changed hectares (amount of creatures and ids of creatures of other hectares are the same)
+        """
+        dirty_positions = self._dirty_positions
+        self._dirty_positions = set()
+        return dirty_positions
+
+    def track_changes(self, tracking: bool) -> None:
+        """Starts (tracking is True) or stops tracking of creatures that are added to or removed from hectares and of
+        creatures whose state was changed"""
+        self._changes = (set(), set()) if tracking else None
+        for hectare_line in self._hectares:
+            for hectare in hectare_line:
+                hectare._changed_states = set() if tracking else None
+
+    @property
+    def changes_tracked(self) -> bool:
+        """Returns True if changes of forest are tracked (see track_changes)"""
+        return self._changes is not None
+
+    def take_changes(self) -> Tuple[Set, Set, Set[Tuple[int, int]], Set]:
+        """Returns changes since last call and starts to collect new ones
+
+        Returns (added, moved or removed creatures, removed creatures, positions of hectares where creatures were
+        added or removed, creatures whose state was changed)
+        Creatures are marked by their hectares when they are changed, so other creatures are the same as on previous
+        call (aging is the same for every creature and isn't marked)
+        raise RuntimeError if changes are not tracked
+        """
+        if self._changes is None:
+            raise RuntimeError("Changes of forest are not tracked")
+        changed_creatures, changed_positions = self._changes
+        self._changes = (set(), set())
+        changed_states = set()
+        for hectare_line in self._hectares:
+            for hectare in hectare_line:
+                if hectare._changed_states:
+                    changed_states.update(hectare._changed_states)
+                    hectare._changed_states = set()
+        removed_creatures = {creature for creature in changed_creatures if not self.contains(creature)}
+        return changed_creatures, removed_creatures, changed_positions, changed_states
+
+    def population(self) -> Dict[type, Tuple[int, int]]:
+        """Returns (amount of alive creatures, amount of dead creatures) for every kind of creatures of forest"""
+        kinds = set(self._alive_counts) | set(self._dead_counts)
+        return {kind: (self._alive_counts.get(kind, 0), self._dead_counts.get(kind, 0)) for kind in kinds}
+
+    def count_creatures(self, category=object, alive: Optional[bool] = None) -> int:
+        """Returns amount of creatures of forest that are instances of category (counters are used, no scan)
+
+        category - class (or tuple of classes) of creatures
+        alive - True to count only alive creatures, False to count only dead creatures, None to count all of them
+        """
+        amount = 0
+        if alive is not False:
+            amount += sum(count for kind, count in self._alive_counts.items() if issubclass(kind, category))
+        if alive is not True:
+            amount += sum(count for kind, count in self._dead_counts.items() if issubclass(kind, category))
+        return amount
+
+    def creatures_by_number(self, kind: type) -> Optional[Dict[int, object]]:
+        """Returns index number of creature -> creature of creatures of kind (index must not be changed)
+
+        Returns None if some creatures of kind have the same number (index keeps only one of them)
+        """
+        creatures = self._creatures_by_number.get(kind, {})
+        amount = self._alive_counts.get(kind, 0) + self._dead_counts.get(kind, 0)
+        return creatures if len(creatures) == amount else None
+
+    def contains(self, creature) -> bool:
+        """Returns True if creature is located in forest"""
+        hectare = creature._hectare
+        return hectare is not None and hectare._forest is self
+
+    def find_position(self, creature) -> Tuple[int, int]:
+        """Returns (vertical number, horizontal number) of hectare where creature is located
+
+        raise ValueError if creature is not located in forest
+        """
+        if not self.contains(creature):
+            raise ValueError(f"Creature with id {creature.id} wasn't found in forest")
+        return creature._hectare.position
+
+    def find_by_id(self, creature_id: str):
+        """Returns creature with id == creature_id or None if there is no such creature in forest
+
+        Id is parsed into kind and number of creature (id of creature changes after its death, so death suffix is
+        ignored by parsing and checked by comparison of ids)
+        """
+        key = id_index_key(creature_id)
+        prefix, number = creature_ids.split_id(key)
+        candidates = []
+        if number is not None:
+            try:
+                candidates.append((species_registry.entry_by_id_prefix(prefix).kind, number))
+            except KeyError:
+                pass
+        named_number = creature_ids.named_number(key)  # Ids from saves that are not prefix with number
+        if named_number is not None:
+            candidates.extend((kind, named_number) for kind in self._creatures_by_number)
+        for kind, number in candidates:
+            creature = self._creatures_by_number.get(kind, {}).get(number)
+            if creature is not None and creature.id == creature_id:
+                return creature
+        return None
+
+    def hectare_of(self, creature) -> Hectare:
+        """Returns hectare where creature is located
+
+        raise ValueError if creature is not located in forest
+        """
+        vertical_number, horizontal_number = self.find_position(creature)
+        return self._hectares[vertical_number][horizontal_number]
+
+    def move_creature(self, creature, vertical_number: int, horizontal_number: int) -> None:
+        """Moves creature from its current hectare to hectare with number (vertical_number, horizontal_number)
+
+        raise ValueError if creature is not located in forest
+        """
+        self.hectare_of(creature).remove_creature(creature)
+        self._hectares[vertical_number][horizontal_number].append_creature(creature)
+
+
+class ForestChanges:
+
+    def __init__(self, forest: Forest):
+        """Creates buffer of deferred changes of forest
+
+        forest - Forest to change
+        Phases of cycle read stable content of hectares and put their moves, births and removals to this buffer.
+        All changes are applied by commit: one bulk removal and one bulk addition per changed hectare
+        """
+        self._forest = forest
+        self._departures = {}  # position -> {creature: None}
+        self._arrivals = {}  # position -> [creature]
+
+    def _normalized_position(self, vertical_number: int, horizontal_number: int) -> Tuple[int, int]:
+        """Returns position of hectare (negative numbers are counted from the end of forest)"""
+        return self._forest.hectares[vertical_number][horizontal_number].position
+
+    def add_creature(self, creature, vertical_number: int, horizontal_number: int) -> None:
+        """Plans to add creature to hectare with number (vertical_number, horizontal_number)"""
+        position = self._normalized_position(vertical_number, horizontal_number)
+        self._arrivals.setdefault(position, []).append(creature)
+
+    def add_creatures(self, creatures, vertical_number: int, horizontal_number: int) -> None:
+        """Plans to add creatures to hectare with number (vertical_number, horizontal_number)"""
+        if creatures:
+            position = self._normalized_position(vertical_number, horizontal_number)
+            self._arrivals.setdefault(position, []).extend(creatures)
+
+    def remove_creature(self, creature) -> None:
+        """Plans to remove creature from its hectare
+
+        raise ValueError if creature is not located in forest
+        """
+        self._departures.setdefault(self._forest.find_position(creature), {})[creature] = None
+
+    def move_creature(self, creature, vertical_number: int, horizontal_number: int) -> None:
+        """Plans to move creature from its current hectare to hectare with number (vertical_number, horizontal_number)
+
+        raise ValueError if creature is not located in forest
+        """
+        self.remove_creature(creature)
+        self.add_creature(creature, vertical_number, horizontal_number)
+
+    def commit(self) -> None:
+        """Applies all planned changes to forest and clears buffer
+
+        All removals are applied before additions, so moved creatures are indexed by their new hectares
+        """
+        hectares = self._forest.hectares
+        for (vertical_number, horizontal_number), leaving_creatures in self._departures.items():
+            hectares[vertical_number][horizontal_number].remove_creatures(leaving_creatures)
+        for (vertical_number, horizontal_number), arriving_creatures in self._arrivals.items():
+            hectares[vertical_number][horizontal_number].extend_hectare(arriving_creatures)
+        self._departures = {}
+        self._arrivals = {}
@@ -12,16 +12,22 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from ecosystem import EcoSystem
+from simulation_worker import EcosystemProxy, SimulationWorker
+from creature_list_model import CreatureListModel
+from world_map_model import WorldMapModel
+from world_view import WorldView
 import creature_stats_dialog
 import add_creatures_dialog
 import create_new_world_dialog
 import help_dialog
 import configs
+import species_registry
 import time
 import os
 
 
 AUTO_PERIOD_MUTEX = QtCore.QMutex()
+BACKGROUND_FILE_MUTEX = QtCore.QMutex()  # Locked while world is written to file
 STOP_AUTO_PERIOD_FLAG = False
 
 
@@ -94,6 +100,64 @@ class AutoPeriodRunnable(QtCore.QRunnable):
             i += 1
 
 
+class BackgroundFileSignals(QtCore.QObject):  # Signals of save and load in additional thread
+    progress = QtCore.pyqtSignal(int)
+    saved = QtCore.pyqtSignal(str)
+    loaded = QtCore.pyqtSignal(str, object)
+    failed = QtCore.pyqtSignal(str, str)
+
+
+class SaveRunnable(QtCore.QRunnable):
+
+    def __init__(self, signals: BackgroundFileSignals, filename: str, snapshot):
+        """Creates QtCore.QRunnable object to write world to file in new thread
+
+        signals - used to emit signals (progress in percents, world saved, save failed)
+        filename - file to save world to
+        snapshot - snapshot of world (EcoSystem.snapshot_for_save), world keeps changing while snapshot is written
+        """
+        super().__init__()
+        self.signals = signals
+        self._filename = filename
+        self._snapshot = snapshot
+
+    def run(self):
+        """Writes snapshot of world and emits signal saved or failed"""
+        BACKGROUND_FILE_MUTEX.lock()
+        try:
+            EcoSystem.write_save(self._filename, *self._snapshot, progress=self.signals.progress.emit)
+        except (OSError, ValueError) as ex:
+            self.signals.failed.emit(self._filename, str(ex))
+        else:
+            self.signals.saved.emit(self._filename)
+        finally:
+            BACKGROUND_FILE_MUTEX.unlock()
+
+
+class LoadRunnable(QtCore.QRunnable):
+
+    def __init__(self, signals: BackgroundFileSignals, filename: str):
+        """Creates QtCore.QRunnable object to load world from file in new thread
+
+        signals - used to emit signals (world loaded, load failed)
+        filename - file to load world from
+        New world is sent with signal loaded, it replaces current world in main thread. Id counters of loaded world
+        are kept in it (current world still runs), they are installed when world is replaced
+        """
+        super().__init__()
+        self.signals = signals
+        self._filename = filename
+
+    def run(self):
+        """Loads world and emits signal loaded or failed"""
+        try:
+            loaded_ecosystem = EcoSystem.from_file(self._filename, install_id_counters=False)
+        except (OSError, ValueError, KeyError) as ex:
+            self.signals.failed.emit(self._filename, str(ex))
+        else:
+            self.signals.loaded.emit(self._filename, loaded_ecosystem)
+
+
 class CustomMainWindow(QtWidgets.QMainWindow):
 
     def __init__(self, parent=None):
@@ -242,10 +306,24 @@ class Ui_MainWindow(object):
         MainWindow.setMinimumSize(1000, 579)
 
         self.auto_period_thread_signals = MainWindow.auto_period_thread_signals
-        self.auto_period_thread_signals.next_period.connect(lambda: self._next_period(ecosystem))
+        self.auto_period_thread_signals.next_period.connect(lambda: self._next_period())
         self.auto_period_thread = QtCore.QThreadPool()
+        # Thread of automatic mode is always busy, saves and loads need one more thread
+        self.auto_period_thread.setMaxThreadCount(max(2, self.auto_period_thread.maxThreadCount()))
         self.auto_period_runnable = None
+        self.background_file_signals = BackgroundFileSignals()
+        self.background_file_operation = False  # True while world is saved or loaded in additional thread
         self.auto_period_speed = configs.AutoPeriodParams.MIN_SPEED.value
+        # Periods are made by worker in its own thread, widgets draw views of world published by worker
+        self.simulation_worker = SimulationWorker(ecosystem)
+        self.simulation_worker.viewPublished.connect(self._show_view)
+        self.simulation_worker.start()
+        self.shown_hectare = None  # Hectare whose creatures are shown in cellDataListWidget
+        self.turbo_cycles = 0  # Periods made in turbo mode since it was turned on
+        self.turbo_measure_start = 0.0
+        self.turbo_measure_cycles = 0
+        self.turbo_cycles_per_second = 0.0
+        self.wasteland_shown = False  # True if worldMapTable shows wasteland
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setStyleSheet(f"border-image: url({configs.SERVICE_ICONS['menu_background']});")
         self.centralwidget.setObjectName("centralwidget")
@@ -314,7 +392,30 @@ class Ui_MainWindow(object):
         self.autoPeriodButton.setCheckable(True)
         self.autoPeriodButton.setObjectName("autoPeriodButton")
         self.gridLayout.addWidget(self.autoPeriodButton, 2, 4, 1, 1)
-        self.cellDataListWidget = QtWidgets.QListWidget(self.centralwidget)
+        self.turboButton = QtWidgets.QPushButton(self.centralwidget)
+        self.turboButton.setBaseSize(QtCore.QSize(108, 32))
+        self.turboButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.turboButton.setStyleSheet("background-color: rgb(224, 224, 255);")
+        self.turboButton.setCheckable(True)
+        self.turboButton.setObjectName("turboButton")
+        self.gridLayout.addWidget(self.turboButton, 2, 8, 1, 1)
+        self.speciesFilterComboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.speciesFilterComboBox.setStyleSheet("background-color: rgb(224, 224, 255);")
+        self.speciesFilterComboBox.addItem(configs.GuiMessages.ALL_SPECIES_FILTER.value, None)
+        for entry in species_registry.entries():
+            self.speciesFilterComboBox.addItem(entry.russian_name, entry.english_name)
+        self.speciesFilterComboBox.setObjectName("speciesFilterComboBox")
+        self.gridLayout.addWidget(self.speciesFilterComboBox, 0, 0, 1, 1)
+        self.aliveFilterComboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.aliveFilterComboBox.setStyleSheet("background-color: rgb(224, 224, 255);")
+        self.aliveFilterComboBox.addItem(configs.GuiMessages.ALL_CREATURES_FILTER.value, None)
+        self.aliveFilterComboBox.addItem(configs.GuiMessages.ALIVE_CREATURES_FILTER.value, True)
+        self.aliveFilterComboBox.addItem(configs.GuiMessages.DEAD_CREATURES_FILTER.value, False)
+        self.aliveFilterComboBox.setObjectName("aliveFilterComboBox")
+        self.gridLayout.addWidget(self.aliveFilterComboBox, 0, 1, 1, 1)
+        self.cellDataListWidget = QtWidgets.QListView(self.centralwidget)
+        self.creature_list_model = CreatureListModel(MainWindow)
+        self.cellDataListWidget.setModel(self.creature_list_model)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
@@ -323,8 +424,10 @@ class Ui_MainWindow(object):
         self.cellDataListWidget.setStyleSheet("background-color: rgb(247, 255, 238);")
         self.cellDataListWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.cellDataListWidget.setObjectName("cellDataListWidget")
-        self.gridLayout.addWidget(self.cellDataListWidget, 0, 0, 2, 2)
-        self.worldMapTable = QtWidgets.QTableWidget(self.centralwidget)
+        self.gridLayout.addWidget(self.cellDataListWidget, 1, 0, 1, 2)
+        self.worldMapTable = QtWidgets.QTableView(self.centralwidget)
+        self.world_map_model = WorldMapModel(MainWindow)
+        self.worldMapTable.setModel(self.world_map_model)
         self.worldMapTable.setStyleSheet("background-color: rgb(247, 255, 238);")
         self.worldMapTable.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
         self.worldMapTable.setAutoScroll(False)
@@ -334,8 +437,8 @@ class Ui_MainWindow(object):
         self.worldMapTable.setGridStyle(QtCore.Qt.SolidLine)
         self.worldMapTable.setCornerButtonEnabled(False)
         self.worldMapTable.setObjectName("worldMapTable")
-        self._emplace_elements(ecosystem)
-        self.gridLayout.addWidget(self.worldMapTable, 0, 2, 2, 6)
+        self._emplace_elements()
+        self.gridLayout.addWidget(self.worldMapTable, 0, 2, 2, 7)
         self.increaseAutoSpeedButton = QtWidgets.QPushButton(self.centralwidget)
         self.increaseAutoSpeedButton.setEnabled(False)
         self.increaseAutoSpeedButton.setBaseSize(QtCore.QSize(108, 32))
@@ -368,6 +471,10 @@ class Ui_MainWindow(object):
         self.statusBar.setObjectName("statusBar")
         self.statusBar.show()
         MainWindow.setStatusBar(self.statusBar)
+        self.fileProgressBar = QtWidgets.QProgressBar(self.statusBar)
+        self.fileProgressBar.setMaximumWidth(200)
+        self.fileProgressBar.setVisible(False)
+        self.statusBar.addPermanentWidget(self.fileProgressBar)
 
         self.newWorldAction = QtWidgets.QAction(MainWindow)
         add_icon = QtGui.QIcon()
@@ -443,19 +550,28 @@ class Ui_MainWindow(object):
 
         MainWindow.tool_bar_signals.makeToolBar.connect(self._makeToolBarFunction)
         MainWindow.tool_bar_signals.closeToolBar.connect(self._closeToolBarFunction)
-        MainWindow.exit_save_signal.exitSaveSignal.connect(lambda: ecosystem.save())
-
-        self.worldMapTable.itemClicked.connect(lambda: self._show_creatures(ecosystem))
-        self.cellDataListWidget.itemDoubleClicked.connect(lambda: self._show_creature_stats(MainWindow, ecosystem))
-        self.periodButton.clicked.connect(lambda: self._next_period(ecosystem))
-        self.wakeDeadlyWormButton.clicked.connect(lambda: self._wake_deadly_worm(ecosystem))
-        self.appocalipseButton.clicked.connect(lambda: self._apocalypse(ecosystem))
+        MainWindow.exit_save_signal.exitSaveSignal.connect(self._save_before_leaving)
+        self.background_file_signals.progress.connect(self.fileProgressBar.setValue)
+        self.background_file_signals.saved.connect(self._background_save_done)
+        self.background_file_signals.loaded.connect(
+            lambda filename, loaded_ecosystem: self._background_load_done(MainWindow, filename, loaded_ecosystem))
+        self.background_file_signals.failed.connect(self._background_file_operation_failed)
+
+        self.worldMapTable.clicked.connect(
+            lambda index: self.simulation_worker.select_hectare(index.row(), index.column()))
+        self.cellDataListWidget.doubleClicked.connect(lambda: self._show_creature_stats(MainWindow))
+        self.periodButton.clicked.connect(lambda: self._next_period())
+        self.wakeDeadlyWormButton.clicked.connect(lambda: self._wake_deadly_worm())
+        self.appocalipseButton.clicked.connect(lambda: self._apocalypse())
         self.autoPeriodButton.clicked.connect(self._auto_period)
+        self.turboButton.clicked.connect(self._turbo)
         self.increaseAutoSpeedButton.clicked.connect(self._increase_auto_speed)
         self.reduceAutoSpeedButton.clicked.connect(self._reduce_auto_speed)
-        self.cellDataListWidget.currentItemChanged.connect(self._make_remove_creature_enabled)
-        self.removeCreatureButton.clicked.connect(lambda: self._remove_creature_button_clicked(ecosystem))
-        self.addCreatureButton.clicked.connect(lambda: self._add_creatures_dialog(MainWindow, ecosystem))
+        self.cellDataListWidget.selectionModel().currentChanged.connect(self._make_remove_creature_enabled)
+        self.speciesFilterComboBox.currentIndexChanged.connect(self._filter_creatures)
+        self.aliveFilterComboBox.currentIndexChanged.connect(self._filter_creatures)
+        self.removeCreatureButton.clicked.connect(self._remove_creature_button_clicked)
+        self.addCreatureButton.clicked.connect(lambda: self._add_creatures_dialog(MainWindow))
 
     def _unknown_creature_error(self, ex: ValueError) -> None:
         """Shows message about error (Unknown type of creature)"""
@@ -472,17 +588,20 @@ class Ui_MainWindow(object):
         error_msg_box.rejected.connect(self._closeToolBarFunction)
         error_msg_box.exec()
 
-    def _show_creature_stats(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
+    def _show_creature_stats(self, MainWindow: CustomMainWindow) -> None:
         """Creates dialog (CustomCreatureStatsDialog) to check stats of selected creature
         
         MainWindow - main window of program
-        ecosystem - data controller part of program
+        Dialog gets ecosystem through proxy (its methods are called in thread of simulation worker), creature is read
+        while simulation is paused
         """
         self._pause_game()
+        creature_id = self.current_creature_id()
+        if creature_id is None:
+            self._continue_game(MainWindow.game_running_flag)
+            return
         creature_removed_signal = creature_stats_dialog.CreatureRemovedSignal()
-        creature_removed_signal.creatureRemoved.connect(
-            lambda: self._remove_creature(ecosystem,
-                                          ecosystem.find_creature(self.cellDataListWidget.currentItem().text())))
+        creature_removed_signal.creatureRemoved.connect(lambda: self._remove_creature(creature_id))
         creature_stat_dialog_window = creature_stats_dialog.CustomCreatureStatsDialog(creature_removed_signal,
                                                                                       parent=MainWindow)
         creature_stat_dialog_window.accepted.connect(lambda: self._continue_game(MainWindow.game_running_flag))
@@ -490,31 +609,32 @@ class Ui_MainWindow(object):
 
         try:
             ui.setupUi(creature_stat_dialog_window,
-                       ecosystem,
-                       ecosystem.find_creature(self.cellDataListWidget.currentItem().text()))
+                       EcosystemProxy(self.simulation_worker),
+                       self.simulation_worker.call(lambda ecosystem: ecosystem.find_creature(creature_id),
+                                                   copy_result=True))
             creature_stat_dialog_window.show()
             creature_stat_dialog_window.exec()
         except ValueError as ex:
             self._unknown_creature_error(ex)
 
-    def _add_creatures_dialog(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
+    def _add_creatures_dialog(self, MainWindow: CustomMainWindow) -> None:
         """Creates dialog to add creatures (CustomAddCreaturesDialog) to selected hectare of forest
         
         MainWindow - main window of program
-        ecosystem - data controller part of program
+        Dialog gets ecosystem through proxy (creatures are added in thread of simulation worker)
         """
         self._pause_game()
         add_creatures_dialog_window = add_creatures_dialog.CustomAddCreaturesDialog(parent=MainWindow)
         add_creatures_dialog_window.accepted.connect(
             lambda: self.statusBar.showMessage(configs.GuiMessages.CREATURES_ADDED.value, configs.MESSAGE_DURATION))
-        add_creatures_dialog_window.addCreaturesSignal.updateMapSignal.connect(lambda: self._update(ecosystem))
+        add_creatures_dialog_window.addCreaturesSignal.updateMapSignal.connect(self._update)
         add_creatures_dialog_window.accepted.connect(lambda: self._continue_game(MainWindow.game_running_flag))
         add_creatures_dialog_window.rejected.connect(lambda: self._continue_game(MainWindow.game_running_flag))
         ui = add_creatures_dialog.Ui_addCreaturesDialog()
         ui.setupUi(add_creatures_dialog_window,
-                   ecosystem,
-                   self.worldMapTable.currentItem().row(),
-                   self.worldMapTable.currentItem().column())
+                   EcosystemProxy(self.simulation_worker),
+                   self.worldMapTable.currentIndex().row(),
+                   self.worldMapTable.currentIndex().column())
         add_creatures_dialog_window.show()
         add_creatures_dialog_window.exec()
 
@@ -525,9 +645,7 @@ class Ui_MainWindow(object):
 
     def _new_world_done(self, ecosystem) -> None:
         """Updates widgets and close menu after creation of new world"""
-        self.worldMapTable.clear()
-        self.cellDataListWidget.clear()
-        self._emplace_elements(ecosystem)
+        self._emplace_elements()
         self._closeToolBarFunction()
 
     def _make_new_world_dialog(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
@@ -559,13 +677,9 @@ class Ui_MainWindow(object):
         helpDialogWindow.show()
         helpDialogWindow.exec()
 
-    def _next_period(self, ecosystem: EcoSystem) -> None:
-        """Make new period of ecosystem
-        
-        ecosystem - data controller part of program
-        """
-        ecosystem.cycle()
-        self._update(ecosystem)
+    def _next_period(self) -> None:
+        """Make new period of ecosystem (period is made by simulation worker, widgets are updated by its view)"""
+        self.simulation_worker.request_cycles()
         self.statusBar.showMessage(configs.GuiMessages.PERIOD_SPEND.value, msecs=configs.MESSAGE_DURATION)
 
     def _enabled_support_auto_period_buttons(self) -> None:
@@ -606,6 +720,9 @@ class Ui_MainWindow(object):
         increaseAutoSpeedButton) 
         """
         if self.autoPeriodButton.isChecked():
+            if self.turboButton.isChecked():
+                self.turboButton.setChecked(False)
+                self._stop_turbo()
             self._start_auto_period_in_thread()
         else:
             self._cancel_auto_period_thread()
@@ -613,6 +730,51 @@ class Ui_MainWindow(object):
             self.reduceAutoSpeedButton.setEnabled(False)
             self.increaseAutoSpeedButton.setEnabled(False)
 
+    def _turbo(self) -> None:
+        """Determine behaviour after click of turboButton
+
+        If turbo mode was on - stops automatic mode and starts to make periods in batches
+        else - stops turbo mode
+        """
+        if self.turboButton.isChecked():
+            if self.autoPeriodButton.isChecked():
+                self.autoPeriodButton.setChecked(False)
+                self._auto_period()
+            self.turbo_cycles = 0
+            self._start_turbo()
+        else:
+            self._stop_turbo()
+            self.periodButton.setEnabled(True)
+            self.statusBar.clearMessage()
+
+    def _start_turbo(self) -> None:
+        """Starts (or continues after pause) to make periods in turbo mode"""
+        self.turbo_measure_start = time.perf_counter()
+        self.turbo_measure_cycles = 0
+        self.turbo_cycles_per_second = 0.0
+        self.periodButton.setEnabled(False)
+        self.simulation_worker.start_turbo()
+
+    def _stop_turbo(self) -> None:
+        """Stops to make periods in turbo mode (turboButton is not changed)"""
+        self.simulation_worker.stop_turbo()
+
+    def _count_turbo_speed(self, cycles: int) -> None:
+        """Counts amount of periods per second in turbo mode and shows it in statusBar
+
+        cycles - amount of periods of the last batch
+        """
+        self.turbo_cycles += cycles
+        self.turbo_measure_cycles += cycles
+        now = time.perf_counter()
+        if now - self.turbo_measure_start >= configs.TurboParams.SPEED_MEASURE_TIME.value or \
+                not self.turbo_cycles_per_second:
+            self.turbo_cycles_per_second = self.turbo_measure_cycles / (now - self.turbo_measure_start)
+            self.turbo_measure_start = now
+            self.turbo_measure_cycles = 0
+        self.statusBar.showMessage(configs.GuiMessages.TURBO_SPEED.value.format(self.turbo_cycles_per_second,
+                                                                                self.turbo_cycles))
+
     def _increase_auto_speed(self) -> None:
         """Increments auto_period_speed"""
         self.auto_period_speed += 1
@@ -631,13 +793,9 @@ class Ui_MainWindow(object):
         AUTO_PERIOD_MUTEX.unlock()
         self._enabled_support_auto_period_buttons()
 
-    def _wake_deadly_worm(self, ecosystem: EcoSystem) -> None:
-        """Removes dead creatures from ecosystem
-        
-        ecosystem - data controller part of program
-        """
-        ecosystem.provoke_deadly_worm()
-        self._update(ecosystem)
+    def _wake_deadly_worm(self) -> None:
+        """Removes dead creatures from ecosystem"""
+        self.simulation_worker.call(lambda ecosystem: ecosystem.provoke_deadly_worm(), publish=True)
         self.statusBar.showMessage(configs.GuiMessages.MANUAL_DEADLY_WORM.value, msecs=configs.MESSAGE_DURATION)
 
     def _make_remove_creature_enabled(self) -> None:
@@ -646,38 +804,39 @@ class Ui_MainWindow(object):
         Activates button if creature was selected in cellDataListWidget
         Deactivates if selection in cellDataListWidget is empty  
         """
-        if not self.cellDataListWidget.currentItem():
-            self.removeCreatureButton.setEnabled(False)
-        elif self.cellDataListWidget.currentItem().text() == configs.GuiMessages.WASTELAND_CREATURES_INFO.value:
-            self.removeCreatureButton.setEnabled(False)
-        else:
-            self.removeCreatureButton.setEnabled(True)
-
-    def _remove_creature_button_clicked(self, ecosystem: EcoSystem) -> None:
-        """Requires acception to remove creature and removes creature if user accept it
-        
-        ecosystem - data controller part of program
-        """
+        self.removeCreatureButton.setEnabled(self.current_creature_id() is not None)
+
+    def current_creature_id(self):
+        """Returns id of creature selected in cellDataListWidget (None if creature is not selected)"""
+        return self.creature_list_model.creature_id(self.cellDataListWidget.currentIndex().row())
+
+    def _filter_creatures(self) -> None:
+        """Shows in cellDataListWidget only creatures of species and life chosen in filters"""
+        self.creature_list_model.set_filter(self.speciesFilterComboBox.currentData(),
+                                            self.aliveFilterComboBox.currentData())
+        self._make_remove_creature_enabled()
+
+    def _remove_creature_button_clicked(self) -> None:
+        """Requires acception to remove creature and removes creature if user accept it"""
+        creature_id = self.current_creature_id()
+        if creature_id is None:
+            return
         self._pause_game()
-        creature = ecosystem.find_creature(self.cellDataListWidget.currentItem().text())
         before_delete_msg_box = QtWidgets.QMessageBox()
-        before_delete_msg_box.setWindowTitle(f"Уничтожение существа {creature.id}")
-        before_delete_msg_box.setText(f"Вы уверены, что хотите уничтожить существо {creature.id}")
+        before_delete_msg_box.setWindowTitle(f"Уничтожение существа {creature_id}")
+        before_delete_msg_box.setText(f"Вы уверены, что хотите уничтожить существо {creature_id}")
         before_delete_msg_box.setInformativeText(configs.GuiMessages.REMOVE_CREATURE_INFORMATIVE_TEXT.value)
         before_delete_msg_box.setIcon(QtWidgets.QMessageBox.Question)
         before_delete_msg_box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         before_delete_msg_box.setDefaultButton(QtWidgets.QMessageBox.No)
         before_delete_msg_box.adjustSize()
-        before_delete_msg_box.accepted.connect(lambda: self._remove_creature(ecosystem, creature))
+        before_delete_msg_box.accepted.connect(lambda: self._remove_creature(creature_id))
         before_delete_msg_box.accepted.connect(lambda: self._continue_game(game_running_flag=True))
         before_delete_msg_box.rejected.connect(lambda: self._continue_game(game_running_flag=True))
         before_delete_msg_box.exec()
 
-    def _apocalypse(self, ecosystem: EcoSystem) -> None:
-        """Requires acception to make apocalypse and makes it if user agree
-        
-        ecosystem - data controller part of program
-        """
+    def _apocalypse(self) -> None:
+        """Requires acception to make apocalypse and makes it if user agree"""
         self._pause_game()
         before_apocalypse_message_box = QtWidgets.QMessageBox()
         before_apocalypse_message_box.setWindowTitle(f"Печати апокалипсиса")
@@ -687,99 +846,77 @@ class Ui_MainWindow(object):
         before_apocalypse_message_box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         before_apocalypse_message_box.setDefaultButton(QtWidgets.QMessageBox.No)
         before_apocalypse_message_box.adjustSize()
-        before_apocalypse_message_box.accepted.connect(ecosystem.apocalypse)
+        before_apocalypse_message_box.accepted.connect(
+            lambda: self.simulation_worker.call(lambda ecosystem: ecosystem.apocalypse(), publish=True))
         before_apocalypse_message_box.accepted.connect(lambda: self._continue_game(game_running_flag=True))
         before_apocalypse_message_box.rejected.connect(lambda: self._continue_game(game_running_flag=True))
         before_apocalypse_message_box.exec()
-        self._update(ecosystem)
         self.statusBar.showMessage(configs.GuiMessages.APOCALYPSE.value, msecs=configs.MESSAGE_DURATION)
 
-    def _remove_creature(self, ecosystem: EcoSystem, creature) -> None:
+    def _remove_creature(self, creature_id: str) -> None:
         """Removes creature from ecosystem
 
-        ecosystem - data controller part of program
-        creature - some creature of ecosystem
+        creature_id - id of some creature of ecosystem
         """
-        ecosystem.remove_creature(creature.id)
-        self._update(ecosystem)
-        self.statusBar.showMessage(f"Существо {creature.id} уничтожено безвозвратно", msecs=configs.MESSAGE_DURATION)
+        self.simulation_worker.call(lambda ecosystem: ecosystem.remove_creature(creature_id), publish=True)
+        self.statusBar.showMessage(f"Существо {creature_id} уничтожено безвозвратно", msecs=configs.MESSAGE_DURATION)
 
-    def _update(self, ecosystem: EcoSystem) -> None:
-        """Updates widgets of program (worldMapTable, cellDataWidget)
+    def _update(self) -> None:
+        """Asks simulation worker to publish view of world (widgets are updated when view comes)"""
+        self.simulation_worker.request_view()
 
-        ecosystem - data controller part of program
-        """
-        self._update_table(ecosystem)
-        self._show_creatures(ecosystem)
-
-    def _show_creatures(self, ecosystem: EcoSystem) -> None:
-        """Shows creatures of current hectare in cellDataListWidgets
+    def _show_view(self, view: WorldView) -> None:
+        """Updates widgets of program (worldMapTable, cellDataWidget) by view of world
 
-        ecosystem - data controller part of program
+        view - view published by simulation worker
+        Model of worldMapTable redraws only hectares changed since previous view, list of creatures is updated only
+        if current hectare was changed or selected
         """
-        self.cellDataListWidget.clear()
-        if ecosystem.is_wasteland():
-            item = QtWidgets.QListWidgetItem()
-            brush = QtGui.QBrush(QtGui.QColor(244, 224, 255))
-            brush.setStyle(QtCore.Qt.SolidPattern)
-            item.setBackground(brush)
-            item.setText(configs.GuiMessages.WASTELAND_CREATURES_INFO.value)
-            self.cellDataListWidget.addItem(item)
-        else:
-            for creature in ecosystem.forest.hectares[self.worldMapTable.currentRow()][self.worldMapTable.currentColumn()].creations:
-                item = QtWidgets.QListWidgetItem()
-                brush = QtGui.QBrush(QtGui.QColor(244, 224, 255))
-                brush.setStyle(QtCore.Qt.SolidPattern)
-                item.setBackground(brush)
-                item.setText(creature.id)
-                self.cellDataListWidget.addItem(item)
-
-    def _update_table(self, ecosystem: EcoSystem) -> None:
-        """Updates information shown in worldMapTable
-
-        ecosystem - data controller part of program
+        wasteland_changed = view.wasteland != self.wasteland_shown
+        self.wasteland_shown = view.wasteland
+        self.world_map_model.set_view(view)
+        if view.full:
+            self._table_elements_size_policy(view)
+            if view.selected is not None:
+                self.worldMapTable.setCurrentIndex(self.world_map_model.index(*view.selected))
+        if view.full or view.selected != self.shown_hectare:
+            self._show_creatures(view, reset=True)
+        elif wasteland_changed or view.selected in view.changed:
+            self._show_creatures(view, reset=False)
+        if view.cycles and self.turboButton.isChecked():
+            self._count_turbo_speed(view.cycles)
+
+    def _show_creatures(self, view: WorldView, reset: bool) -> None:
+        """Shows creatures of selected hectare in cellDataListWidget
+
+        view - view published by simulation worker
+        reset - True if another hectare is selected (list is shown from the beginning)
+        Otherwise only inserted, removed and renamed (died) creatures are changed in list, so selection stays the same
         """
-        if ecosystem.is_wasteland():
-            for i in range(len(ecosystem.forest.hectares)):
-                for j in range(len(ecosystem.forest.hectares[i])):
-                    cell_text = configs.GuiMessages.WASTELAND_MAP_INFO.value
-                    self.worldMapTable.item(i, j).setText(cell_text)
-        else:
-            for i in range(len(ecosystem.forest.hectares)):
-                for j in range(len(ecosystem.forest.hectares[i])):
-                    cell_text = f"Существ в гектаре: {len(ecosystem.forest.hectares[i][j].creations)}"
-                    self.worldMapTable.item(i, j).setText(cell_text)
-
-    def _table_elements_size_policy(self) -> None:
-        """Determines size policy of items of worldMapTable"""
-        self.worldMapTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.worldMapTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.shown_hectare = view.selected
+        self.creature_list_model.set_creatures(view.selected_ids, view.selected_species, view.wasteland, reset)
+        if reset:
+            self._make_remove_creature_enabled()
 
-    def _emplace_elements(self, ecosystem: EcoSystem) -> None:
-        """Creates items of worldMapTable
+    def _table_elements_size_policy(self, view: WorldView) -> None:
+        """Determines size policy of hectares of worldMapTable
 
-        ecosystem - data controller part of program
+        view - full view of world
+        Small map is stretched over the widget, hectares of large map have fixed size and map is scrolled
         """
-        self.worldMapTable.setColumnCount(ecosystem.forest.horizontal_length)
-        self.worldMapTable.setRowCount(ecosystem.forest.vertical_length)
-        self.worldMapTable.setHorizontalHeaderLabels([str(index) for index in range(1, ecosystem.forest.horizontal_length + 1)])
-        self.worldMapTable.setVerticalHeaderLabels([str(index) for index in range(1, ecosystem.forest.vertical_length + 1)])
-        self._table_elements_size_policy()
-        row = 0
-        for hectares_line in ecosystem.forest.hectares:
-            column = 0
-            for _ in hectares_line:
-                item = QtWidgets.QTableWidgetItem()
-                brush = QtGui.QBrush(QtGui.QColor(224, 224, 255))
-                brush.setStyle(QtCore.Qt.SolidPattern)
-                item.setBackground(brush)
-                self.worldMapTable.setItem(row, column, item)
-                column += 1
-            row += 1
-        self._update_table(ecosystem)
-        if not (ecosystem.forest.vertical_length == 0 or ecosystem.forest.horizontal_length == 0):
-            self.worldMapTable.setCurrentCell(0, 0)
-            self._show_creatures(ecosystem)
+        for header, length in ((self.worldMapTable.horizontalHeader(), len(view.counts[0]) if view.counts else 0),
+                               (self.worldMapTable.verticalHeader(), len(view.counts))):
+            if length <= configs.MAP_STRETCH_MAX_LENGTH:
+                header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+            else:
+                header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+                header.setDefaultSectionSize(configs.MAP_SECTION_SIZE)
+
+    def _emplace_elements(self) -> None:
+        """Prepares widgets for new world (worldMapTable and cellDataListWidget are filled by full view of world)"""
+        self.shown_hectare = None
+        self.simulation_worker.select_hectare(0, 0)  # Selection is dropped by view if world has no hectares
+        self.simulation_worker.request_view(full=True)
 
     def _makeToolBarFunction(self, game_running_flag: bool) -> None:
         """Shows toolBar and stop game (open game menu)
@@ -810,53 +947,140 @@ class Ui_MainWindow(object):
         self.autoPeriodButton.setEnabled(True)
 
     def _showLoadFileDialog(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
-        """Creates file dialog to load saved world. Load world from file
+        """Creates file dialog to load saved world. Loads world from file in additional thread
 
         MainWindow - main window of game
         ecosystem - data controller part of program
+        Game stays paused while world is loaded, loaded world replaces current world when it is ready
         """
+        if self._background_file_operation_busy():
+            return
         self._pause_game()
         fname = QFileDialog.getOpenFileName(MainWindow, 'Загрузить файл', configs.BASIC_SAVES_DIR_LINUX_PATH,
-                                            filter="JSON files (*.json)", initialFilter="(*.json)")[0]
+                                            filter="Saves (*.json *.ndjson *.fsnap)",
+                                            initialFilter="(*.json *.ndjson *.fsnap)")[0]
         if not fname:
             self._filenameError(configs.GuiMessages.FILE_NOT_CHOSEN.value)
             return
-        try:
-            ecosystem.load(fname)
-            self._emplace_elements(ecosystem)
-            self._update(ecosystem)
-            MainWindow.raise_running_game_flag()
-            self.showMapAction.setCheckable(True)
-            _, file = os.path.split(fname)
-            self._closeToolBarFunction()
-            MainWindow.lower_tool_bar_active_flag()
-            self.statusBar.showMessage(configs.GuiMessages.FILE_LOADED.value.format(file),
-                                       msecs=configs.MESSAGE_DURATION)
-        except ValueError as ve:
-            self._filenameError(ve.args[0])
+        self._start_background_file_operation(configs.GuiMessages.FILE_LOADING.value.format(os.path.split(fname)[1]),
+                                              determinate=False)
+        self.auto_period_thread.start(LoadRunnable(self.background_file_signals, fname))
+
+    def _background_load_done(self, MainWindow: CustomMainWindow, filename: str, loaded_ecosystem: EcoSystem) -> None:
+        """Replaces current world with loaded world (in thread of simulation worker) and shows it
+
+        MainWindow - main window of game
+        filename - file of loaded world
+        loaded_ecosystem - world loaded in additional thread
+        """
+        self._finish_background_file_operation()
+
+        def adopt_loaded_world(ecosystem: EcoSystem) -> None:
+            ecosystem.adopt(loaded_ecosystem)
+            ecosystem.install_id_counters()
+
+        self.simulation_worker.call(adopt_loaded_world)
+        self._emplace_elements()
+        MainWindow.raise_running_game_flag()
+        self.showMapAction.setCheckable(True)
+        _, file = os.path.split(filename)
+        self._closeToolBarFunction()
+        MainWindow.lower_tool_bar_active_flag()
+        self.statusBar.showMessage(configs.GuiMessages.FILE_LOADED.value.format(file), msecs=configs.MESSAGE_DURATION)
 
     def _showSaveFileDialog(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
-        """Creates save dialog to save world. Saves file.
+        """Creates save dialog to save world. Saves file in additional thread
 
         MainWindow - main window of game
         ecosystem - data controller part of program
         """
         if MainWindow.game_running_flag:
+            if self._background_file_operation_busy():
+                return
             self._pause_game()
             fname = QFileDialog.getSaveFileName(MainWindow, 'Save file', configs.BASIC_SAVES_DIR_LINUX_PATH,
-                                                filter="JSON files (*.json)", initialFilter="(*.json)")[0]
+                                                filter="Saves (*.json *.ndjson *.fsnap)",
+                                                initialFilter="(*.json *.ndjson *.fsnap)")[0]
             if not fname:
                 self._filenameError(configs.GuiMessages.FILE_NOT_CHOSEN.value)
                 return
             try:
-                ecosystem.save(fname)
+                self._start_background_save(fname)
                 self._closeToolBarFunction()
                 MainWindow.lower_tool_bar_active_flag()
-                self.statusBar.showMessage(configs.GuiMessages.FILE_SAVED.value.format(fname),
-                                           msecs=configs.MESSAGE_DURATION)
             except ValueError as ve:
                 self._filenameError(ve.args[0])
 
+    def _start_background_save(self, filename="") -> None:
+        """Takes snapshot of world and writes it to file in additional thread (game can go on while file is written)
+
+        filename - file to save world (default - file of world or new autosave file)
+        raise ValueError if type of file is unknown
+        """
+        filename = self.simulation_worker.call(lambda ecosystem: ecosystem.save_filename(filename))
+        if self.simulation_worker.call(lambda ecosystem: ecosystem.journal_active):
+            # Journal appends only changes, it is fast enough to wait for it
+            self.simulation_worker.call(lambda ecosystem: ecosystem.save(filename))
+            self._background_save_done(filename)
+            return
+        snapshot = self.simulation_worker.call(lambda ecosystem: ecosystem.snapshot_for_save(filename))
+        self._start_background_file_operation(configs.GuiMessages.FILE_SAVING.value.format(filename),
+                                              determinate=True)
+        self.auto_period_thread.start(SaveRunnable(self.background_file_signals, filename, snapshot))
+
+    def _background_save_done(self, filename: str) -> None:
+        """Shows message about saved world
+
+        filename - file of saved world
+        """
+        self._finish_background_file_operation()
+        self.statusBar.showMessage(configs.GuiMessages.FILE_SAVED.value.format(filename),
+                                   msecs=configs.MESSAGE_DURATION)
+
+    def _background_file_operation_failed(self, filename: str, msg: str) -> None:
+        """Shows error of save or load in additional thread
+
+        filename - file of failed operation
+        msg - error message
+        """
+        self._finish_background_file_operation()
+        self.statusBar.clearMessage()
+        self._filenameError(configs.GuiMessages.FILE_IO_ERROR.value.format(filename, msg))
+
+    def _background_file_operation_busy(self) -> bool:
+        """Returns True (and shows message) if world is saved or loaded in additional thread now"""
+        if self.background_file_operation:
+            self.statusBar.showMessage(configs.GuiMessages.FILE_IO_BUSY.value, msecs=configs.MESSAGE_DURATION)
+        return self.background_file_operation
+
+    def _start_background_file_operation(self, msg: str, determinate: bool) -> None:
+        """Shows progress of save or load in additional thread
+
+        msg - message of status bar
+        determinate - True if progress is reported in percents, False - progress bar is only busy indicator
+        """
+        self.background_file_operation = True
+        self.fileProgressBar.setRange(0, 100 if determinate else 0)
+        self.fileProgressBar.setValue(0)
+        self.fileProgressBar.setVisible(True)
+        self.statusBar.showMessage(msg)
+
+    def _finish_background_file_operation(self) -> None:
+        """Hides progress of save or load in additional thread"""
+        self.background_file_operation = False
+        self.fileProgressBar.setVisible(False)
+
+    def _save_before_leaving(self) -> None:
+        """Saves world and waits for save (world is left or window is closed right after save)
+
+        Waits for save in additional thread if it is not finished
+        """
+        BACKGROUND_FILE_MUTEX.lock()
+        try:
+            self.simulation_worker.call(lambda ecosystem: ecosystem.save())
+        finally:
+            BACKGROUND_FILE_MUTEX.unlock()
+
     def _filenameError(self, msg: str) -> None:
         """Shows message box if errors occured in file dialog
 
@@ -879,11 +1103,14 @@ class Ui_MainWindow(object):
         ecosystem - data controller part of program
         """
         if MainWindow.game_running_flag:
-            ecosystem.save()
-            self._closeToolBarFunction()
-            MainWindow.lower_tool_bar_active_flag()
-            self.statusBar.showMessage(configs.GuiMessages.FILE_SAVED.value.format(ecosystem.filename),
-                                       msecs=configs.MESSAGE_DURATION)
+            if self._background_file_operation_busy():
+                return
+            try:
+                self._start_background_save()
+                self._closeToolBarFunction()
+                MainWindow.lower_tool_bar_active_flag()
+            except ValueError as ve:
+                self._filenameError(ve.args[0])
 
     def _map_action_triggered(self, MainWindow: CustomMainWindow) -> None:
         """Shows or hide map
@@ -905,6 +1132,8 @@ class Ui_MainWindow(object):
         self.worldMapTable.setVisible(True)
         self.worldMapTable.setEnabled(True)
         self.cellDataListWidget.setVisible(True)
+        self.speciesFilterComboBox.setVisible(True)
+        self.aliveFilterComboBox.setVisible(True)
 
     def _hide_map(self) -> None:
         """Hides map (shows menu background and hide world)"""
@@ -912,6 +1141,8 @@ class Ui_MainWindow(object):
         self.worldMapTable.setEnabled(False)
         self.worldMapTable.setVisible(False)
         self.cellDataListWidget.setVisible(False)
+        self.speciesFilterComboBox.setVisible(False)
+        self.aliveFilterComboBox.setVisible(False)
 
     def _hide_background_picture(self) -> None:
         """Change background of central widget"""
@@ -928,8 +1159,9 @@ class Ui_MainWindow(object):
         """
         self.addCreatureButton.setEnabled(flag)
         self.removeCreatureButton.setEnabled(flag)
-        self.periodButton.setEnabled(flag)
+        self.periodButton.setEnabled(flag and not self.turboButton.isChecked())
         self.autoPeriodButton.setEnabled(flag)
+        self.turboButton.setEnabled(flag)
         if self.autoPeriodButton.isChecked():
             if not flag:
                 self.reduceAutoSpeedButton.setEnabled(flag)
@@ -940,6 +1172,8 @@ class Ui_MainWindow(object):
         self.appocalipseButton.setEnabled(flag)
         self.worldMapTable.setEnabled(flag)
         self.cellDataListWidget.setEnabled(flag)
+        self.speciesFilterComboBox.setEnabled(flag)
+        self.aliveFilterComboBox.setEnabled(flag)
 
     def _set_objects_visible_flag(self, flag: bool) -> None:
         """Sets visible with flag for every object of main window"""
@@ -948,16 +1182,20 @@ class Ui_MainWindow(object):
         self.periodButton.setVisible(flag)
         self.reduceAutoSpeedButton.setVisible(flag)
         self.autoPeriodButton.setVisible(flag)
+        self.turboButton.setVisible(flag)
         self.increaseAutoSpeedButton.setVisible(flag)
         self.wakeDeadlyWormButton.setVisible(flag)
         self.appocalipseButton.setVisible(flag)
         self.worldMapTable.setVisible(flag)
         self.cellDataListWidget.setVisible(flag)
+        self.speciesFilterComboBox.setVisible(flag)
+        self.aliveFilterComboBox.setVisible(flag)
 
     def _pause_game(self) -> None:
         """Make pause of game (setEnabled(False), not change visible)"""
         if self.autoPeriodButton.isChecked():
             self._cancel_auto_period_thread()
+        self.simulation_worker.pause()
         self._set_objects_enabled_flag(False)
         self.statusBar.showMessage(configs.GuiMessages.PAUSE_MESSAGE.value)
 
@@ -965,6 +1203,7 @@ class Ui_MainWindow(object):
         """Make pause, creates menu"""
         if self.autoPeriodButton.isChecked():
             self._cancel_auto_period_thread()
+        self.simulation_worker.pause()
         self._set_objects_enabled_flag(False)
         self._set_objects_visible_flag(False)
         self._show_background_picture()
@@ -976,12 +1215,15 @@ class Ui_MainWindow(object):
         game_running_flag - flag to check if game is running now
         """
         if game_running_flag:
+            self.simulation_worker.resume()
             if self.autoPeriodButton.isChecked():
                 self._start_auto_period_in_thread()
             self._set_objects_visible_flag(True)
             self._set_objects_enabled_flag(True)
             self._hide_background_picture()
             self.statusBar.clearMessage()
+            if self.turboButton.isChecked():
+                self._start_turbo()
 
     def _leave_world(self, MainWindow: CustomMainWindow, ecosystem: EcoSystem) -> None:
         """Close current world.
@@ -993,7 +1235,7 @@ class Ui_MainWindow(object):
         ecosystem - data controller part of program
         """
         if MainWindow.game_running_flag:
-            _, filename = os.path.split(ecosystem.filename)
+            _, filename = os.path.split(self.simulation_worker.call(lambda ecosystem: ecosystem.filename))
             result = QtWidgets.QMessageBox.question(
                 MainWindow,
                 f"Покидаете {filename}?",
@@ -1005,7 +1247,7 @@ class Ui_MainWindow(object):
                 self.statusBar.showMessage(configs.GuiMessages.LEAVE_WORLD.value, configs.MESSAGE_DURATION)
                 self._setEnabledRunningGameDependedButtons(MainWindow.game_running_flag)
             elif result == QtWidgets.QMessageBox.Save:
-                ecosystem.save()
+                self._save_before_leaving()
                 MainWindow.lower_running_game_flag()
                 self.statusBar.showMessage(configs.GuiMessages.LEAVE_WORLD.value, configs.MESSAGE_DURATION)
                 self._setEnabledRunningGameDependedButtons(MainWindow.game_running_flag)
@@ -1032,6 +1274,9 @@ class Ui_MainWindow(object):
         self.autoPeriodButton.setToolTip(_translate("MainWindow", "Режим автоматической смены времени, A"))
         self.autoPeriodButton.setText(_translate("MainWindow", "Авто"))
         self.autoPeriodButton.setShortcut(_translate("MainWindow", "A"))
+        self.turboButton.setToolTip(_translate("MainWindow", "Турбо-режим: много периодов между обновлениями карты, T"))
+        self.turboButton.setText(_translate("MainWindow", "Турбо"))
+        self.turboButton.setShortcut(_translate("MainWindow", "T"))
         self.increaseAutoSpeedButton.setToolTip(_translate("MainWindow", "Ускорить течение времени (работает при при включенном автоматическом режиме), >"))
         self.increaseAutoSpeedButton.setText(_translate("MainWindow", "Ускорить"))
         self.increaseAutoSpeedButton.setShortcut(_translate("MainWindow", ">"))
@@ -1041,9 +1286,8 @@ class Ui_MainWindow(object):
         __sortingEnabled = self.worldMapTable.isSortingEnabled()
         self.worldMapTable.setSortingEnabled(False)
         self.worldMapTable.setSortingEnabled(__sortingEnabled)
-        __sortingEnabled = self.cellDataListWidget.isSortingEnabled()
-        self.cellDataListWidget.setSortingEnabled(False)
-        self.cellDataListWidget.setSortingEnabled(__sortingEnabled)
+        self.speciesFilterComboBox.setToolTip(_translate("MainWindow", "Показывать существ только этого вида"))
+        self.aliveFilterComboBox.setToolTip(_translate("MainWindow", "Показывать живых или мёртвых существ"))
         self.toolBar.setWindowTitle(_translate("MainWindow", "toolBar"))
         self.newWorldAction.setText(_translate("MainWindow", "Создать новый мир"))
         self.loadWorldAction.setText(_translate("MainWindow", "Загрузить мир"))
@@ -1071,6 +1315,8 @@ def play_graphic_mode() -> None:
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = CustomMainWindow()
     ui = Ui_MainWindow()
-    ui.setupUi(MainWindow, EcoSystem())
+    ui.setupUi(MainWindow, EcoSystem(fill=False))
     MainWindow.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    ui.simulation_worker.stop()
+    sys.exit(exit_code)
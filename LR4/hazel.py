@@ -3,20 +3,15 @@ import configs
 from plant import Plant
 import configs
 from typing import List
-import random
+import species_registry
+import random_streams
 
 
+@species_registry.species(configs.EnglishCreaturesNames.HAZEL.value, configs.RussianCreaturesNames.HAZEL.value)
 class Hazel(Plant):
+    __slots__ = ()
 
-    _life_median = configs.LifeMedian.HAZEL_LM.value
-    _max_hp = configs.MaxHP.HAZEL_MHP.value
-    _start_hp = configs.StartHP.HAZEL_START_HP.value
-    _hp_reduction = configs.PlantHPReduction.HAZEL_HPR.value
-    _offspring_dispersion = configs.PlantOffspringDispersion.HAZEL_OD.value
-    _offspring_nutritional_value = configs.NutritionalValue.HAZEL_OFFSPRING_NV.value
-    _start_shrub_nutritional_value = configs.NutritionalValue.START_HAZEL_SNV.value
-    _shrub_reduction = configs.PlantShrubReduction.HAZEL_SR.value
-    _reproduction_age_interval = configs.ReproductionAgeInterval.HAZEL_RAI.value
+    _id_prefix = configs.IdPrefix.HAZEL_PREF.value
     _id_counter = 0
 
     @staticmethod
@@ -48,47 +43,40 @@ class Hazel(Plant):
             if not info_d:
                 raise ValueError
             super()._unpack_info_from_dict(info_d)
-            Hazel._id_counter += 1
             return
 
         self._age = 0
         self._hp = self._start_hp
         self._nutritional_value = self._start_shrub_nutritional_value
-        super()._make_power_coefficient(configs.PersonalPowerCoefficientParameters.HAZEL_PPCP)
-        self._id = configs.IdPrefix.HAZEL_PREF.value + str(self._id_counter)
+        super()._make_power_coefficient(self._personal_power_coefficient)
+        self._number = self._id_counter
         Hazel._id_counter += 1
 
-    def power(self) -> float:
-        if self.is_dead():
-            return 0.0
-        start_power = configs.StartPower.HAZEL_SP.value
-        k_func_coefficient = configs.PowerFunctionCoefficient.HAZEL_PFC.value
-        if self.age <= self._reproduction_age_interval[0]:  # Progression of power
-            return self._power_coefficient * (start_power + (k_func_coefficient * self.age))
-        else:  # Maximal power (const)
-            return self._power_coefficient * (start_power + (k_func_coefficient * self._reproduction_age_interval[0]))
-
     def produce_eatable_offspring(self) -> None:
-        min_amount, max_amount = configs.PlantEatableOffspringPossibleAmount.HAZEL_EOPA.value
-        for i in range(random.randint(min_amount, max_amount)):
+        min_amount, max_amount = self._eatable_offspring_amount
+        for i in range(random_streams.randint(min_amount, max_amount)):
             self._nutritional_value += self._offspring_nutritional_value
+        self._mark_changed()
 
     def reproduction(self) -> List:
-        min_numb, max_numb = configs.ChanceToProduceKids.HAZEL_CTPK.value
-        chance_to_produce = random.randint(min_numb, max_numb)
+        min_numb, max_numb = self._chance_to_produce_kids
+        chance_to_produce = random_streams.randint(min_numb, max_numb)
         if self._can_produce_children() and chance_to_produce == 1:
-            min_amount, max_amount = configs.PossibleKidsAmount.HAZEL_PKA.value
-            grown_amount = random.randint(min_amount, max_amount)
+            min_amount, max_amount = self._possible_kids_amount
+            grown_amount = random_streams.randint(min_amount, max_amount)
             return [Hazel() for _ in range(grown_amount)]
         return []
 
     def be_eaten(self, nutritional_value: int) -> int:
+        old_nutritional_value = self._nutritional_value
         if nutritional_value > self._nutritional_value:
             self._nutritional_value = 0
             self.get_hearted(int(0.5 * (nutritional_value - self._nutritional_value)))
         else:
             self._nutritional_value -= nutritional_value
-            self.get_hearted(int(nutritional_value * configs.UnprotectedDamageMultiplier.HAZEL_UDM.value))
+            self.get_hearted(int(nutritional_value * self._unprotected_damage_multiplier))
+        if self._nutritional_value != old_nutritional_value:
+            self._mark_changed()
         return nutritional_value
 
     def stats(self) -> str:
@@ -0,0 +1,447 @@
+#Author Vodohleb04
+import base64
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import creature_ids
+import species_registry
+from configs import Genders
+
+
+_UNKNOWN_GENDER = -1  # Gender of number that is not recorded (gap in arrays of lineage)
+_FEMALE = 1
+_MALE = 0
+# Place in arrays costs 17 bytes, entry of dict - about 8 times more: numbers older than window of arrays where at
+# least 1 / _DENSE_FILL places are kept move to dict by prune
+_DENSE_FILL = 8
+
+
+class _NameCodes:
+
+    def __init__(self, names: Optional[List[str]] = None):
+        """Creates table of ids from table of names of creature_ids that are saved with pedigree
+
+        Numbers of such ids are different in every process, so they are saved as codes: -2 - index of id in table
+        names - table of saved pedigree (None - new table for pack)
+        """
+        self.names = names if names is not None else []
+        self._codes: Dict[int, int] = {}
+
+    def encode(self, number: int) -> int:
+        """Returns code of number to save (numbers of ids from table of names are replaced)"""
+        if number >= creature_ids.CREATOR_NUMBER:
+            return number
+        code = self._codes.get(number)
+        if code is None:
+            code = self._codes[number] = -2 - len(self.names)
+            self.names.append(creature_ids.format_id("", number))
+        return code
+
+    def decode(self, code: int) -> int:
+        """Returns number of saved code (ids from table of saved pedigree are put into table of names)"""
+        if code >= creature_ids.CREATOR_NUMBER:
+            return code
+        return creature_ids.intern_name(self.names[-2 - code])
+
+    def encode_array(self, numbers: array) -> str:
+        """Returns base64 of little-endian array of codes of numbers"""
+        if numbers and min(numbers) < creature_ids.CREATOR_NUMBER:
+            numbers = array(numbers.typecode, map(self.encode, numbers))
+        return _array_to_text(numbers)
+
+    def decode_array(self, text: str) -> array:
+        """Returns array of numbers of base64 of encode_array"""
+        numbers = _text_to_array("q", text)
+        if numbers and min(numbers) < creature_ids.CREATOR_NUMBER:
+            numbers = array("q", map(self.decode, numbers))
+        return numbers
+
+
+def _array_to_text(values: array) -> str:
+    """Returns base64 of little-endian bytes of array (to save array to json)"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _text_to_array(typecode: str, text: str) -> array:
+    """Returns array of base64 of _array_to_text"""
+    values = array(typecode, base64.b64decode(text))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class _Lineage:
+    __slots__ = ("_first", "_mothers", "_fathers", "_genders", "_sparse")
+
+    def __init__(self):
+        """Creates parents of creatures of one kind
+
+        Numbers of creatures of kind are given one by one, so parents of recent creatures are kept in arrays indexed by
+        number - first number (8 + 8 + 1 bytes per creature). Numbers that are not recorded are gaps (unknown gender,
+        parents are CREATOR). Creatures with negative numbers (ids from saves that are not prefix with number) and old
+        creatures that outlived their neighbours (see prune) are kept in dict
+        """
+        self._first = 0
+        self._mothers = array("q")
+        self._fathers = array("q")
+        self._genders = array("b")
+        self._sparse: Dict[int, Tuple[int, int, int]] = {}  # number -> (gender, mother, father)
+
+    def __len__(self) -> int:
+        """Returns amount of kept places of creatures (recorded creatures and gaps)"""
+        return len(self._genders) + len(self._sparse)
+
+    def _grow(self, number: int) -> None:
+        """Adds gaps to arrays, so number is inside of them (arrays grow at least twice from the front)"""
+        if not self._genders:
+            self._first = number
+        if number < self._first:
+            new_first = max(0, min(number, self._first - len(self._genders)))
+            gap = self._first - new_first
+            self._mothers[:0] = array("q", [creature_ids.CREATOR_NUMBER]) * gap
+            self._fathers[:0] = array("q", [creature_ids.CREATOR_NUMBER]) * gap
+            self._genders[:0] = array("b", [_UNKNOWN_GENDER]) * gap
+            old_first, self._first = self._first, new_first
+            for sparse_number in [sparse_number for sparse_number in self._sparse
+                                  if new_first <= sparse_number < old_first]:
+                self._put(sparse_number, *self._sparse.pop(sparse_number))
+        gap = number - self._first - len(self._genders) + 1
+        if gap > 0:
+            self._mothers.extend(array("q", [creature_ids.CREATOR_NUMBER]) * gap)
+            self._fathers.extend(array("q", [creature_ids.CREATOR_NUMBER]) * gap)
+            self._genders.extend(array("b", [_UNKNOWN_GENDER]) * gap)
+
+    def _put(self, number: int, gender: int, mother: int, father: int) -> None:
+        """Writes entry of number to its place in arrays"""
+        place = number - self._first
+        self._genders[place] = gender
+        self._mothers[place] = mother
+        self._fathers[place] = father
+
+    def record(self, number: int, gender: int, mother: int, father: int) -> None:
+        """Remembers gender and parents of creature with number"""
+        if number < 0 or number in self._sparse:
+            self._sparse[number] = (gender, mother, father)
+            return
+        self._grow(number)
+        self._put(number, gender, mother, father)
+
+    def entry(self, number: int) -> Tuple[int, int, int]:
+        """Returns (gender, mother, father) of creature with number (unknown gender if creature is not recorded)"""
+        place = number - self._first
+        if number >= 0 and 0 <= place < len(self._genders):
+            return self._genders[place], self._mothers[place], self._fathers[place]
+        return self._sparse.get(number, (_UNKNOWN_GENDER, creature_ids.CREATOR_NUMBER, creature_ids.CREATOR_NUMBER))
+
+    def parents(self, number: int) -> Tuple[int, int]:
+        """Returns (mother, father) of creature with number (CREATOR_NUMBER if parent is unknown)"""
+        _, mother, father = self.entry(number)
+        return mother, father
+
+    def children(self) -> Dict[int, List[int]]:
+        """Returns numbers of children of every recorded parent (index is made by one pass over lineage)"""
+        children = {}
+        for place, gender in enumerate(self._genders):
+            if gender != _UNKNOWN_GENDER:
+                for parent in (self._mothers[place], self._fathers[place]):
+                    children.setdefault(parent, []).append(self._first + place)
+        for number, (_, mother, father) in self._sparse.items():
+            for parent in (mother, father):
+                children.setdefault(parent, []).append(number)
+        return children
+
+    def prune(self, kept_numbers: Set[int]) -> None:
+        """Forgets creatures that are not kept
+
+        Arrays start from the oldest kept number of window where at least 1 / _DENSE_FILL places are kept, older kept
+        creatures move to dict, so one long-lived lineage doesn't pin arrays
+        """
+        self._sparse = {number: entry for number, entry in self._sparse.items() if number in kept_numbers}
+        end = self._first + len(self._genders)
+        window_numbers = sorted(number for number in kept_numbers if self._first <= number < end)
+        new_first = end
+        for index, number in enumerate(window_numbers):
+            if (len(window_numbers) - index) * _DENSE_FILL >= end - number:
+                new_first = number
+                break
+        for number in window_numbers:
+            if number >= new_first:
+                break
+            entry = self.entry(number)
+            if entry[0] != _UNKNOWN_GENDER:
+                self._sparse[number] = entry
+        cut = new_first - self._first
+        del self._mothers[:cut]
+        del self._fathers[:cut]
+        del self._genders[:cut]
+        self._first = new_first
+
+    def pack(self, codes: _NameCodes) -> Dict:
+        """Returns json-compatible dict of lineage (arrays are saved as base64 of their bytes)"""
+        return {"first": self._first, "genders": _array_to_text(self._genders),
+                "mothers": codes.encode_array(self._mothers), "fathers": codes.encode_array(self._fathers),
+                "sparse": [[codes.encode(number), gender, codes.encode(mother), codes.encode(father)]
+                           for number, (gender, mother, father) in self._sparse.items()]}
+
+    @staticmethod
+    def unpack(packed: Dict, codes: _NameCodes) -> "_Lineage":
+        """Returns lineage from dict of pack"""
+        lineage = _Lineage()
+        lineage._first = packed["first"]
+        lineage._genders = _text_to_array("b", packed["genders"])
+        lineage._mothers = codes.decode_array(packed["mothers"])
+        lineage._fathers = codes.decode_array(packed["fathers"])
+        if not len(lineage._genders) == len(lineage._mothers) == len(lineage._fathers):
+            raise ValueError("Arrays of lineage of pedigree have different lengths")
+        lineage._sparse = {codes.decode(number): (gender, codes.decode(mother), codes.decode(father))
+                           for number, gender, mother, father in packed["sparse"]}
+        return lineage
+
+
+class Pedigree:
+
+    def __init__(self):
+        """Creates pedigree of animals of ecosystem (creatures with gender reproduction)
+
+        Pedigree maps number of creature to its gender and numbers of its parents (every kind has its own lineage),
+        so ancestors of creature are found after its parents left forest. Ecosystem records every animal that appears
+        in forest, prune forgets extinct lineages: creatures that are neither in forest nor their ancestors within
+        kept amount of generations. Every ecosystem has its own pedigree, kinship checks of animals get it as argument
+        """
+        self._lineages: Dict[type, _Lineage] = {}
+        # (kind, number) of creatures recorded since last take_records, None - records are not tracked
+        self._new_records: Optional[List[Tuple[type, int]]] = None
+
+    def __getstate__(self) -> dict:
+        """Copies of pedigree (sent to workers of tiled cycle) don't track records"""
+        state = self.__dict__.copy()
+        state["_new_records"] = None
+        return state
+
+    def __len__(self) -> int:
+        """Returns amount of kept places of creatures of every kind"""
+        return sum(len(lineage) for lineage in self._lineages.values())
+
+    def _lineage_of(self, kind: type) -> _Lineage:
+        """Returns lineage of kind (new lineage is made for kind that is not recorded yet)"""
+        lineage = self._lineages.get(kind)
+        if lineage is None:
+            lineage = self._lineages[kind] = _Lineage()
+        return lineage
+
+    @staticmethod
+    def entry_of(creature) -> Tuple[type, int, int, int, int]:
+        """Returns (kind, number, gender, mother, father) of animal (entry is recorded by record_entry)"""
+        gender = _FEMALE if creature._gender == Genders.FEMALE else _MALE
+        return type(creature), creature._number, gender, creature._mother, creature._father
+
+    def record_entry(self, kind: type, number: int, gender: int, mother: int, father: int) -> None:
+        """Remembers gender and parents of animal of kind with number (entry is made by entry_of)"""
+        self._lineage_of(kind).record(number, gender, mother, father)
+        if self._new_records is not None:
+            self._new_records.append((kind, number))
+
+    def record(self, creature) -> None:
+        """Remembers gender and parents of animal"""
+        self.record_entry(*self.entry_of(creature))
+
+    def record_creatures(self, creatures: Iterable) -> None:
+        """Remembers gender and parents of every animal of creatures"""
+        for creature in creatures:
+            self.record(creature)
+
+    def _parents(self, kind: type, number: int) -> Tuple[int, int]:
+        """Returns (mother, father) of creature of kind (CREATOR_NUMBER if parent is unknown)"""
+        lineage = self._lineages.get(kind)
+        if lineage is None:
+            return creature_ids.CREATOR_NUMBER, creature_ids.CREATOR_NUMBER
+        return lineage.parents(number)
+
+    def _ancestor_generations(self, creature, generations: int) -> List[Set[int]]:
+        """Returns numbers of creature (generation 0) and its known ancestors of every generation up to generations
+
+        Parents are taken from creature itself, older ancestors - from pedigree
+        """
+        kind = type(creature)
+        result = [{creature._number}]
+        if generations < 1:
+            return result
+        known_parents = {creature._mother, creature._father} - {creature_ids.CREATOR_NUMBER}
+        result.append(known_parents)
+        for _ in range(generations - 1):
+            next_generation = set()
+            for number in result[-1]:
+                next_generation.update(self._parents(kind, number))
+            next_generation.discard(creature_ids.CREATOR_NUMBER)
+            if not next_generation:
+                break
+            result.append(next_generation)
+        return result
+
+    def related(self, first, second, generations: int) -> bool:
+        """Defines if animals of one kind are relatives within generations
+
+        Animals are relatives if one of them is ancestor of other or they have common ancestor, counting at most
+        generations back from both of them (1 - parents and children, brothers and sisters, 2 - also grandparents,
+        grandchildren, cousins, uncles and aunts...)
+        Every set of ancestors has at most 2 ** generation numbers, so check doesn't depend on size of pedigree
+        """
+        if type(first) is not type(second):
+            return False
+        first_lineage = set().union(*self._ancestor_generations(first, generations))
+        return any(not first_lineage.isdisjoint(numbers) for numbers in self._ancestor_generations(second, generations))
+
+    def _format(self, kind: type, number: int, gender: int) -> str:
+        """Returns id (without suffix of dead creature) of creature of kind"""
+        return creature_ids.format_id(kind._id_prefix_of(Genders.FEMALE if gender == _FEMALE else Genders.MALE),
+                                      number)
+
+    def ancestors(self, creature, generations: int) -> List[List[str]]:
+        """Returns ids of known ancestors of animal by generations (the first list - parents, then grandparents...)
+
+        Ids are without suffix of dead creature, ancestors created by CREATOR are not listed
+        """
+        kind = type(creature)
+        result = []
+        generation = [(creature._mother, creature._father)]
+        for _ in range(generations):
+            ids = []
+            next_generation = []
+            seen = set()  # ancestor is listed once per generation even if he is reached by several lines
+            for mother, father in generation:
+                for parent, gender in ((mother, _FEMALE), (father, _MALE)):
+                    if parent != creature_ids.CREATOR_NUMBER and parent not in seen:
+                        seen.add(parent)
+                        ids.append(self._format(kind, parent, gender))
+                        next_generation.append(self._parents(kind, parent))
+            if not ids:
+                break
+            result.append(ids)
+            generation = next_generation
+        return result
+
+    def descendants(self, creature, generations: int) -> List[List[str]]:
+        """Returns ids of recorded descendants of animal by generations (children, then grandchildren...)
+
+        Ids are without suffix of dead creature. Index of children is made by one pass over lineage of kind
+        """
+        kind = type(creature)
+        lineage = self._lineages.get(kind)
+        if lineage is None:
+            return []
+        children = lineage.children()
+        result = []
+        seen = {creature._number}
+        generation = [creature._number]
+        for _ in range(generations):
+            next_generation = []
+            for number in generation:
+                for child in children.get(number, ()):
+                    if child not in seen:
+                        seen.add(child)
+                        next_generation.append(child)
+            if not next_generation:
+                break
+            next_generation.sort()
+            result.append([self._format(kind, child, lineage.entry(child)[0]) for child in next_generation])
+            generation = next_generation
+        return result
+
+    def prune(self, creatures: Iterable, generations: int) -> None:
+        """Forgets extinct lineages
+
+        creatures - animals of forest (they and their ancestors within generations are kept)
+        generations - amount of generations of ancestors that are kept (must be >= generations of kinship checks)
+        """
+        self.prune_numbers(self.kept_numbers(creatures), generations)
+
+    @staticmethod
+    def kept_numbers(creatures: Iterable) -> Dict[type, Set[int]]:
+        """Returns numbers of animals and of their parents by kinds (numbers that are kept by prune)"""
+        kept = {}
+        for creature in creatures:
+            kept.setdefault(type(creature), set()).update((creature._number, creature._mother, creature._father))
+        return kept
+
+    def prune_numbers(self, kept_numbers: Dict[type, Set[int]], generations: int) -> None:
+        """Forgets extinct lineages
+
+        kept_numbers - numbers of animals of forest and of their parents by kinds (made by kept_numbers, animals of
+            parts of forest can be counted separately and united)
+        generations - amount of generations of ancestors that are kept (must be >= generations of kinship checks)
+        """
+        kept: Dict[type, Set[int]] = {kind: set(kept_numbers.get(kind, ())) for kind in self._lineages}
+        for kind, lineage in self._lineages.items():
+            # Generations are walked together for every creature: common ancestors are visited once
+            generation = set(kept[kind])
+            for _ in range(generations - 1):
+                generation = {parent for number in generation for parent in lineage.parents(number)} - kept[kind]
+                if not generation:
+                    break
+                kept[kind].update(generation)
+            kept[kind].discard(creature_ids.CREATOR_NUMBER)
+            lineage.prune(kept[kind])
+
+
+    def pack(self) -> Dict:
+        """Returns json-compatible dict of pedigree (to save it with ecosystem)
+
+        Lineages are keyed by english names of species, arrays of lineages are saved as base64 of their bytes
+        """
+        codes = _NameCodes()
+        lineages = {species_registry.entry_of_kind(kind).english_name: lineage.pack(codes)
+                    for kind, lineage in self._lineages.items()}
+        return {"names": codes.names, "lineages": lineages}
+
+    @staticmethod
+    def unpack(packed: Dict) -> "Pedigree":
+        """Returns pedigree from dict of pack
+
+        raise ValueError if species of lineage is unknown or arrays of lineage are broken
+        """
+        result = Pedigree()
+        codes = _NameCodes(packed["names"])
+        for species_name, packed_lineage in packed["lineages"].items():
+            try:
+                kind = species_registry.entry_by_name(species_name).kind
+            except KeyError:
+                raise ValueError(f"Unknown type of creature in pedigree: {species_name}")
+            result._lineages[kind] = _Lineage.unpack(packed_lineage, codes)
+        return result
+
+    def track_records(self, tracking: bool) -> None:
+        """Starts (tracking is True) or stops tracking of recorded creatures (used by journal of saves)"""
+        self._new_records = [] if tracking else None
+
+    def take_records(self) -> Dict:
+        """Returns json-compatible dict of creatures recorded since last call and starts to collect new ones
+
+        raise RuntimeError if records are not tracked
+        """
+        if self._new_records is None:
+            raise RuntimeError("Records of pedigree are not tracked")
+        codes = _NameCodes()
+        records = []
+        for kind, number in self._new_records:
+            gender, mother, father = self._lineages[kind].entry(number)
+            records.append([species_registry.entry_of_kind(kind).english_name, codes.encode(number), gender,
+                            codes.encode(mother), codes.encode(father)])
+        self._new_records = []
+        return {"names": codes.names, "records": records}
+
+    def apply_records(self, packed_records: Dict) -> None:
+        """Records creatures from dict of take_records (used to replay journal of saves)
+
+        raise ValueError if species of creature is unknown
+        """
+        codes = _NameCodes(packed_records["names"])
+        for species_name, number, gender, mother, father in packed_records["records"]:
+            try:
+                kind = species_registry.entry_by_name(species_name).kind
+            except KeyError:
+                raise ValueError(f"Unknown type of creature in pedigree: {species_name}")
+            self._lineage_of(kind).record(codes.decode(number), gender, codes.decode(mother), codes.decode(father))
@@ -1,19 +1,36 @@
 #Author Vodohleb04
+import random_streams
+import power_tables
 from creature_interfaces import Dieable, Aging, Eatable, Powerful
 from reproduction import NonGenderReproduction
 from abc import ABC
-from typing import Tuple
-from random import randint
+from typing import Dict, Tuple
 
 
 
 class Plant(Dieable, Aging, NonGenderReproduction, Eatable, Powerful, ABC):
+    # Parameters of kind are attributes of class, every plant keeps only its own state
+    __slots__ = ("_hectare", "_number", "_age", "_hp", "_nutritional_value", "_power_coefficient", "_power",
+                 "_power_age")
 
     # _hp_reduction: int
     # _shrub_reduction: int
     # _basic_shrub_nutritional_value: int
     # _offspring_nutritional_value: int
     # _offspring_dispersion: int
+    # Parameters of kind are given by profile of species (see species_profiles)
+    # _power_table: PowerTable - basic power of kind by age
+
+    @classmethod
+    def _apply_profile(cls, profile) -> None:
+        """Builds tables of kind from its profile of species (called by species_profiles)"""
+        cls._power_table = power_tables.growth_table(profile.start_power, profile.power_function_coefficient,
+                                                     profile.reproduction_age_interval, regression=False)
+
+    @classmethod
+    def from_dict(cls, info_d: Dict):
+        """Creates creature of kind from dict of its info (used in load of save)"""
+        return cls(unpack_dict_flag=True, info_d=info_d)
 
     def _can_produce_children(self) -> bool:
         return self._reproduction_age_interval[0] <= self.age <= self._reproduction_age_interval[1] and\
@@ -30,11 +47,10 @@ class Plant(Dieable, Aging, NonGenderReproduction, Eatable, Powerful, ABC):
             if self._hp > self._max_hp:
                 self._hp = self._max_hp
             self._nutritional_value += self._shrub_reduction
+            self._mark_changed()
 
-    def die(self) -> None:
-        if not self.is_dead():
-            self._id += "_dead"
-            super().die()
+    def _power_of_age(self, age: int) -> float:
+        return self._power_coefficient * self._power_table[age]
 
     @property
     def offspring_dispersion(self) -> int:
@@ -44,7 +60,7 @@ class Plant(Dieable, Aging, NonGenderReproduction, Eatable, Powerful, ABC):
         self._age += 1
 
         if self._age > self._life_median:
-            chance = randint(0, self._age - self._life_median)
+            chance = random_streams.randint(0, self._age - self._life_median)
             if chance != 0:
                 self.die()
                 return
@@ -66,7 +82,7 @@ class Plant(Dieable, Aging, NonGenderReproduction, Eatable, Powerful, ABC):
             "hp": self._hp,
             "nutritional_value": self._nutritional_value,
             "power_coefficient": self._power_coefficient,
-            "id": self._id
+            "id": self.id
         }
 
     def _unpack_info_from_dict(self, info: dict):
@@ -78,7 +94,7 @@ class Plant(Dieable, Aging, NonGenderReproduction, Eatable, Powerful, ABC):
         self._hp = info["hp"]
         self._nutritional_value = info["nutritional_value"]
         self._power_coefficient = info["power_coefficient"]
-        self._id = info["id"]
+        self._set_id(info["id"])
 
     def stats(self) -> str:
         """Returns string with information about creature conditions
@@ -0,0 +1,48 @@
+#Author Vodohleb04
+from typing import Callable, Tuple
+
+
+class PowerTable:
+    __slots__ = ("_values", "_tail")
+
+    def __init__(self, values: Tuple[float, ...], tail: Callable[[int], float]):
+        """Creates table of basic power of kind (without personal power coefficient) by age
+
+        values - basic power of ages 0, 1, ..., len(values) - 1
+        tail - function that returns basic power of older creatures
+        Table is built once when class of kind is created, so power of creature is not counted by formula every time
+        """
+        if not values:
+            raise ValueError("Table of power must have at least one value")
+        self._values = values
+        self._tail = tail
+
+    def __getitem__(self, age: int) -> float:
+        """Returns basic power of creature of age"""
+        if age < len(self._values):
+            return self._values[age]
+        return self._tail(age)
+
+
+def constant_tail(values: Tuple[float, ...]) -> Callable[[int], float]:
+    """Returns tail of table that keeps the last value of values"""
+    last_value = values[-1]
+    return lambda age: last_value
+
+
+def growth_table(start_power: float, k_func_coefficient: float, reproduction_age_interval: Tuple[int, int],
+                 regression=True) -> PowerTable:
+    """Returns table of power that grows until reproduction age
+
+    start_power - power of newborn creature
+    k_func_coefficient - growth of power per period
+    reproduction_age_interval - power grows until the first age of interval, and stays maximal until the last one
+    regression - True if power of creature older than reproduction ages falls (for animals)
+    """
+    first_age, last_age = reproduction_age_interval
+    values = [start_power + (k_func_coefficient * age) for age in range(first_age + 1)]
+    if regression:
+        values += [start_power + (k_func_coefficient * first_age)] * (last_age - first_age)
+        values.append(start_power + (-k_func_coefficient * first_age))
+    values = tuple(values)
+    return PowerTable(values, constant_tail(values))
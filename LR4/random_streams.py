@@ -0,0 +1,95 @@
+#Author Vodohleb04
+import json
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List
+
+try:
+    import numpy
+except ImportError:  # numpy generators are optional (used only by batch operations that require numpy)
+    numpy = None
+
+
+class RandomStream(random.Random):
+    """Random stream of ecosystem: random.Random with substreams, one-call draws and state that can be saved to json"""
+
+    def randint_batch(self, a: int, b: int, size: int) -> List[int]:
+        """Returns size random integers in range [a, b] drawn by one call of choices (cheaper than size calls of
+        randint, numbers don't depend on numpy, so saves continue equally with or without it)
+
+        raise ValueError if b < a
+        """
+        if b < a:
+            raise ValueError(f"Empty range for randint_batch({a}, {b})")
+        return self.choices(range(a, b + 1), k=size)
+
+    def numpy_generator(self):
+        """Returns numpy random generator seeded from this stream (for vectorized draws of batch operations)
+
+        raise RuntimeError if numpy is not installed
+        """
+        if numpy is None:
+            raise RuntimeError("numpy generator requires numpy")
+        return numpy.random.default_rng(self.getrandbits(64))
+
+    def spawn_seeds(self, amount: int) -> List[int]:
+        """Returns seeds of amount independent substreams (for parallel workers)"""
+        return [self.getrandbits(64) for _ in range(amount)]
+
+    def spawn(self, amount: int) -> List["RandomStream"]:
+        """Returns amount independent substreams (for parallel workers)"""
+        return [RandomStream(seed) for seed in self.spawn_seeds(amount)]
+
+    def pack_state(self) -> str:
+        """Returns state of stream as string (to save it in json)"""
+        return json.dumps(self.getstate())
+
+    def unpack_state(self, packed_state: str) -> None:
+        """Restores state of stream from string of pack_state"""
+        version, internal_state, gauss_next = json.loads(packed_state)
+        self.setstate((version, tuple(internal_state), gauss_next))
+
+
+# Active stream is context-local: every thread (GUI, simulation worker, loading and saving threads) sees its own
+# active stream, so activation in one thread never redirects draws of another one
+_active: ContextVar[RandomStream] = ContextVar("active_random_stream", default=RandomStream())
+
+
+def randint(a: int, b: int) -> int:
+    """Returns random integer in range [a, b] drawn from active stream"""
+    return _active.get().randint(a, b)
+
+
+def choice(seq):
+    """Returns random element of non-empty sequence drawn from active stream"""
+    return _active.get().choice(seq)
+
+
+def getrandbits(k: int) -> int:
+    """Returns integer with k random bits drawn from active stream"""
+    return _active.get().getrandbits(k)
+
+
+def active() -> RandomStream:
+    """Returns active random stream of current context (stream that is used by creatures)"""
+    return _active.get()
+
+
+def activate(stream: RandomStream) -> None:
+    """Makes stream active in current context: all next draws of creatures of this thread are made from it"""
+    _active.set(stream)
+
+
+@contextmanager
+def activated(stream: RandomStream):
+    """Makes stream active inside of with block, previously active stream is active again after it
+
+    Ecosystem activates its stream only while its creatures draw numbers, so other ecosystems (loaded, ensemble
+    members) never redirect draws of running one. Activation is local to current context (thread)
+    """
+    token = _active.set(stream)
+    try:
+        yield stream
+    finally:
+        _active.reset(token)
@@ -3,15 +3,19 @@ from abc import ABC, abstractmethod
 from typing import Tuple
 
 import configs
-from forest import Hectare
+import creature_ids
+from pedigree import Pedigree
+from forest import Hectare, id_index_key
 from configs import Genders
-import random
+import random_streams
 
 
 class Reproduction(ABC):
+    __slots__ = ()
 
     #_reproduction_age_interval: Tuple[int, int]
-    #_id: str
+    #_id_prefix: str
+    #_number: int
     #_id_counter: int
 
     def __str__(self) -> str:
@@ -22,15 +26,37 @@ class Reproduction(ABC):
         """Returns identificator of creature
 
         Every creature has its own unique identificator
-        For creatures with non-gender reproduction is *creature-type*_*id-number*
+        For creatures with non-gender reproduction is *creature-type**id-number*
             creature-type - name of creature type
             id-number - unique identificator number (unique in within class)
         For creatures with gender reproduction is *gender*_*creature-type*_*id-number*
             gender - gender of creature (determines randomly in __init__ of creature)
             creature-type - name of creature type
             id-number - unique identificator number (unique in within class)
+        Suffix DEAD_ID_SUFFIX is added to id of dead creature. Creature keeps only its number, id is formatted when
+        it is asked
         """
-        return self._id
+        if self.is_dead():
+            return self.id_key + configs.DEAD_ID_SUFFIX
+        return self.id_key
+
+    @property
+    def id_key(self) -> str:
+        """Returns id of creature without suffix of dead creature (key of creature in indexes of forest)"""
+        return creature_ids.format_id(self._own_id_prefix(), self._number)
+
+    def _own_id_prefix(self) -> str:
+        """Returns prefix of id of creature (id is prefix with number of creature)"""
+        return self._id_prefix
+
+    @classmethod
+    def id_prefixes(cls) -> Tuple[str, ...]:
+        """Returns every prefix of ids of creatures of this kind"""
+        return (cls._id_prefix,)
+
+    def _set_id(self, creature_id: str) -> None:
+        """Sets number of creature by its id (used to unpack creature from dict)"""
+        self._number = creature_ids.parse_id(id_index_key(creature_id), self._own_id_prefix())
 
     @property
     def reproduction_age_interval(self) -> Tuple[int, int]:
@@ -39,6 +65,7 @@ class Reproduction(ABC):
 
 
 class NonGenderReproduction(Reproduction, ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -55,6 +82,22 @@ class NonGenderReproduction(Reproduction, ABC):
         """Determines if creature is reproductive"""
         return self._can_produce_children()
 
+    def choose_dispersion_position(self, parent_position: Tuple[int, int],
+                                   forest_size: Tuple[int, int]) -> Tuple[int, int]:
+        """Returns number of hectare (vertical number, horizontal number) where this offspring grows
+
+        parent_position - position of the parent creature(base position to disperse from)
+        forest_size - (vertical length, horizontal length) of forest
+        """
+        vert_pos, horiz_pos = parent_position
+        vertical_length, horizontal_length = forest_size
+        vertical_shift = random_streams.randint(-self.offspring_dispersion, self.offspring_dispersion)
+        horizontal_shift = random_streams.randint(-self.offspring_dispersion, self.offspring_dispersion)
+        while vert_pos + vertical_shift >= vertical_length or horiz_pos + horizontal_shift >= horizontal_length:
+            vertical_shift = random_streams.randint(-1, 1)
+            horizontal_shift = random_streams.randint(-1, 1)
+        return vert_pos + vertical_shift, horiz_pos + horizontal_shift
+
     @abstractmethod
     def reproduction(self):
         """Makes children (offspring) of creature and disperse them"""
@@ -62,9 +105,11 @@ class NonGenderReproduction(Reproduction, ABC):
 
 
 class GenderReproduction(Reproduction, ABC):
+    __slots__ = ()
 
     #_gender: Genders
-    #_parents: Tuple[str, str]
+    #_mother: int
+    #_father: int
 
     @property
     def gender(self) -> Genders:
@@ -73,40 +118,56 @@ class GenderReproduction(Reproduction, ABC):
 
     @property
     def parents(self) -> Tuple[str, str]:
-        """Returns identificators of creatures\'s parents """
-        return self._parents
-
-    def _are_relatives(self, possible_relative) -> bool:
-        """Defines if creatures are relatives"""
-        if possible_relative.id in self.parents or self.id in possible_relative.parents:
-            return True
-        if configs.CREATOR in self.parents or configs.CREATOR in possible_relative.parents:
-            return False
-        if self.parents[0] in possible_relative.parents or self.parents[1] in possible_relative.parents:
-            return True
-        return False
+        """Returns identificators of creatures\'s parents (mother, father)"""
+        return self.mother, self.father
+
+    @classmethod
+    def _id_prefix_of(cls, gender: Genders) -> str:
+        """Returns prefix of ids of creatures of this kind with gender"""
+        return f"{gender.value}_{cls._id_prefix}_"
+
+    def _own_id_prefix(self) -> str:
+        return self._id_prefix_of(self._gender)
+
+    @classmethod
+    def id_prefixes(cls) -> Tuple[str, ...]:
+        return tuple(cls._id_prefix_of(gender) for gender in Genders)
+
+    def _set_parents(self, parents) -> None:
+        """Sets numbers of parents by their ids (used to unpack creature from dict)
+
+        parents - ids of mother and father (mother is the first one unless only the second one is female)
+        """
+        mother_name, father_name = parents
+        if father_name.startswith(Genders.FEMALE.value) and not mother_name.startswith(Genders.FEMALE.value):
+            mother_name, father_name = father_name, mother_name
+        self._mother = creature_ids.parse_id(mother_name, self._id_prefix_of(Genders.FEMALE))
+        self._father = creature_ids.parse_id(father_name, self._id_prefix_of(Genders.MALE))
+
+    def _are_relatives(self, possible_relative, kinship: Pedigree) -> bool:
+        """Defines if creatures are relatives within KINSHIP_GENERATIONS generations
+
+        kinship - pedigree of ecosystem (ancestors older than parents are taken from it)
+        Numbers are compared, ids are not formatted
+        """
+        return kinship.related(self, possible_relative, configs.KINSHIP_GENERATIONS)
 
     @property
     def father(self) -> str:
         """Returns identificator of creature\'s father"""
-        if self.parents[0].startswith(Genders.MALE.value):
-            return self.parents[0]
-        else:
-            return self.parents[1]
+        return creature_ids.format_id(self._id_prefix_of(Genders.MALE), self._father)
 
     @property
     def mother(self) -> str:
         """Returns identificator of creature\'s mother"""
-        if self.parents[0].startswith(Genders.FEMALE.value):
-            return self.parents[0]
-        else:
-            return self.parents[1]
+        return creature_ids.format_id(self._id_prefix_of(Genders.FEMALE), self._mother)
 
     @abstractmethod
-    def _can_produce_children(self, partner) -> bool:
+    def _can_produce_children(self, partner, kinship: Pedigree) -> bool:
         """Determines if creature can produce children with partner
 
         partner - other creature of this type to produce children with
+        kinship - pedigree of ecosystem (relatives can't produce children)
         """
         raise NotImplementedError
 
@@ -124,20 +185,24 @@ class GenderReproduction(Reproduction, ABC):
         raise NotImplementedError
     
     @abstractmethod
-    def _search_for_partner(self, hectare: Hectare):
-        """Search for partner to produce children in hectare"""
+    def _search_for_partner(self, hectare: Hectare, kinship: Pedigree):
+        """Search for partner to produce children in hectare (kinship - pedigree of ecosystem)"""
         raise NotImplementedError
 
-    def reproduction(self, hectare: Hectare):
-        """Process of searching for partner and producing children"""
+    def reproduction(self, hectare: Hectare, kinship: Pedigree):
+        """Process of searching for partner and producing children
+
+        hectare - hectare of creature
+        kinship - pedigree of ecosystem (used to skip relatives)
+        """
         if not isinstance(hectare, Hectare):
             raise TypeError
-        return self._produce_children(self._search_for_partner(hectare))
+        return self._produce_children(self._search_for_partner(hectare, kinship))
 
     @staticmethod
     def _random_gender() -> Genders:
         """Returns random gender"""
-        gender_chance = random.randint(0, 9)
+        gender_chance = random_streams.randint(0, 9)
         if gender_chance % 2 == 0:
             return Genders.FEMALE
         else:
@@ -0,0 +1,244 @@
+#Author Vodohleb04
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import configs
+import streaming_save
+from forest import Forest, id_index_key
+from pedigree import Pedigree
+
+
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_JOURNAL_SUFFIX = ".journal.compacting"  # Journal that is being merged into base save by compaction
+
+def journal_filenames(filename: str) -> Tuple[str, str]:
+    """Returns (compacting journal, journal) of save (in order of replay)"""
+    return filename + COMPACTING_JOURNAL_SUFFIX, filename + JOURNAL_SUFFIX
+
+
+def has_journal(filename: str) -> bool:
+    """Returns True if save has journal of changes"""
+    return any(os.path.exists(journal_filename) for journal_filename in journal_filenames(filename))
+
+
+def remove_journal(filename: str) -> None:
+    """Removes journal of save (used when save is rewritten completely)"""
+    for journal_filename in journal_filenames(filename):
+        if os.path.exists(journal_filename):
+            os.remove(journal_filename)
+
+
+def _record_order(creature) -> Tuple:
+    """Returns key of creature in order of records of entry (position of hectare, kind and number of creature)"""
+    return creature._hectare.position, type(creature).__qualname__, creature._number
+
+
+def _open_journals(journals) -> List:
+    """Opens existing files of journal (journal is opened before compacting journal, so entries that are moved to
+    compacting journal or merged into base save while journals are opened are not lost)
+
+    journals - files of journal in order of replay
+    Returns opened files in order of replay
+    """
+    journal_files = []
+    for journal_filename in reversed(journals):
+        try:
+            journal_files.append(open(journal_filename, "r"))
+        except FileNotFoundError:
+            pass
+    journal_files.reverse()
+    return journal_files
+
+
+def _read_entries(journal_file) -> Iterator[Tuple[Dict, List[Dict]]]:
+    """Returns entries of opened journal (header of entry, records of creatures), broken tail of journal is ignored"""
+    while True:
+        line = journal_file.readline()
+        if not line.endswith("\n"):
+            return
+        try:
+            entry = json.loads(line)
+            records = []
+            for _ in range(entry["records"]):
+                line = journal_file.readline()
+                if not line.endswith("\n"):
+                    return
+                records.append(json.loads(line))
+        except (ValueError, KeyError, TypeError):
+            return
+        yield entry, records
+
+
+def replay(filename: str, journals=None) -> Tuple[Dict, Dict, int, List[Dict], Pedigree]:
+    """Applies journal of changes to base save
+
+    filename - base save (streaming save)
+    journals - files of journal to apply (default - compacting journal and journal of save)
+    Returns (general parameters of ecosystem, id counters, number of the last applied entry of journal, records of
+    creatures in order of hectares and of their creations, pedigree of ecosystem)
+    Journals are opened before base save: if compaction merges them meanwhile, their entries are skipped by number
+    """
+    if journals is None:
+        journals = journal_filenames(filename)
+    journal_files = _open_journals(journals)
+    try:
+        with streaming_save.NdjsonSaveReader(filename) as save_reader:
+            ecosystem_info = save_reader.ecosystem_info
+            id_counters = save_reader.id_counters
+            sequence = save_reader.journal_sequence
+            kinship = Pedigree() if save_reader.pedigree is None else Pedigree.unpack(save_reader.pedigree)
+            periods = ecosystem_info.get("periods_count", 0)
+            states = {}  # key of id of creature -> (record of creature, number of period when record was made)
+            hectare_orders = {}  # position of hectare -> keys of ids of its creatures in order of creations
+            for record in save_reader.records():
+                key = id_index_key(record["id"])
+                states[key] = (record, periods)
+                hectare_orders.setdefault(tuple(record["position"]), []).append(key)
+
+        for journal_file in journal_files:
+            for entry, records in _read_entries(journal_file):
+                if entry["sequence"] <= sequence:
+                    continue  # Entry is already included into base save (by compaction)
+                sequence = entry["sequence"]
+                periods = entry["periods"]
+                ecosystem_info = entry["ecosystem"]
+                id_counters = entry["id_counters"]
+                if "pedigree" in entry:
+                    kinship.apply_records(entry["pedigree"])
+                for key in entry["removed"]:
+                    states.pop(key, None)
+                for record in records:
+                    states[id_index_key(record["id"])] = (record, periods)
+                for i, j, keys in entry["hectares"]:
+                    hectare_orders[(i, j)] = keys
+    finally:
+        for journal_file in journal_files:
+            journal_file.close()
+
+    creature_records = []
+    for position in sorted(hectare_orders):
+        for key in hectare_orders[position]:
+            record, record_periods = states[key]
+            record = dict(record, position=position)
+            record["age"] += periods - record_periods
+            if "sterile_period" in record:
+                record["sterile_period"] -= periods - record_periods
+            creature_records.append(record)
+    return ecosystem_info, id_counters, sequence, creature_records, kinship
+
+
+def compact(filename: str) -> None:
+    """Merges compacting journal into base save (base save is replaced only after new one is written)"""
+    compacting_filename, _ = journal_filenames(filename)
+    ecosystem_info, id_counters, sequence, records, kinship = replay(filename, [compacting_filename])
+    streaming_save.write_ndjson_save(filename, ecosystem_info, id_counters, records, journal_sequence=sequence,
+                                     pedigree=kinship.pack())
+    os.remove(compacting_filename)
+
+
+class SaveJournal:
+
+    def __init__(self, filename: str, compaction_interval: int):
+        """Creates journal of changes of ecosystem
+
+        filename - base save (streaming save), journal is kept in filename.journal
+        compaction_interval - amount of entries of journal after which journal is merged into base save in
+            background thread (0 - journal is not merged)
+        raise ValueError if base save is not streaming save or compaction_interval < 0
+        """
+        if filename.endswith(configs.BINARY_SNAPSHOT_EXTENSION):
+            raise ValueError(f"Journal is kept only for streaming saves, {filename} got instead")
+        if compaction_interval < 0:
+            raise ValueError(f"Compaction interval must be >= 0, {compaction_interval} got instead")
+        self._filename = filename
+        self._compacting_filename, self._journal_filename = journal_filenames(filename)
+        self._compaction_interval = compaction_interval
+        self._sequence = 0
+        self._entries_since_compaction = 0
+        self._compaction = None
+
+    @property
+    def filename(self) -> str:
+        """Returns base save of journal"""
+        return self._filename
+
+    def start(self, forest: Forest, kinship: Pedigree, periods: int, ecosystem_info: Dict, id_counters: Dict,
+              record_of: Callable) -> None:
+        """Writes base save of world and starts tracking of changes of forest and of records of pedigree
+
+        forest - forest of ecosystem
+        kinship - pedigree of ecosystem
+        periods - amount of periods of ecosystem
+        ecosystem_info - general parameters of ecosystem
+        id_counters - id counters of kinds of creatures
+        record_of - function (creature, position) -> dict of creature
+        """
+        self.wait_for_compaction()
+        remove_journal(self._filename)
+        self._sequence = 0
+        self._entries_since_compaction = 0
+
+        def base_records():
+            for i, hectare_line in enumerate(forest.hectares):
+                for j, hectare in enumerate(hectare_line):
+                    for creature in hectare.creations:
+                        yield record_of(creature, (i, j))
+
+        streaming_save.write_ndjson_save(self._filename, ecosystem_info, id_counters, base_records(),
+                                         pedigree=kinship.pack())
+        forest.track_changes(True)
+        kinship.track_records(True)
+
+    def append(self, forest: Forest, kinship: Pedigree, periods: int, ecosystem_info: Dict, id_counters: Dict,
+               record_of: Callable) -> int:
+        """Appends entry with creatures that were created, changed, moved or removed since last entry and animals
+        recorded to pedigree since last entry
+
+        Arguments are the same as in start
+        Returns amount of records of creatures in entry
+        Creatures mark themselves in their hectares when they are changed, so only added, moved and marked creatures are
+        turned into records, the rest of forest isn't read (aging is the same for every creature: replay counts it
+        from the number of period)
+        """
+        changed_creatures, removed_creatures, changed_positions, changed_states = forest.take_changes()
+        records = [record_of(creature, creature._hectare.position)
+                   for creature in sorted((changed_creatures | changed_states) - removed_creatures, key=_record_order)]
+        removed_ids = sorted(creature.id_key for creature in removed_creatures)
+        hectares = []
+        for i, j in sorted(changed_positions):
+            hectares.append([i, j, [creature.id_key for creature in forest.hectares[i][j].creations]])
+
+        self._sequence += 1
+        entry = {"sequence": self._sequence, "periods": periods, "ecosystem": ecosystem_info,
+                 "id_counters": id_counters, "removed": removed_ids, "hectares": hectares,
+                 "pedigree": kinship.take_records(), "records": len(records)}
+        with open(self._journal_filename, "a") as journal_file:
+            journal_file.write(json.dumps(entry) + "\n")
+            for record in records:
+                journal_file.write(json.dumps(record) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        self._entries_since_compaction += 1
+        if self._compaction_interval and self._entries_since_compaction >= self._compaction_interval:
+            self._start_compaction()
+        return len(records)
+
+    def _start_compaction(self) -> None:
+        """Moves journal aside and merges it into base save in background thread (new entries go to new journal)"""
+        if self._compaction is not None and self._compaction.is_alive():
+            return  # Previous compaction is not finished, journal is merged next time
+        if os.path.exists(self._compacting_filename):
+            return  # Compaction was interrupted, its journal is replayed on load
+        os.replace(self._journal_filename, self._compacting_filename)
+        self._entries_since_compaction = 0
+        self._compaction = threading.Thread(target=compact, args=(self._filename,), daemon=True)
+        self._compaction.start()
+
+    def wait_for_compaction(self) -> None:
+        """Waits until background compaction is finished"""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
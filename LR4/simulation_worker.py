@@ -0,0 +1,217 @@
+#Author Vodohleb04
+import copy
+import time
+from enum import Enum
+from typing import Callable
+
+from PyQt5 import QtCore
+
+import configs
+from ecosystem import EcoSystem
+from world_view import WorldViewPublisher
+
+
+def detached_copy(ecosystem: EcoSystem, value):
+    """Returns copy of value that doesn't share state with world of ecosystem (called in thread of worker)
+
+    ecosystem - ecosystem whose world value belongs to
+    value - result of action with ecosystem (strings, numbers, enums and classes are returned as they are)
+    Copied creatures are detached from hectares of forest: their changes don't get into forest, journal or views
+    """
+    if value is None or isinstance(value, (str, int, float, Enum, type)):
+        return value
+    if value is ecosystem or value is ecosystem.forest:
+        return copy.deepcopy(value)
+    forest = ecosystem.forest
+    memo = {id(hectare): None for hectare_line in forest.hectares for hectare in hectare_line if hectare is not value}
+    memo[id(forest)] = None
+    return copy.deepcopy(value, memo)
+
+
+class SimulationWorker(QtCore.QObject):
+    viewPublished = QtCore.pyqtSignal(object)  # WorldView made after periods or changes of world
+    _cyclesRequested = QtCore.pyqtSignal(int)
+    _turboRequested = QtCore.pyqtSignal()
+    _viewRequested = QtCore.pyqtSignal(bool)
+    _callRequested = QtCore.pyqtSignal(object)
+
+    def __init__(self, ecosystem: EcoSystem):
+        """Creates worker that makes periods of ecosystem in its own thread
+
+        ecosystem - data controller part of program, after start it is changed only in thread of worker
+        Widgets get immutable views of world (viewPublished), other actions with ecosystem are marshalled to thread
+        of worker by call. While worker is paused, it doesn't make periods, so ecosystem can be read by paused game
+        """
+        super().__init__()
+        self._ecosystem = ecosystem
+        self._publisher = WorldViewPublisher()
+        self._selected = None
+        self._paused = False
+        self._turbo = False
+        self._turbo_batches_planned = False  # True while batches of turbo mode follow each other
+        self._thread = QtCore.QThread()
+        self.moveToThread(self._thread)
+        self._cyclesRequested.connect(self._run_cycles)
+        self._turboRequested.connect(self._begin_turbo)
+        self._viewRequested.connect(self._publish_requested_view)
+        self._callRequested.connect(self._execute, QtCore.Qt.BlockingQueuedConnection)
+
+    def start(self) -> None:
+        """Starts thread of worker"""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops thread of worker (waits for current periods)"""
+        self._turbo = False
+        self._thread.quit()
+        self._thread.wait()
+
+    def request_cycles(self, amount=1) -> None:
+        """Asks worker to make amount periods and to publish view after them (ignored while worker is paused)"""
+        self._cyclesRequested.emit(amount)
+
+    def request_view(self, full=False) -> None:
+        """Asks worker to publish view of current world
+
+        full - True if every item of view must be drawn again
+        """
+        self._viewRequested.emit(full)
+
+    def select_hectare(self, vertical_number: int, horizontal_number: int) -> None:
+        """Sets hectare whose creatures are included into views and asks worker to publish view"""
+        self._selected = (vertical_number, horizontal_number)
+        self.request_view()
+
+    def start_turbo(self) -> None:
+        """Starts to make periods in batches, view is published after every batch"""
+        self._turbo = True
+        self._turboRequested.emit()
+
+    def stop_turbo(self) -> None:
+        """Stops turbo mode after current period"""
+        self._turbo = False
+
+    def call(self, function: Callable, publish=False, copy_result=False):
+        """Calls function(ecosystem) in thread of worker and returns its result
+
+        function - action with ecosystem
+        publish - True to publish view after function (function changes world)
+        copy_result - True to get detached copy of result instead of live creatures or forest (see detached_copy)
+        Caller waits until current periods of worker are over, exceptions of function are raised to caller.
+        Function is called at once if caller is in thread of worker (blocking signal would wait for itself)
+        """
+        box = [function, publish, None, None, copy_result]  # function, publish, result, exception, copy_result
+        if QtCore.QThread.currentThread() is self._thread:
+            self._execute(box)
+        else:
+            self._callRequested.emit(box)
+        if box[3] is not None:
+            raise box[3]
+        return box[2]
+
+    def pause(self) -> None:
+        """Stops to make periods (waits for current periods), ecosystem is not changed by worker until resume"""
+        self._turbo = False
+        self.call(self._set_paused)
+
+    def resume(self) -> None:
+        """Allows worker to make periods again"""
+        self._paused = False
+
+    def _set_paused(self, ecosystem: EcoSystem) -> None:
+        """Marks worker paused (called in thread of worker)"""
+        self._paused = True
+
+    @QtCore.pyqtSlot(object)
+    def _execute(self, box) -> None:
+        """Calls function of box in thread of worker and puts its result or exception into box"""
+        function, publish, copy_result = box[0], box[1], box[4]
+        try:
+            result = function(self._ecosystem)
+            box[2] = detached_copy(self._ecosystem, result) if copy_result else result
+        except Exception as ex:
+            box[3] = ex
+        if publish:
+            self._publish_view()
+
+    @QtCore.pyqtSlot(int)
+    def _run_cycles(self, amount: int) -> None:
+        """Makes amount periods and publishes view"""
+        if self._paused:
+            return
+        start = time.perf_counter()
+        for _ in range(amount):
+            self._ecosystem.cycle()
+        self._publish_view(cycles=amount, elapsed=time.perf_counter() - start)
+
+    @QtCore.pyqtSlot()
+    def _begin_turbo(self) -> None:
+        """Starts batches of turbo mode if they are not going already"""
+        if not self._turbo_batches_planned:
+            self._turbo_batches_planned = True
+            self._turbo_batch()
+
+    def _turbo_batch(self) -> None:
+        """Makes periods until time of one frame is over, publishes view and plans the next batch
+
+        Widgets get at most MAX_FPS views per second, requests of other threads are handled between batches
+        """
+        if not self._turbo or self._paused:
+            self._turbo_batches_planned = False
+            return
+        start = time.perf_counter()
+        frame_end = start + 1 / configs.TurboParams.MAX_FPS.value
+        cycles = 0
+        while self._turbo:
+            self._ecosystem.cycle()
+            cycles += 1
+            if cycles >= configs.TurboParams.MAX_CYCLES_PER_FRAME.value or time.perf_counter() >= frame_end:
+                break
+        self._publish_view(cycles=cycles, elapsed=time.perf_counter() - start)
+        QtCore.QTimer.singleShot(0, self._turbo_batch)
+
+    @QtCore.pyqtSlot(bool)
+    def _publish_requested_view(self, full: bool) -> None:
+        """Publishes view asked by request_view"""
+        if full:
+            self._publisher.reset()
+        self._publish_view()
+
+    def _publish_view(self, cycles=0, elapsed=0.0) -> None:
+        """Builds view of world and sends it to widgets"""
+        self.viewPublished.emit(self._publisher.publish(self._ecosystem, self._selected, cycles, elapsed))
+
+
+class EcosystemProxy:
+
+    def __init__(self, worker: SimulationWorker):
+        """Creates object that is used by dialogs instead of ecosystem
+
+        worker - worker of ecosystem, every attribute of ecosystem is read and every method of ecosystem is called
+            through proxy in thread of worker
+        Proxy returns detached copies (see detached_copy), live creatures and forest stay in thread of worker
+        """
+        self._worker = worker
+
+    def __getattr__(self, name: str):
+        """Returns copy of attribute name of ecosystem or function that calls method name of ecosystem in thread
+        of worker (attribute is resolved in thread of worker, properties are read there once)
+
+        raise AttributeError if ecosystem has no attribute name
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)  # Special attributes (copy, pickle protocols) belong to proxy itself
+
+        def resolve(ecosystem: EcoSystem):
+            attribute = getattr(ecosystem, name)
+            if callable(attribute) and not isinstance(attribute, type):
+                return None
+            return detached_copy(ecosystem, attribute),
+
+        resolved = self._worker.call(resolve)
+        if resolved is not None:
+            return resolved[0]
+
+        def call_in_worker(*args, **kwargs):
+            return self._worker.call(lambda ecosystem: getattr(ecosystem, name)(*args, **kwargs), copy_result=True)
+        return call_in_worker
@@ -0,0 +1,200 @@
+#Author Vodohleb04
+import json
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import configs
+
+
+class SpeciesProfile(NamedTuple):
+    """Immutable parameters of species (compiled from enums of config or loaded from file)
+
+    Every parameter is copied to attribute of class of species with "_" before its name (life_median ->
+    _life_median), so creatures read plain attributes of their class. Parameters that are not used by species are None
+    Pairs of numbers are (min, max) of random choice or interval of ages, personal power coefficients are
+    (min numerator, max numerator, denominator)
+    """
+    life_median: int
+    max_hp: int
+    reproduction_age_interval: Tuple[int, int]
+    chance_to_produce_kids: Tuple[int, int]
+    possible_kids_amount: Tuple[int, int]
+    unprotected_damage_multiplier: float
+    # Plants
+    start_hp: Optional[int] = None
+    hp_reduction: Optional[int] = None
+    shrub_reduction: Optional[int] = None
+    offspring_dispersion: Optional[int] = None
+    offspring_nutritional_value: Optional[int] = None
+    start_shrub_nutritional_value: Optional[int] = None
+    eatable_offspring_amount: Optional[Tuple[int, int]] = None
+    start_power: Optional[float] = None
+    power_function_coefficient: Optional[float] = None
+    personal_power_coefficient: Optional[Tuple[float, float, float]] = None
+    # Animals
+    start_nutritional_value: Optional[int] = None
+    base_damage: Optional[float] = None
+    hunger_per_cycle: Optional[float] = None
+    required_nutritional_value: Optional[int] = None
+    kids_sterile_period: Optional[int] = None
+    male_start_power: Optional[float] = None
+    female_start_power: Optional[float] = None
+    male_power_function_coefficient: Optional[float] = None
+    female_power_function_coefficient: Optional[float] = None
+    male_personal_power_coefficient: Optional[Tuple[float, float, float]] = None
+    female_personal_power_coefficient: Optional[Tuple[float, float, float]] = None
+
+
+_kinds = {}  # english name of species -> class of species
+_active = {}  # english name of species -> profile used by class of species
+
+
+def _ppcp(ppcp: configs.PersonalPowerCoefficientParameters) -> Tuple[float, float, float]:
+    """Returns personal power coefficient parameters of config as (min numerator, max numerator, denominator)"""
+    return ppcp.value["min_numerator"], ppcp.value["max_numerator"], ppcp.value["denominator"]
+
+
+def _plant_profile(key: str, power_function_key: str) -> SpeciesProfile:
+    """Compiles profile of plant from enums of config
+
+    key - prefix of names of parameters of plant in enums (HAZEL)
+    power_function_key - prefix of power function coefficient of plant
+    """
+    return SpeciesProfile(
+        life_median=configs.LifeMedian[f"{key}_LM"].value,
+        max_hp=configs.MaxHP[f"{key}_MHP"].value,
+        reproduction_age_interval=configs.ReproductionAgeInterval[f"{key}_RAI"].value,
+        chance_to_produce_kids=configs.ChanceToProduceKids[f"{key}_CTPK"].value,
+        possible_kids_amount=configs.PossibleKidsAmount[f"{key}_PKA"].value,
+        unprotected_damage_multiplier=configs.UnprotectedDamageMultiplier[f"{key}_UDM"].value,
+        start_hp=configs.StartHP[f"{key}_START_HP"].value,
+        hp_reduction=configs.PlantHPReduction[f"{key}_HPR"].value,
+        shrub_reduction=configs.PlantShrubReduction[f"{key}_SR"].value,
+        offspring_dispersion=configs.PlantOffspringDispersion[f"{key}_OD"].value,
+        offspring_nutritional_value=configs.NutritionalValue[f"{key}_OFFSPRING_NV"].value,
+        start_shrub_nutritional_value=configs.NutritionalValue[f"START_{key}_SNV"].value,
+        eatable_offspring_amount=configs.PlantEatableOffspringPossibleAmount[f"{key}_EOPA"].value,
+        start_power=configs.StartPower[f"{key}_SP"].value,
+        power_function_coefficient=configs.PowerFunctionCoefficient[f"{power_function_key}_PFC"].value,
+        personal_power_coefficient=_ppcp(configs.PersonalPowerCoefficientParameters[f"{key}_PPCP"])
+    )
+
+
+def _animal_profile(key: str) -> SpeciesProfile:
+    """Compiles profile of animal from enums of config
+
+    key - prefix of names of parameters of animal in enums (WOLF)
+    """
+    required_nutritional_value = configs.RequiredNutritionalValue.__members__.get(f"{key}_RNV")
+    return SpeciesProfile(
+        life_median=configs.LifeMedian[f"{key}_LM"].value,
+        max_hp=configs.MaxHP[f"{key}_MHP"].value,
+        reproduction_age_interval=configs.ReproductionAgeInterval[f"{key}_RAI"].value,
+        chance_to_produce_kids=configs.ChanceToProduceKids[f"{key}_CTPK"].value,
+        possible_kids_amount=configs.PossibleKidsAmount[f"{key}_PKA"].value,
+        unprotected_damage_multiplier=configs.UnprotectedDamageMultiplier.EVERY_ANIMAL_UDM.value,
+        start_nutritional_value=configs.NutritionalValue[f"{key}_NV"].value,
+        base_damage=configs.Damage[f"{key}_D"].value,
+        hunger_per_cycle=configs.HungerPerCycle[f"{key}_HPC"].value,
+        required_nutritional_value=required_nutritional_value.value if required_nutritional_value else None,
+        kids_sterile_period=configs.SterilePeriods[f"{key}_SP"].value,
+        male_start_power=configs.StartPower[f"M_{key}_SP"].value,
+        female_start_power=configs.StartPower[f"FEM_{key}_SP"].value,
+        male_power_function_coefficient=configs.PowerFunctionCoefficient[f"M_{key}_PFC"].value,
+        female_power_function_coefficient=configs.PowerFunctionCoefficient[f"FEM_{key}_PFC"].value,
+        male_personal_power_coefficient=_ppcp(configs.PersonalPowerCoefficientParameters[f"M_{key}_PPCP"]),
+        female_personal_power_coefficient=_ppcp(configs.PersonalPowerCoefficientParameters[f"FEM_{key}_PPCP"])
+    )
+
+
+def compile_profiles() -> Dict[str, SpeciesProfile]:
+    """Returns profiles of every species compiled from enums of config (english name of species -> profile)"""
+    return {
+        configs.EnglishCreaturesNames.BLUEBERRY.value: _plant_profile("BLUEBERRY", "BLUEBERRY"),
+        configs.EnglishCreaturesNames.HAZEL.value: _plant_profile("HAZEL", "HAZEL"),
+        # Power of maple has always been counted with power function coefficient of hazel
+        configs.EnglishCreaturesNames.MAPLE.value: _plant_profile("MAPLE", "HAZEL"),
+        configs.EnglishCreaturesNames.BOAR.value: _animal_profile("BOAR"),
+        configs.EnglishCreaturesNames.ELK.value: _animal_profile("ELK"),
+        configs.EnglishCreaturesNames.WOLF.value: _animal_profile("WOLF"),
+        configs.EnglishCreaturesNames.BEAR.value: _animal_profile("BEAR")
+    }
+
+
+def _parameter_value(value):
+    """Returns immutable value of parameter read from file (lists become tuples)"""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def load_profiles(filename: str, base_profiles: Optional[Dict[str, SpeciesProfile]] = None) -> \
+        Dict[str, SpeciesProfile]:
+    """Returns profiles of species loaded from .json file
+
+    File is {"english name of species": {"parameter": value, ...}, ...}, parameters that are not in file (and species
+    that are not in file) are taken from base_profiles (default - profiles compiled from config)
+    raise ValueError if file has unknown species or unknown parameter
+    """
+    profiles = dict(compile_profiles() if base_profiles is None else base_profiles)
+    with open(filename, "r") as file:
+        changes = json.load(file)
+    for species, parameters in changes.items():
+        if species not in profiles:
+            raise ValueError(f"Unknown species {species} in file of profiles {filename}")
+        unknown_parameters = set(parameters) - set(SpeciesProfile._fields)
+        if unknown_parameters:
+            raise ValueError(f"Unknown parameters {sorted(unknown_parameters)} of {species} in file of profiles "
+                             f"{filename}")
+        profiles[species] = profiles[species]._replace(
+            **{parameter: _parameter_value(value) for parameter, value in parameters.items()})
+    return profiles
+
+
+def save_profiles(filename: str, profiles: Dict[str, SpeciesProfile]) -> None:
+    """Writes profiles of species to .json file (template for experiments, parameters that are None are skipped)"""
+    with open(filename, "w") as file:
+        json.dump({species: {parameter: value for parameter, value in profile._asdict().items() if value is not None}
+                   for species, profile in profiles.items()}, file, indent=4)
+
+
+def _give_profile(kind, profile: SpeciesProfile) -> None:
+    """Copies parameters of profile to attributes of class of species and lets class build its tables"""
+    for parameter, value in profile._asdict().items():
+        setattr(kind, "_" + parameter, value)
+    kind._apply_profile(profile)
+
+
+def species(name: str):
+    """Returns decorator of class of species that gives class its active profile
+
+    name - english name of species
+    Class of species is remembered, so profiles can be switched by activate
+    """
+    def register(kind):
+        _kinds[name] = kind
+        _give_profile(kind, _active[name])
+        return kind
+    return register
+
+
+def active_profiles() -> Dict[str, SpeciesProfile]:
+    """Returns profiles used by classes of species now"""
+    return dict(_active)
+
+
+def activate(profiles: Dict[str, SpeciesProfile]) -> None:
+    """Gives profiles to classes of species
+
+    profiles - profiles of species (species that are not in profiles keep their profiles)
+    Profiles are switched between worlds: power of existing creatures is recounted only when their age changes
+    raise ValueError if profiles have unknown species
+    """
+    unknown_species = set(profiles) - set(_active)
+    if unknown_species:
+        raise ValueError(f"Unknown species {sorted(unknown_species)}")
+    _active.update(profiles)
+    for name, kind in _kinds.items():
+        _give_profile(kind, _active[name])
+
+
+_active.update(compile_profiles())
@@ -0,0 +1,108 @@
+#Author Vodohleb04
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import configs
+import species_profiles
+
+
+class SpeciesEntry(NamedTuple):
+    """Everything ecosystem needs to know about species
+
+    kind - class of species (constructor of new creatures, its id counter is kept by class)
+    english_name - english name of species (type of creature in saves)
+    russian_name - russian name of species (shown in graphic mode)
+    unpack - function that creates creature of species from dict of its info (used in load of save)
+    id_counter_key - key of id counter of species in saves
+    icon - file with icon of species for creature stats dialog
+    """
+    kind: type
+    english_name: str
+    russian_name: str
+    unpack: Callable[[Dict], object]
+    id_counter_key: str
+    icon: str
+
+
+_entries: List[SpeciesEntry] = []  # in order of registration
+_by_kind: Dict[type, SpeciesEntry] = {}
+_by_english_name: Dict[str, SpeciesEntry] = {}
+_by_russian_name: Dict[str, SpeciesEntry] = {}
+_by_id_prefix: Dict[str, SpeciesEntry] = {}
+
+
+def species(english_name: str, russian_name: str, icon: Optional[str] = None):
+    """Returns decorator of class of species that registers species and gives class its active profile
+
+    english_name - english name of species
+    russian_name - russian name of species
+    icon - file with icon of species (default - icon of CREATURES_ICONS by english name)
+    raise ValueError if species with same name is already registered
+    Class must have from_dict, rewrite_id_counter, get_id_counter and id_prefixes, so ecosystem saves, loads and
+    finds it without knowing it
+    """
+    def register(kind):
+        if english_name in _by_english_name or russian_name in _by_russian_name:
+            raise ValueError(f"Species {english_name} ({russian_name}) is already registered")
+        species_profiles.species(english_name)(kind)
+        entry = SpeciesEntry(kind, english_name, russian_name, kind.from_dict, f"{english_name}_id_counter",
+                             configs.CREATURES_ICONS[f"{english_name}_icon"] if icon is None else icon)
+        _entries.append(entry)
+        _by_kind[kind] = entry
+        _by_english_name[english_name] = entry
+        _by_russian_name[russian_name] = entry
+        for id_prefix in kind.id_prefixes():
+            _by_id_prefix[id_prefix] = entry
+        return kind
+    return register
+
+
+def entries() -> List[SpeciesEntry]:
+    """Returns entries of every registered species (in order of registration)"""
+    return list(_entries)
+
+
+def entry_of_kind(kind: type) -> SpeciesEntry:
+    """Returns entry of species by class of creature
+
+    Subclasses of registered species are found by their base classes (once, then they are remembered)
+    raise TypeError if class is not a registered species
+    """
+    entry = _by_kind.get(kind)
+    if entry is None:
+        entry = next((_by_kind[base] for base in kind.__mro__[1:] if base in _by_kind), None)
+        if entry is None:
+            raise TypeError(f"Not part of ecosystem: {kind}")
+        _by_kind[kind] = entry
+    return entry
+
+
+def entry_of(creature) -> SpeciesEntry:
+    """Returns entry of species of creature
+
+    raise TypeError if creature is not of registered species
+    """
+    return entry_of_kind(type(creature))
+
+
+def entry_by_name(english_name: str) -> SpeciesEntry:
+    """Returns entry of species by its english name
+
+    raise KeyError if species is unknown
+    """
+    return _by_english_name[english_name]
+
+
+def entry_by_russian_name(russian_name: str) -> SpeciesEntry:
+    """Returns entry of species by its russian name
+
+    raise KeyError if species is unknown
+    """
+    return _by_russian_name[russian_name]
+
+
+def entry_by_id_prefix(id_prefix: str) -> SpeciesEntry:
+    """Returns entry of species by prefix of ids of its creatures (with gender for animals)
+
+    raise KeyError if prefix is unknown
+    """
+    return _by_id_prefix[id_prefix]
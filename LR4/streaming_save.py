@@ -0,0 +1,102 @@
+#Author Vodohleb04
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional
+
+
+SAVE_FORMAT = "forest-ndjson"
+SAVE_FORMAT_VERSION = 1
+
+
+def is_ndjson_save(filename: str) -> bool:
+    """Returns True if file is streaming save (header line and one creature per line), False if it is legacy json save
+
+    Legacy saves are one json list (file starts with "["), streaming saves start with header object (with "{")
+    """
+    with open(filename, "r") as save_file:
+        while True:
+            symbol = save_file.read(1)
+            if not symbol or not symbol.isspace():
+                return symbol == "{"
+
+
+def write_ndjson_save(filename: str, ecosystem_info: Dict, id_counters: Dict, records: Iterable[Dict],
+                      journal_sequence=0, pedigree: Optional[Dict] = None) -> None:
+    """Writes streaming save: header line and then one line per creature record
+
+    filename - file to save to (file is replaced only after the whole save is written)
+    ecosystem_info - general parameters of ecosystem
+    id_counters - id counters of kinds of creatures
+    records - dicts of creatures (generator, records are written as soon as they are made)
+    journal_sequence - number of the last entry of journal of changes that is included into save (0 - no journal)
+    pedigree - packed pedigree of ecosystem (None - pedigree is not saved)
+    """
+    header = {"format": SAVE_FORMAT, "version": SAVE_FORMAT_VERSION, "ecosystem": ecosystem_info,
+              "id_counters": id_counters}
+    if journal_sequence:
+        header["journal_sequence"] = journal_sequence
+    if pedigree is not None:
+        header["pedigree"] = pedigree
+    temporary_filename = f"{filename}.tmp"
+    with open(temporary_filename, "w") as save_file:
+        save_file.write(json.dumps(header) + "\n")
+        for record in records:
+            save_file.write(json.dumps(record) + "\n")
+    os.replace(temporary_filename, filename)
+
+
+class NdjsonSaveReader:
+
+    def __init__(self, filename: str):
+        """Opens streaming save and reads its header
+
+        filename - file with streaming save
+        raise ValueError if file is not streaming save of known version
+        """
+        self._file = open(filename, "r")
+        try:
+            header = json.loads(self._file.readline())
+            if not isinstance(header, dict) or header.get("format") != SAVE_FORMAT:
+                raise ValueError(f"{filename} is not streaming save of forest")
+            if header.get("version") != SAVE_FORMAT_VERSION:
+                raise ValueError(f"Unknown version of save: {header.get('version')}")
+        except ValueError:
+            self._file.close()
+            raise
+        self._header = header
+
+    @property
+    def ecosystem_info(self) -> Dict:
+        """Returns general parameters of ecosystem"""
+        return self._header["ecosystem"]
+
+    @property
+    def id_counters(self) -> Dict:
+        """Returns id counters of kinds of creatures"""
+        return self._header["id_counters"]
+
+    @property
+    def pedigree(self) -> Optional[Dict]:
+        """Returns packed pedigree of ecosystem (None if save has no pedigree)"""
+        return self._header.get("pedigree")
+
+    @property
+    def journal_sequence(self) -> int:
+        """Returns number of the last entry of journal of changes that is included into save (0 - no journal)"""
+        return self._header.get("journal_sequence", 0)
+
+    def records(self) -> Iterator[Dict]:
+        """Returns records of creatures one by one (file is read line by line)"""
+        for line in self._file:
+            if line.strip():
+                yield json.loads(line)
+
+    def close(self) -> None:
+        """Closes file of save"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
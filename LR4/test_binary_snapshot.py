@@ -0,0 +1,83 @@
+#Author Vodohleb04
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from ecosystem import EcoSystem
+import binary_snapshot
+
+
+@pytest.mark.usefixtures("seeded_worlds")
+class TestBinarySnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.saves_dir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.saves_dir.name, name)
+
+    def _lines(self, ecosystem: EcoSystem, name="compared.ndjson") -> list:
+        ecosystem.save(self._path(name))
+        with open(self._path(name)) as save_file:
+            return save_file.readlines()
+
+    def test_round_trip(self):
+        ecosystem = self.make_world(3, 5)
+        ecosystem.save(self._path("world.fsnap"))
+        self.assertTrue(binary_snapshot.is_binary_snapshot(self._path("world.fsnap")))
+        loaded = EcoSystem.from_file(self._path("world.fsnap"))
+        self.assertEqual(self._lines(loaded), self._lines(ecosystem))
+        self.assertEqual(loaded.count_creatures_amount(), ecosystem.count_creatures_amount())
+
+    def test_records_of_snapshot(self):
+        ecosystem = self.make_world(4, 3)
+        ecosystem.save(self._path("world.fsnap"))
+        with binary_snapshot.BinarySnapshotReader(self._path("world.fsnap")) as reader:
+            records = [json.loads(json.dumps(record)) for record in reader.records()]
+        lines = self._lines(ecosystem)
+        self.assertEqual(records, [json.loads(line) for line in lines[1:]])
+
+    def test_packed_records_equal_packed_forest(self):
+        ecosystem = self.make_world(5, 3)
+        ecosystem_info, id_counters, records, pedigree = ecosystem.snapshot_for_save(self._path("world.ndjson"))
+        EcoSystem.write_save(self._path("records.fsnap"), ecosystem_info, id_counters, records, pedigree)
+        ecosystem.save(self._path("forest.fsnap"))
+        with open(self._path("records.fsnap"), "rb") as records_file, \
+                open(self._path("forest.fsnap"), "rb") as forest_file:
+            self.assertEqual(records_file.read(), forest_file.read())
+
+    def test_ids_that_are_not_prefix_with_number(self):
+        ecosystem = self.make_world(6, 2)
+        lines = self._lines(ecosystem, "named.ndjson")
+        names = iter(("Hazel-custom", "mom-x", "female_wolf_00"))
+        for index, line in enumerate(lines[1:], 1):
+            record = json.loads(line)
+            if record["type"] in ("hazel", "boar", "wolf"):
+                record["id"] = next(names, record["id"])
+                lines[index] = json.dumps(record) + "\n"
+        with open(self._path("named.ndjson"), "w") as save_file:
+            save_file.writelines(lines)
+        named = EcoSystem.from_file(self._path("named.ndjson"))
+        named.save(self._path("named.fsnap"))
+        loaded = EcoSystem.from_file(self._path("named.fsnap"))
+        loaded_lines = self._lines(loaded)
+        self.assertEqual(loaded_lines, self._lines(named))
+        for name in ("Hazel-custom", "mom-x", "female_wolf_00"):
+            self.assertTrue(any(f'"{name}' in line for line in loaded_lines))
+
+    def test_columns_are_written_only_to_snapshot(self):
+        ecosystem = self.make_world(7, 1)
+        ecosystem_info, id_counters, columns, pedigree = ecosystem.snapshot_for_save(self._path("world.fsnap"))
+        self.assertIsInstance(columns, binary_snapshot.SnapshotColumns)
+        with self.assertRaises(ValueError):
+            EcoSystem.write_save(self._path("world.ndjson"), ecosystem_info, id_counters, columns, pedigree)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+#Author Vodohleb04
+import unittest
+
+import pytest
+
+from columnar_period import columnar_period_available
+from plant import Plant
+
+
+@unittest.skipUnless(columnar_period_available(), "Columnar period requires numpy")
+@pytest.mark.usefixtures("seeded_worlds")
+class TestColumnarPeriod(unittest.TestCase):
+
+    def _columnar_world(self, seed: int, cycles: int):
+        """Returns seeded world after cycles with columnar period"""
+        ecosystem = self.make_world(seed, 0)
+        ecosystem.columnar_period = True
+        for _ in range(cycles):
+            ecosystem.cycle()
+        return ecosystem
+
+    def test_health_of_regenerated_plants_keeps_its_type(self):
+        ecosystem = self._columnar_world(4, 6)
+        plants = [creature for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+                  for creature in hectare.creatures_of(Plant)]
+        self.assertTrue(plants)
+        for plant in plants:
+            self.assertIs(type(plant.hp), int)
+
+    def test_counters_of_hectares_match_their_creatures(self):
+        for seed in (4, 5):
+            ecosystem = self._columnar_world(seed, 5)  # Dead creatures are not buried yet
+            total = {}
+            for hectare_line in ecosystem.forest.hectares:
+                for hectare in hectare_line:
+                    scanned = {}
+                    for creature in hectare.creations:
+                        alive, dead = scanned.get(type(creature), (0, 0))
+                        scanned[type(creature)] = (alive, dead + 1) if creature.is_dead() else (alive + 1, dead)
+                    with self.subTest(seed=seed, position=hectare.position):
+                        self.assertEqual({kind: amounts for kind, amounts in hectare.population().items()
+                                          if amounts != (0, 0)}, scanned)
+                    for kind, (alive, dead) in scanned.items():
+                        total_alive, total_dead = total.get(kind, (0, 0))
+                        total[kind] = (total_alive + alive, total_dead + dead)
+            self.assertTrue(any(dead for _, dead in total.values()))
+            self.assertEqual({kind: amounts for kind, amounts in ecosystem.forest.population().items()
+                              if amounts != (0, 0)}, total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#Author Vodohleb04
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pytest
+
+import console_mode
+from console_renderer import ConsoleViewport
+from ecosystem import EcoSystem
+from wolf import Wolf
+
+
+def empty_world(vertical_length: int, horizontal_length: int) -> EcoSystem:
+    """Returns forest without creatures"""
+    return EcoSystem(seed=3, fill=False, forest_vertical_length=vertical_length,
+                     forest_horizontal_length=horizontal_length)
+
+
+def make_world() -> EcoSystem:
+    """Returns 20x20 forest with a few creatures"""
+    ecosystem = empty_world(20, 20)
+    ecosystem.fill_creatures("wolf", 2, (0, 0))
+    ecosystem.fill_creatures("hazel", 3, (0, 1))
+    ecosystem.fill_creatures("bear", 1, (19, 19))
+    return ecosystem
+
+
+@pytest.mark.usefixtures("fresh_id_counters")
+class TestConsoleMode(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+        self.ecosystem = make_world()
+        self.viewport = ConsoleViewport()
+        patches = (mock.patch.object(console_mode, "_viewport", self.viewport),
+                   mock.patch.object(console_mode.os, "system"))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self) -> None:
+        self.saves_dir.cleanup()
+
+    def _command(self, command: str, inputs=(), ecosystem=None) -> str:
+        """Runs console command with inputs of user and returns printed text"""
+        output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=list(inputs)), contextlib.redirect_stdout(output):
+            console_mode.define_command(command, self.ecosystem if ecosystem is None else ecosystem)
+        return output.getvalue()
+
+    def _window(self) -> str:
+        output = io.StringIO()
+        self.viewport.render(self.ecosystem, output)
+        return output.getvalue()
+
+    def test_paging_of_window(self):
+        self.assertEqual(self._command("down"), self._window())
+        self.assertEqual(self.viewport.position, (7, 0))
+        self._command("right")
+        self.assertEqual(self.viewport.position, (7, 7))
+        self._command("down")
+        self._command("Down")
+        self.assertEqual(self.viewport.position, (13, 7))  # Window doesn't leave forest
+        self._command("up")
+        self._command("left")
+        self._command("left")
+        self.assertEqual(self.viewport.position, (6, 0))
+
+    def test_go_to(self):
+        self.assertIn("Shown lines 5-11 of 20, columns 6-12 of 20", self._command("go to", ["5, 6"]))
+        self._command("goto", ["19,19"])
+        self.assertEqual(self.viewport.position, (13, 13))
+        self.assertIn("bear", self._window())
+        with self.assertRaises(ValueError):
+            self._command("go to", ["5"])
+
+    def test_view_size(self):
+        output = self._command("view size", ["0", "3", "x", "2"])
+        self.assertEqual((self.viewport._rows, self.viewport._columns), (3, 2))
+        self.assertIn("Shown lines 0-2 of 20, columns 0-1 of 20", output)
+        self._command("view size", ["20", "20"])
+        self.assertNotIn("Shown lines", self._window())
+
+    def test_counts(self):
+        self._command("view size", ["1", "3"])
+        output = self._command("counts")
+        self.assertTrue(self.viewport.counts)
+        self.assertEqual(output.splitlines()[2].split("|")[1:4], ["2", "3", "0"])
+        self.assertNotIn("wolf", output)
+        self._command("counts")
+        self.assertIn("wolf", self._window())
+
+    def test_view_and_view_all(self):
+        self.assertEqual(self._command("view"), self._window())
+        self.assertEqual(self._command("view all"), str(self.ecosystem))
+
+    def test_population(self):
+        self.assertEqual(self._command("population"), self.ecosystem.console_population_summary() + "\n")
+
+    def test_add_and_remove_creature(self):
+        self._command("add creature", ["-w", "1, 2"])
+        wolves = self.ecosystem.forest.hectares[1][2].creatures_of(Wolf)
+        self.assertEqual(len(wolves), 1)
+        output = self._command("remove", [wolves[0].id])
+        self.assertIn(f"Creature \"{wolves[0].id}\" was removed.", output)
+        self.assertEqual(self.ecosystem.forest.hectares[1][2].creatures_of(Wolf), [])
+
+    def test_relatives_and_pedigree(self):
+        first, second = (wolf.id for wolf in self.ecosystem.forest.hectares[0][0].creatures_of(Wolf))
+        output = self._command("relatives", [first, second, "2"])
+        self.assertEqual(output, f"{first} and {second} are not relatives within 2 generations.\n")
+        output = self._command("pedigree", [first, "2"])
+        self.assertEqual(output, self.ecosystem.console_pedigree(first, 2) + "\n")
+
+    def test_save_and_load(self):
+        filename = os.path.join(self.saves_dir.name, "console.ndjson")
+        self.assertEqual(self._command("save", [filename]), f"Game saved to file \"{filename}\".\n")
+        expected = str(self.ecosystem)
+        loaded = empty_world(1, 1)
+        self._command("load", ["n", filename], ecosystem=loaded)  # Doesn't exit before load
+        self.assertEqual(str(loaded), expected)
+        with self.assertRaises(ValueError):
+            self._command("save", [os.path.join(self.saves_dir.name, "console.txt")])
+
+    def test_exit(self):
+        with self.assertRaises(console_mode.GameEndedException) as stop:
+            self._command("exit", ["maybe", "y", "n"])
+        self.assertEqual(stop.exception.exit_code, console_mode.ExitCodes.NORMAL_END_NOT_SAVED)
+        self.assertEqual(self._command("exit", ["n"]), "")
+
+    def test_unknown_command(self):
+        with self.assertRaises(console_mode.GameEndedException) as stop:
+            self._command("fly")
+        self.assertEqual(stop.exception.exit_code, console_mode.ExitCodes.REMOVABLE_INPUT_ERROR)
+
+    def test_commands_need_ecosystem(self):
+        for command in ("view", "view all", "up", "go to", "view size", "counts", "population", "relatives"):
+            with self.subTest(command=command):
+                with self.assertRaises(TypeError):
+                    with mock.patch("builtins.input", side_effect=[]):
+                        console_mode.define_command(command, None)
+
+    def test_play_console(self):
+        output = io.StringIO()
+        with mock.patch("builtins.input", side_effect=["fly", "counts"]), contextlib.redirect_stdout(output):
+            exit_code = console_mode.play_console()
+        self.assertEqual(exit_code, console_mode.ExitCodes.ERROR_UNKNOWN_TYPE_OF_PARAMETER.value)
+        self.assertIn("Unknown command: fly", output.getvalue())
+
+
+@pytest.mark.usefixtures("fresh_id_counters")
+class TestConsoleViewport(unittest.TestCase):
+
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            ConsoleViewport(0, 3)
+
+    def test_many_creatures_in_cell(self):
+        ecosystem = empty_world(1, 1)
+        ecosystem.fill_creatures("blueberry", 25, (0, 0))
+        output = io.StringIO()
+        ConsoleViewport().render(ecosystem, output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2 + 20 + 1)  # Header, separator, shown ids and line with others
+        self.assertEqual(lines[-1].split("|")[1].strip(), "+5 more")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#Author Vodohleb04
+import os
+import tempfile
+import unittest
+
+import pytest
+
+import configs
+from ecosystem import EcoSystem
+from pedigree import Pedigree
+import streaming_save
+
+
+# (id, mother, father) of wolves: grandparents 1 and 2, their children 3 (mother of 7) and 4 (father of 8)
+FAMILY = (("female_wolf_1", configs.CREATOR, configs.CREATOR), ("male_wolf_2", configs.CREATOR, configs.CREATOR),
+          ("female_wolf_3", "female_wolf_1", "male_wolf_2"), ("male_wolf_4", "female_wolf_1", "male_wolf_2"),
+          ("male_wolf_5", configs.CREATOR, configs.CREATOR), ("female_wolf_6", configs.CREATOR, configs.CREATOR),
+          ("male_wolf_7", "female_wolf_3", "male_wolf_5"), ("female_wolf_8", "female_wolf_6", "male_wolf_4"))
+
+
+@pytest.mark.usefixtures("fresh_id_counters")
+class TestPedigree(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+        self.ecosystem = EcoSystem.from_file(self._write_family())
+
+    def tearDown(self) -> None:
+        self.ecosystem.stop_journal()
+        self.saves_dir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.saves_dir.name, name)
+
+    def _write_family(self) -> str:
+        """Writes save of 2x2 forest with family of wolves (save has no pedigree, it is made from parents)"""
+        empty_world = EcoSystem(forest_vertical_length=2, forest_horizontal_length=2, fill=False)
+        ecosystem_info, id_counters = empty_world._pack_general_data()
+        records = []
+        for number, (creature_id, mother, father) in enumerate(FAMILY):
+            records.append({"gender": creature_id.split("_")[0], "power_coefficient": 1.0, "damage": 200.0, "age": 10,
+                            "hp": 200, "nutritional_value": 200, "food_energy": 200, "id": creature_id,
+                            "sterile_period": 0, "parents": (mother, father), "type": "wolf",
+                            "position": (number % 2, number // 4)})
+        id_counters["wolf_id_counter"] = len(FAMILY) + 1  # Next number of wolf
+        filename = self._path("family.ndjson")
+        streaming_save.write_ndjson_save(filename, ecosystem_info, id_counters, records)
+        return filename
+
+    def _assert_kinship(self, ecosystem: EcoSystem) -> None:
+        self.assertTrue(ecosystem.are_relatives("female_wolf_3", "male_wolf_4", 1))  # Sister and brother
+        self.assertFalse(ecosystem.are_relatives("male_wolf_7", "female_wolf_8", 1))
+        self.assertTrue(ecosystem.are_relatives("male_wolf_7", "female_wolf_8", 2))  # Cousins
+        self.assertTrue(ecosystem.are_relatives("male_wolf_7", "male_wolf_4", 2))  # Nephew and uncle
+        self.assertFalse(ecosystem.are_relatives("male_wolf_7", "female_wolf_6", 3))
+        self.assertFalse(ecosystem.are_relatives("male_wolf_5", "female_wolf_6", 3))
+
+    def test_kinship(self):
+        self._assert_kinship(self.ecosystem)
+        self.assertTrue(self.ecosystem.are_relatives("male_wolf_7", "female_wolf_1", 2))  # Grandson and grandmother
+        self.assertFalse(self.ecosystem.are_relatives("male_wolf_7", "female_wolf_1", 1))
+        self.assertTrue(self.ecosystem.are_relatives("female_wolf_3", "female_wolf_3", 0))
+
+    def test_ancestors_and_descendants(self):
+        self.assertEqual(self.ecosystem.creature_ancestors("male_wolf_7", 3),
+                         [["female_wolf_3", "male_wolf_5"], ["female_wolf_1", "male_wolf_2"]])
+        self.assertEqual(self.ecosystem.creature_descendants("female_wolf_1", 3),
+                         [["female_wolf_3", "male_wolf_4"], ["male_wolf_7", "female_wolf_8"]])
+        self.assertEqual(self.ecosystem.creature_ancestors("male_wolf_5", 3), [])
+
+    def test_kinship_after_ancestors_left_forest(self):
+        for creature_id in ("female_wolf_1", "male_wolf_2", "female_wolf_3", "male_wolf_4"):
+            self.ecosystem.remove_creature(creature_id)
+        self.assertTrue(self.ecosystem.are_relatives("male_wolf_7", "female_wolf_8", 2))
+        self.assertEqual(self.ecosystem.creature_ancestors("female_wolf_8", 2),
+                         [["female_wolf_6", "male_wolf_4"], ["female_wolf_1", "male_wolf_2"]])
+
+    def test_kinship_after_load(self):
+        for creature_id in ("female_wolf_1", "male_wolf_2", "female_wolf_3", "male_wolf_4"):
+            self.ecosystem.remove_creature(creature_id)
+        for extension in ("ndjson", "fsnap"):
+            with self.subTest(extension=extension):
+                self.ecosystem.save(self._path(f"saved.{extension}"))
+                loaded = EcoSystem.from_file(self._path(f"saved.{extension}"))
+                self.assertTrue(loaded.are_relatives("male_wolf_7", "female_wolf_8", 2))
+                self.assertFalse(loaded.are_relatives("male_wolf_7", "female_wolf_8", 1))
+                self.assertEqual(loaded.creature_ancestors("male_wolf_7", 2),
+                                 [["female_wolf_3", "male_wolf_5"], ["female_wolf_1", "male_wolf_2"]])
+
+    def test_kinship_after_journal_replay(self):
+        filename = self._path("journal.ndjson")
+        self.ecosystem.start_journal(filename, compaction_interval=0)
+        for creature_id in ("female_wolf_1", "male_wolf_2", "female_wolf_3", "male_wolf_4"):
+            self.ecosystem.remove_creature(creature_id)
+        self.ecosystem.fill_creatures("wolf", 2, (0, 0))
+        self.ecosystem.save()
+        self.ecosystem.stop_journal()
+        loaded = EcoSystem.from_file(filename)
+        self.assertTrue(loaded.are_relatives("male_wolf_7", "female_wolf_8", 2))
+        self.assertFalse(loaded.are_relatives("male_wolf_7", "female_wolf_6", 3))
+
+    def test_pack_and_unpack(self):
+        kinship = Pedigree.unpack(self.ecosystem._pedigree.pack())
+        self.assertEqual(kinship.pack(), self.ecosystem._pedigree.pack())
+        with self.assertRaises(ValueError):
+            Pedigree.unpack({"names": [], "lineages": {"unicorn": {}}})
+
+    def test_prune_keeps_ancestors_of_forest(self):
+        for creature_id in ("female_wolf_1", "male_wolf_2", "female_wolf_3", "male_wolf_4", "male_wolf_5"):
+            self.ecosystem.remove_creature(creature_id)
+        self.ecosystem._prune_pedigree()
+        self.assertTrue(self.ecosystem.are_relatives("male_wolf_7", "female_wolf_8", 2))
+
+
+@pytest.mark.usefixtures("fresh_id_counters")
+class TestPedigreeOfCycles(unittest.TestCase):
+
+    def test_children_are_recorded(self):
+        ecosystem = EcoSystem(seed=2, forest_vertical_length=2, forest_horizontal_length=2, wolf_amount=30,
+                              boar_amount=30, elk_amount=30, bear_amount=10, blueberry_amount=60, hazel_amount=40,
+                              maple_amount=20)
+        for _ in range(8):
+            ecosystem.cycle()
+        born = [creature for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+                for creature in hectare.creations if getattr(creature, "_mother", -1) >= 0]
+        self.assertTrue(born)
+        for child in born:
+            parents = list(child.get_dict_of_info()["parents"])
+            self.assertEqual(ecosystem.creature_ancestors(child.id, 1), [parents])
+            self.assertTrue(ecosystem.are_relatives(child.id, child.id, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#Author Vodohleb04
+import unittest
+
+from animal import Animal
+import configs
+from ecosystem import EcoSystem
+import power_tables
+
+
+def empty_world() -> EcoSystem:
+    """Returns forest of one hectare without creatures"""
+    return EcoSystem(seed=9, forest_vertical_length=1, forest_horizontal_length=1, fill=False)
+
+
+def formula_power(creature) -> float:
+    """Returns power of creature counted by formulas that were used before tables of power"""
+    kind = type(creature).__name__.upper()
+    age = creature.age
+    first_age, last_age = creature._reproduction_age_interval
+    if kind == "BLUEBERRY":
+        return configs.StartPower.BLUEBERRY_SP.value if age <= creature._life_median else 3/age
+    if kind in ("HAZEL", "MAPLE"):
+        start_power = configs.StartPower[f"{kind}_SP"].value
+        k_func_coefficient = configs.PowerFunctionCoefficient.HAZEL_PFC.value  # Maple has always used it
+        return creature._power_coefficient * (start_power + (k_func_coefficient * min(age, first_age)))
+    prefix = "M" if creature._gender == configs.Genders.MALE else "FEM"
+    start_power = configs.StartPower[f"{prefix}_{kind}_SP"].value
+    k_func_coefficient = configs.PowerFunctionCoefficient[f"{prefix}_{kind}_PFC"].value
+    if age <= first_age:
+        return creature._power_coefficient * (start_power + (k_func_coefficient * age))
+    elif age <= last_age:
+        return creature._power_coefficient * (start_power + (k_func_coefficient * first_age))
+    return creature._power_coefficient * (start_power + (-k_func_coefficient * first_age))
+
+
+class TestPowerTables(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ecosystem = empty_world()
+        for name in configs.EnglishCreaturesNames:
+            cls.ecosystem.fill_creatures(name.value, 10, (0, 0))
+        cls.creatures = list(cls.ecosystem.forest.hectares[0][0].creations)
+
+    def test_power_equals_formula_of_every_age(self):
+        for creature in self.creatures:
+            old_age = creature._age
+            for age in range(creature._life_median + 30):
+                with self.subTest(creature=creature.id, age=age):
+                    creature._age = age
+                    self.assertEqual(creature.power(), formula_power(creature))
+            creature._age = old_age
+
+    def test_every_gender_is_checked(self):
+        animal_kinds = {type(creature) for creature in self.creatures if isinstance(creature, Animal)}
+        self.assertEqual(len(animal_kinds), 4)
+        for kind in animal_kinds:
+            with self.subTest(kind=kind.__name__):
+                self.assertEqual({creature._gender for creature in self.creatures if type(creature) is kind},
+                                 set(configs.Genders))
+
+    def test_power_is_recounted_when_age_changes(self):
+        creature = next(creature for creature in self.creatures if creature._reproduction_age_interval[0] > 1)
+        creature._age = 0
+        young_power = creature.power()
+        creature._age = 1
+        self.assertNotEqual(creature.power(), young_power)
+        self.assertEqual(creature.power(), formula_power(creature))
+
+    def test_dead_creature_has_no_power(self):
+        ecosystem = empty_world()
+        for name in configs.EnglishCreaturesNames:
+            ecosystem.fill_creatures(name.value, 1, (0, 0))
+        for creature in ecosystem.forest.hectares[0][0].creations:
+            with self.subTest(creature=creature.id):
+                self.assertGreater(creature.power(), 0.0)
+                creature._hp = 0
+                self.assertEqual(creature.power(), 0.0)
+
+
+class TestPowerTable(unittest.TestCase):
+
+    def test_growth_table(self):
+        table = power_tables.growth_table(2.0, 0.5, (2, 4))
+        self.assertEqual([table[age] for age in range(8)], [2.0, 2.5, 3.0, 3.0, 3.0, 1.0, 1.0, 1.0])
+        table = power_tables.growth_table(2.0, 0.5, (2, 4), regression=False)
+        self.assertEqual([table[age] for age in range(5)], [2.0, 2.5, 3.0, 3.0, 3.0])
+
+    def test_tail_of_table(self):
+        table = power_tables.PowerTable((1.0, 2.0), lambda age: -age)
+        self.assertEqual((table[1], table[2], table[10]), (2.0, -2, -10))
+        self.assertEqual(power_tables.constant_tail((1.0, 4.0))(100), 4.0)
+
+    def test_empty_table(self):
+        with self.assertRaises(ValueError):
+            power_tables.PowerTable((), power_tables.constant_tail((0.0,)))
+
+
+if __name__ == "__main__":
+    unittest.main()
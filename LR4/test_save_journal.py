@@ -0,0 +1,115 @@
+#Author Vodohleb04
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from ecosystem import EcoSystem
+import save_journal
+import streaming_save
+
+
+@pytest.mark.usefixtures("seeded_worlds")
+class TestSaveJournal(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.saves_dir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.saves_dir.name, name)
+
+    def _lines(self, ecosystem: EcoSystem, name="compared.ndjson") -> list:
+        ecosystem.save(self._path(name))
+        with open(self._path(name)) as save_file:
+            return save_file.readlines()
+
+    def _journal_entries(self, filename: str) -> list:
+        _, journal_filename = save_journal.journal_filenames(filename)
+        with open(journal_filename) as journal_file:
+            return [entry for entry in map(json.loads, journal_file) if "sequence" in entry]
+
+    def test_journal_replay_equals_save(self):
+        for workers, columnar in ((0, False), (2, False), (0, True)):
+            with self.subTest(workers=workers, columnar=columnar):
+                ecosystem = self.make_world(3, 2, workers)
+                ecosystem.columnar_period = columnar
+                filename = self._path(f"journal{workers}{columnar}.ndjson")
+                ecosystem.start_journal(filename, compaction_interval=0)
+                for _ in range(4):
+                    ecosystem.cycle()
+                    ecosystem.save()
+                self.assertTrue(save_journal.has_journal(filename))
+                self.assertEqual(len(self._journal_entries(filename)), 4)
+                expected = self._lines(ecosystem)
+                ecosystem.stop_journal()
+                self.assertEqual(self._lines(EcoSystem.from_file(filename)), expected)
+
+    def test_save_without_changes_writes_no_records(self):
+        ecosystem = self.make_world(4, 1)
+        filename = self._path("unchanged.ndjson")
+        ecosystem.start_journal(filename, compaction_interval=0)
+        ecosystem.cycle()
+        ecosystem.save()
+        ecosystem.save()
+        entries = self._journal_entries(filename)
+        self.assertGreater(entries[0]["records"], 0)
+        self.assertEqual(entries[1]["records"], 0)
+        ecosystem.stop_journal()
+
+    def test_only_changed_creatures_are_written(self):
+        ecosystem = self.make_world(4, 1)
+        filename = self._path("changed.ndjson")
+        ecosystem.start_journal(filename, compaction_interval=0)
+        hectare = next(hectare for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+                       if len(hectare.creatures_of(object, alive=True)) > 1)
+        wounded, killed = hectare.creatures_of(object, alive=True)[:2]
+        wounded.get_hearted(wounded.hp / 2)
+        killed.die()
+        ecosystem.save()
+        with open(save_journal.journal_filenames(filename)[1]) as journal_file:
+            lines = [json.loads(line) for line in journal_file]
+        self.assertEqual(lines[0]["records"], 2)
+        self.assertEqual(sorted(record["id"] for record in lines[1:]), sorted([wounded.id, killed.id]))
+        self.assertEqual(self._lines(EcoSystem.from_file(filename)), self._lines(ecosystem))
+        ecosystem.stop_journal()
+
+    def test_replay_after_compaction(self):
+        ecosystem = self.make_world(5, 1)
+        filename = self._path("compacted.ndjson")
+        ecosystem.start_journal(filename, compaction_interval=2)
+        for _ in range(5):
+            ecosystem.cycle()
+            ecosystem.save()
+        expected = self._lines(ecosystem)
+        ecosystem.stop_journal()  # Waits for background compaction
+        compacting_filename, _ = save_journal.journal_filenames(filename)
+        self.assertFalse(os.path.exists(compacting_filename))
+        with streaming_save.NdjsonSaveReader(filename) as save_reader:
+            self.assertGreater(save_reader.journal_sequence, 0)  # Entries were merged into base save
+        self.assertEqual(self._lines(EcoSystem.from_file(filename)), expected)
+
+    def test_new_save_removes_old_journal(self):
+        ecosystem = self.make_world(6, 1)
+        filename = self._path("replaced.ndjson")
+        ecosystem.start_journal(filename, compaction_interval=0)
+        ecosystem.cycle()
+        ecosystem.save()
+        ecosystem.stop_journal()
+        ecosystem.cycle()
+        ecosystem.save(filename)
+        self.assertFalse(save_journal.has_journal(filename))
+        self.assertEqual(self._lines(EcoSystem.from_file(filename)), self._lines(ecosystem))
+
+    def test_journal_is_not_kept_for_binary_snapshot(self):
+        ecosystem = self.make_world(7, 0)
+        with self.assertRaises(ValueError):
+            ecosystem.start_journal(self._path("world.fsnap"))
+
+
+if __name__ == "__main__":
+    unittest.main()
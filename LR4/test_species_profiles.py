@@ -0,0 +1,149 @@
+#Author Vodohleb04
+import json
+import os
+import tempfile
+import unittest
+
+import configs
+from ecosystem import EcoSystem
+import species_profiles
+from blueberry import Blueberry
+from hazel import Hazel
+from maple import Maple
+from boar import Boar
+from elk import Elk
+from wolf import Wolf
+from bear import Bear
+
+
+KINDS = {"blueberry": Blueberry, "hazel": Hazel, "maple": Maple, "boar": Boar, "elk": Elk, "wolf": Wolf, "bear": Bear}
+
+
+def ppcp(key: str) -> tuple:
+    """Returns personal power coefficient parameters of config as they were read by creatures"""
+    value = configs.PersonalPowerCoefficientParameters[key].value
+    return value["min_numerator"], value["max_numerator"], value["denominator"]
+
+
+def config_values(key: str) -> dict:
+    """Returns parameters of species that were read from enums of config by classes of species
+
+    key - prefix of names of parameters of species in enums (WOLF)
+    """
+    values = {"life_median": configs.LifeMedian[f"{key}_LM"].value, "max_hp": configs.MaxHP[f"{key}_MHP"].value,
+              "reproduction_age_interval": configs.ReproductionAgeInterval[f"{key}_RAI"].value,
+              "chance_to_produce_kids": configs.ChanceToProduceKids[f"{key}_CTPK"].value,
+              "possible_kids_amount": configs.PossibleKidsAmount[f"{key}_PKA"].value}
+    if key in ("BLUEBERRY", "HAZEL", "MAPLE"):
+        values.update({"unprotected_damage_multiplier": configs.UnprotectedDamageMultiplier[f"{key}_UDM"].value,
+                       "start_hp": configs.StartHP[f"{key}_START_HP"].value,
+                       "hp_reduction": configs.PlantHPReduction[f"{key}_HPR"].value,
+                       "shrub_reduction": configs.PlantShrubReduction[f"{key}_SR"].value,
+                       "offspring_dispersion": configs.PlantOffspringDispersion[f"{key}_OD"].value,
+                       "offspring_nutritional_value": configs.NutritionalValue[f"{key}_OFFSPRING_NV"].value,
+                       "start_shrub_nutritional_value": configs.NutritionalValue[f"START_{key}_SNV"].value,
+                       "eatable_offspring_amount": configs.PlantEatableOffspringPossibleAmount[f"{key}_EOPA"].value,
+                       "start_power": configs.StartPower[f"{key}_SP"].value,
+                       "personal_power_coefficient": ppcp(f"{key}_PPCP")})
+        return values
+    values.update({"unprotected_damage_multiplier": configs.UnprotectedDamageMultiplier.EVERY_ANIMAL_UDM.value,
+                   "start_nutritional_value": configs.NutritionalValue[f"{key}_NV"].value,
+                   "base_damage": configs.Damage[f"{key}_D"].value,
+                   "hunger_per_cycle": configs.HungerPerCycle[f"{key}_HPC"].value,
+                   "kids_sterile_period": configs.SterilePeriods[f"{key}_SP"].value,
+                   "male_start_power": configs.StartPower[f"M_{key}_SP"].value,
+                   "female_start_power": configs.StartPower[f"FEM_{key}_SP"].value,
+                   "male_power_function_coefficient": configs.PowerFunctionCoefficient[f"M_{key}_PFC"].value,
+                   "female_power_function_coefficient": configs.PowerFunctionCoefficient[f"FEM_{key}_PFC"].value,
+                   "male_personal_power_coefficient": ppcp(f"M_{key}_PPCP"),
+                   "female_personal_power_coefficient": ppcp(f"FEM_{key}_PPCP")})
+    if f"{key}_RNV" in configs.RequiredNutritionalValue.__members__:
+        values["required_nutritional_value"] = configs.RequiredNutritionalValue[f"{key}_RNV"].value
+    return values
+
+
+class TestSpeciesProfiles(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.profiles_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.profiles_dir.name, "profiles.json")
+
+    def tearDown(self) -> None:
+        species_profiles.activate(species_profiles.compile_profiles())
+        self.profiles_dir.cleanup()
+
+    def test_compiled_profiles_equal_config(self):
+        profiles = species_profiles.compile_profiles()
+        self.assertEqual(list(profiles), [name.value for name in configs.EnglishCreaturesNames])
+        for name, profile in profiles.items():
+            with self.subTest(species=name):
+                expected = config_values(name.upper())
+                given = {parameter: value for parameter, value in profile._asdict().items() if value is not None}
+                given.pop("power_function_coefficient", None)
+                self.assertEqual(given, expected)
+
+    def test_power_function_coefficient_of_plants(self):
+        profiles = species_profiles.compile_profiles()
+        self.assertEqual(profiles["blueberry"].power_function_coefficient,
+                         configs.PowerFunctionCoefficient.BLUEBERRY_PFC.value)
+        self.assertEqual(profiles["hazel"].power_function_coefficient, configs.PowerFunctionCoefficient.HAZEL_PFC.value)
+        self.assertEqual(profiles["maple"].power_function_coefficient, configs.PowerFunctionCoefficient.HAZEL_PFC.value)
+
+    def test_classes_of_species_read_profile(self):
+        for name, profile in species_profiles.active_profiles().items():
+            kind = KINDS[name]
+            for parameter, value in profile._asdict().items():
+                with self.subTest(species=name, parameter=parameter):
+                    self.assertEqual(getattr(kind, "_" + parameter), value)
+
+    def test_new_creatures_equal_old_ones(self):
+        ecosystem = EcoSystem(seed=4, forest_vertical_length=1, forest_horizontal_length=1, fill=False)
+        ecosystem.fill_creatures("wolf", 4, (0, 0))
+        ecosystem.fill_creatures("maple", 2, (0, 0))
+        for creature in ecosystem.forest.hectares[0][0].creations:
+            with self.subTest(creature=creature.id):
+                self.assertEqual(creature.age, 0)
+                if isinstance(creature, Wolf):
+                    self.assertEqual(creature._hp, configs.MaxHP.WOLF_MHP.value)
+                    self.assertEqual(creature._nutritional_value, configs.NutritionalValue.WOLF_NV.value)
+                    self.assertEqual(creature._food_energy, configs.HungerPerCycle.WOLF_HPC.value * 2)
+                    self.assertEqual(creature._damage, configs.Damage.WOLF_D.value * creature._power_coefficient)
+                    self.assertEqual(creature._sterile_period, configs.ReproductionAgeInterval.WOLF_RAI.value[0])
+                else:
+                    self.assertIsInstance(creature, Maple)
+                    self.assertEqual(creature._hp, configs.StartHP.MAPLE_START_HP.value)
+                    self.assertEqual(creature._nutritional_value, configs.NutritionalValue.START_MAPLE_SNV.value)
+
+    def test_save_and_load_profiles(self):
+        profiles = species_profiles.compile_profiles()
+        species_profiles.save_profiles(self.filename, profiles)
+        self.assertEqual(species_profiles.load_profiles(self.filename), profiles)
+
+    def test_load_changes_of_profiles(self):
+        with open(self.filename, "w") as file:
+            json.dump({"wolf": {"life_median": 5, "reproduction_age_interval": [1, 3]}}, file)
+        profiles = species_profiles.load_profiles(self.filename)
+        self.assertEqual(profiles["wolf"].life_median, 5)
+        self.assertEqual(profiles["wolf"].reproduction_age_interval, (1, 3))
+        self.assertEqual(profiles["bear"], species_profiles.compile_profiles()["bear"])
+
+        species_profiles.activate(profiles)
+        self.assertEqual(Wolf._life_median, 5)
+        start_power = profiles["wolf"].male_start_power
+        k_func_coefficient = profiles["wolf"].male_power_function_coefficient
+        self.assertEqual(Wolf._power_tables[configs.Genders.MALE][3], start_power + (k_func_coefficient * 1))
+        self.assertEqual(Wolf._power_tables[configs.Genders.MALE][4], start_power + (-k_func_coefficient * 1))
+
+    def test_unknown_species_and_parameters(self):
+        for changes in ({"unicorn": {"life_median": 1}}, {"wolf": {"wings": 2}}):
+            with self.subTest(changes=changes):
+                with open(self.filename, "w") as file:
+                    json.dump(changes, file)
+                with self.assertRaises(ValueError):
+                    species_profiles.load_profiles(self.filename)
+        with self.assertRaises(ValueError):
+            species_profiles.activate({"unicorn": species_profiles.compile_profiles()["wolf"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
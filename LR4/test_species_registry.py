@@ -0,0 +1,107 @@
+#Author Vodohleb04
+import unittest
+
+import pytest
+
+import configs
+from ecosystem import EcoSystem
+import species_registry
+from blueberry import Blueberry
+from hazel import Hazel
+from maple import Maple
+from boar import Boar
+from elk import Elk
+from wolf import Wolf
+from bear import Bear
+
+
+def empty_world() -> EcoSystem:
+    """Returns forest of one hectare without creatures"""
+    return EcoSystem(forest_vertical_length=1, forest_horizontal_length=1, fill=False)
+
+
+@pytest.mark.usefixtures("fresh_id_counters")
+class TestSpeciesRegistry(unittest.TestCase):
+
+    def test_entries_in_order_of_registration(self):
+        self.assertEqual([entry.kind for entry in species_registry.entries()],
+                         [Blueberry, Hazel, Maple, Boar, Elk, Wolf, Bear])
+        self.assertEqual([entry.english_name for entry in species_registry.entries()],
+                         [name.value for name in configs.EnglishCreaturesNames])
+
+    def test_dispatch_by_kind_and_names(self):
+        for entry in species_registry.entries():
+            with self.subTest(species=entry.english_name):
+                self.assertIs(species_registry.entry_of_kind(entry.kind), entry)
+                self.assertIs(species_registry.entry_by_name(entry.english_name), entry)
+                self.assertIs(species_registry.entry_by_russian_name(entry.russian_name), entry)
+                self.assertEqual(entry.id_counter_key, f"{entry.english_name}_id_counter")
+                for id_prefix in entry.kind.id_prefixes():
+                    self.assertIs(species_registry.entry_by_id_prefix(id_prefix), entry)
+
+    def test_animals_have_prefix_of_every_gender(self):
+        self.assertEqual(Wolf.id_prefixes(), tuple(Wolf._id_prefix_of(gender) for gender in configs.Genders))
+        self.assertEqual(len(Blueberry.id_prefixes()), 1)
+
+    def test_dispatch_by_creature(self):
+        ecosystem = EcoSystem(seed=1, forest_vertical_length=2, forest_horizontal_length=2)
+        for hectare_line in ecosystem.forest.hectares:
+            for hectare in hectare_line:
+                for creature in hectare.creations:
+                    entry = species_registry.entry_of(creature)
+                    self.assertIs(entry.kind, type(creature))
+                    self.assertIs(ecosystem.find_creature(creature.id), creature)
+
+    def test_subclass_of_species(self):
+        class TameWolf(Wolf):
+            __slots__ = ()
+
+        self.assertIs(species_registry.entry_of_kind(TameWolf), species_registry.entry_of_kind(Wolf))
+
+    def test_unknown_species(self):
+        with self.assertRaises(TypeError):
+            species_registry.entry_of_kind(int)
+        with self.assertRaises(KeyError):
+            species_registry.entry_by_name("unicorn")
+        with self.assertRaises(KeyError):
+            species_registry.entry_by_russian_name("единорог")
+        with self.assertRaises(KeyError):
+            species_registry.entry_by_id_prefix("unicorn")
+        ecosystem = empty_world()
+        with self.assertRaises(TypeError):
+            ecosystem.fill_creatures("unicorn", 1, (0, 0))
+
+    def test_species_is_registered_once(self):
+        entry = species_registry.entry_of_kind(Wolf)
+        with self.assertRaises(ValueError):
+            species_registry.species(entry.english_name, entry.russian_name)(Wolf)
+        self.assertEqual(len(species_registry.entries()), 7)
+
+    def test_fill_by_every_species(self):
+        ecosystem = empty_world()
+        for entry in species_registry.entries():
+            ecosystem.fill_creatures(entry.english_name, 2, (0, 0))
+        self.assertEqual(ecosystem.population_summary(),
+                         {entry.english_name: {"alive": 2, "dead": 0} for entry in species_registry.entries()})
+        for entry in species_registry.entries():
+            self.assertEqual(len(ecosystem.forest.hectares[0][0].creatures_of(entry.kind)), 2)
+            self.assertEqual(ecosystem.define_creature_kind_from_russian(entry.russian_name), entry.english_name)
+
+    def test_buckets_keep_order_of_creations(self):
+        ecosystem = empty_world()
+        ecosystem.fill_creatures("wolf", 6, (0, 0))
+        ecosystem.fill_creatures("hazel", 2, (0, 0))
+        hectare = ecosystem.forest.hectares[0][0]
+        wolves = hectare.creatures_of(Wolf)
+        wolves[1].die()
+        wolves[4].die()
+        hectare.remove_creatures({wolves[2]})
+        hectare.append_creature(wolves[2])
+        self.assertEqual(hectare.creatures_of(Wolf, alive=True), [wolves[0], wolves[3], wolves[5], wolves[2]])
+        self.assertEqual(hectare.creatures_of(Wolf, alive=False), [wolves[1], wolves[4]])
+        self.assertEqual(hectare.population()[Wolf], (4, 2))
+        self.assertEqual(ecosystem.population_summary()["wolf"], {"alive": 4, "dead": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#Author Vodohleb04
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from ecosystem import EcoSystem
+import streaming_save
+
+
+@pytest.mark.usefixtures("seeded_worlds")
+class TestStreamingSave(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.saves_dir.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.saves_dir.name, name)
+
+    def _lines(self, ecosystem: EcoSystem, name="compared.ndjson") -> list:
+        ecosystem.save(self._path(name))
+        with open(self._path(name)) as save_file:
+            return save_file.readlines()
+
+    def test_round_trip(self):
+        for extension in ("ndjson", "json"):
+            with self.subTest(extension=extension):
+                ecosystem = self.make_world(3, 4)
+                filename = self._path(f"world.{extension}")
+                ecosystem.save(filename)
+                self.assertTrue(streaming_save.is_ndjson_save(filename))
+                loaded = EcoSystem.from_file(filename)
+                self.assertEqual(self._lines(loaded), self._lines(ecosystem))
+                self.assertEqual(loaded.count_creatures_amount(), ecosystem.count_creatures_amount())
+
+    def test_one_line_per_creature(self):
+        ecosystem = self.make_world(5, 2)
+        lines = self._lines(ecosystem)
+        self.assertEqual(len(lines), ecosystem.count_creatures_amount() + 1)
+        header = json.loads(lines[0])
+        self.assertEqual(header["ecosystem"]["forest_vertical_length"],
+                         self.world_parameters["forest_vertical_length"])
+
+    def test_loaded_world_continues_as_saved(self):
+        ecosystem = self.make_world(7, 3)
+        ecosystem.save(self._path("middle.ndjson"))
+        for _ in range(3):
+            ecosystem.cycle()
+        expected = self._lines(ecosystem)
+        loaded = EcoSystem.from_file(self._path("middle.ndjson"))
+        for _ in range(3):
+            loaded.cycle()
+        self.assertEqual(self._lines(loaded), expected)
+
+    def test_legacy_json_save(self):
+        ecosystem = self.make_world(9, 2)
+        with open(self._path("legacy.json"), "w") as legacy_file:  # One json list: parameters, counters, creatures
+            json.dump(ecosystem._pack_general_data() + list(ecosystem._creature_records()), legacy_file)
+        self.assertFalse(streaming_save.is_ndjson_save(self._path("legacy.json")))
+        loaded = EcoSystem.from_file(self._path("legacy.json"))
+        self.assertEqual([json.loads(line) for line in self._lines(loaded)],
+                         [json.loads(line) for line in self._lines(ecosystem)])
+
+    def test_id_counters_are_installed_only_on_demand(self):
+        saved = self.make_world(4, 3)
+        saved_counters = saved._pack_general_data()[1]
+        for extension in ("ndjson", "json", "fsnap"):
+            saved.save(self._path(f"counted.{extension}"))
+        running = self.make_world(5, 5)
+        running_counters = running._pack_general_data()[1]
+        self.assertNotEqual(running_counters, saved_counters)
+        for extension in ("ndjson", "json", "fsnap"):
+            with self.subTest(extension=extension):
+                loaded = EcoSystem.from_file(self._path(f"counted.{extension}"), install_id_counters=False)
+                self.assertEqual(running._pack_general_data()[1], running_counters)
+                running.adopt(loaded)
+                running.install_id_counters()
+                self.assertEqual(running._pack_general_data()[1], saved_counters)
+                running = self.make_world(5, 5)
+
+    def test_unknown_file_type(self):
+        ecosystem = self.make_world(1, 0)
+        with self.assertRaises(ValueError):
+            ecosystem.save(self._path("world.txt"))
+        with self.assertRaises(ValueError):
+            EcoSystem.from_file(self._path("world.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#Author Vodohleb04
+import os
+import tempfile
+import threading
+import unittest
+
+import pytest
+
+from ecosystem import EcoSystem
+import random_streams
+from random_streams import RandomStream
+
+
+@pytest.mark.usefixtures("seeded_worlds")
+class TestTiledCycle(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.saves_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.saves_dir.cleanup()
+
+    def _run(self, seed: int, workers: int, cycles=6) -> str:
+        """Returns save of seeded world after cycles made by workers"""
+        ecosystem = self.make_world(seed, cycles, workers)
+        filename = os.path.join(self.saves_dir.name, f"world{workers}.json")
+        ecosystem.save(filename)
+        with open(filename) as save_file:
+            return save_file.read()
+
+    def test_same_result_for_any_amount_of_workers(self):
+        for seed in (7, 8):
+            with self.subTest(seed=seed):
+                serial = self._run(seed, 0)
+                self.assertEqual(self._run(seed, 1), serial)
+                self.assertEqual(self._run(seed, 3), serial)
+
+    def test_same_seed_gives_same_world(self):
+        self.assertEqual(self._run(11, 2), self._run(11, 2))
+        self.assertNotEqual(self._run(11, 0), self._run(12, 0))
+
+    def test_creatures_stay_the_same_objects(self):
+        ecosystem = self.make_world(5, 0, 2)
+        creatures = [creature for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+                     for creature in hectare.creations]
+        ecosystem.cycle()
+        found = [creature for creature in creatures if ecosystem.find_creature(creature.id) is not None]
+        self.assertTrue(found)
+        for creature in found:
+            self.assertIs(ecosystem.find_creature(creature.id), creature)
+
+    def test_forest_is_read_and_changed_between_cycles(self):
+        saves = []
+        for workers in (0, 3):
+            ecosystem = self.make_world(9, 0, workers)
+            for cycle in range(12):
+                ecosystem.cycle()
+                population = ecosystem.population_summary()
+                if cycle % 2:
+                    creatures = [creature for hectare_line in ecosystem.forest.hectares for hectare in hectare_line
+                                 for creature in hectare.creations]
+                    self.assertEqual(ecosystem.population_summary(), population)
+                    if cycle == 5:
+                        ecosystem.remove_creature(creatures[0].id)
+            filename = os.path.join(self.saves_dir.name, f"changed{workers}.json")
+            ecosystem.save(filename)
+            with open(filename) as save_file:
+                saves.append(save_file.read())
+        self.assertEqual(saves[0], saves[1])
+
+    def test_negative_amount_of_workers(self):
+        ecosystem = EcoSystem(forest_vertical_length=1, forest_horizontal_length=1)
+        with self.assertRaises(ValueError):
+            ecosystem.cycle_workers = -1
+
+
+class TestActiveRandomStream(unittest.TestCase):
+
+    def test_activation_is_local_to_thread(self):
+        stream = RandomStream(1)
+        drawn_in_thread = []
+
+        def draw_in_thread():
+            with random_streams.activated(RandomStream(2)):
+                started.set()
+                resumed.wait()
+                drawn_in_thread.append(random_streams.randint(0, 2 ** 30))
+
+        started, resumed = threading.Event(), threading.Event()
+        thread = threading.Thread(target=draw_in_thread)
+        with random_streams.activated(stream):
+            thread.start()
+            started.wait()
+            self.assertIs(random_streams.active(), stream)
+            drawn = random_streams.randint(0, 2 ** 30)
+            resumed.set()
+            thread.join()
+        self.assertEqual(drawn, RandomStream(1).randint(0, 2 ** 30))
+        self.assertEqual(drawn_in_thread, [RandomStream(2).randint(0, 2 ** 30)])
+        self.assertIsNot(random_streams.active(), stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,17 +53,16 @@ class TestUi_MainWindow(game_main_window_gui.Ui_MainWindow):
         self._next_period = after_done_emitter(
             MainWindow.test_signals.world_changed_signal)(super()._next_period)
 
-    def _add_creatures_dialog(self, MainWindow: TestWindow, ecosystem: EcoSystem) -> None:
+    def _add_creatures_dialog(self, MainWindow: TestWindow) -> None:
         """Creates dialog to add creatures (CustomAddCreaturesDialog) to selected hectare of forest
 
         MainWindow - main window of program
-        ecosystem - data controller part of program
         """
         self._pause_game()
         add_creatures_dialog_window = test_add_creatures_dialog.TestCustomAddCreaturesDialog(parent=MainWindow)
         add_creatures_dialog_window.accepted.connect(
             lambda: self.statusBar.showMessage(configs.GuiMessages.CREATURES_ADDED.value, configs.MESSAGE_DURATION))
-        add_creatures_dialog_window.addCreaturesSignal.updateMapSignal.connect(lambda: self._update(ecosystem))
+        add_creatures_dialog_window.addCreaturesSignal.updateMapSignal.connect(self._update)
         add_creatures_dialog_window.addCreaturesSignal.updateMapSignal.connect(
             MainWindow.test_signals.world_changed_signal.emit)
         add_creatures_dialog_window.accepted.connect(lambda: self._continue_game(MainWindow.game_running_flag))
@@ -74,9 +73,9 @@ class TestUi_MainWindow(game_main_window_gui.Ui_MainWindow):
             MainWindow.test_signals.after_adding_creatures_signal.emit)
         ui = test_add_creatures_dialog.Ui_addCreaturesDialog()
         ui.setupUi(add_creatures_dialog_window,
-                   ecosystem,
-                   self.worldMapTable.currentItem().row(),
-                   self.worldMapTable.currentItem().column())
+                   game_main_window_gui.EcosystemProxy(self.simulation_worker),
+                   self.worldMapTable.currentIndex().row(),
+                   self.worldMapTable.currentIndex().column())
         add_creatures_dialog_window.show()
         add_creatures_dialog_window.exec()
 
@@ -131,7 +130,7 @@ class TestGuiApp(unittest.TestCase):
         self.run_start = datetime.datetime.now()
         self.log_file.write(f"|-|Test run started at {self.run_start}|-|\n")
         self.app = QtWidgets.QApplication(sys.argv)
-        self.current_ecosystem = EcoSystem()
+        self.current_ecosystem = EcoSystem(fill=False)
         self.previous_ecosystem = copy.deepcopy(self.current_ecosystem)
         self.MainWindow = TestWindow()
         self.current_creature = None
@@ -156,8 +155,7 @@ class TestGuiApp(unittest.TestCase):
     def run_test_window(self) -> None:
         ui = TestUi_MainWindow()
         ui.setupUi(self.MainWindow, self.current_ecosystem)
-        ui.cellDataListWidget.currentItemChanged.connect(
-            lambda: self.set_current_creature(ui.cellDataListWidget))
+        ui.cellDataListWidget.selectionModel().currentChanged.connect(lambda: self.set_current_creature(ui))
         self.MainWindow.show()
         self.app.exec_()
 
@@ -165,9 +163,9 @@ class TestGuiApp(unittest.TestCase):
         self.assertEqual(self.run_test_window(), None)
         self.log_file.write("app test run successful\n")
 
-    def set_current_creature(self, cellDataListWidget):
-        if cellDataListWidget.currentItem():
-            self.current_creature = cellDataListWidget.currentItem().text()
+    def set_current_creature(self, ui):
+        if ui.current_creature_id() is not None:
+            self.current_creature = ui.current_creature_id()
 
     def creature_removed_successfully(self):
         print(self.current_creature)
@@ -0,0 +1,560 @@
+#Author Vodohleb04
+import multiprocessing
+import weakref
+from operator import attrgetter
+from typing import Dict, List, Optional, Set, Tuple
+
+from creature_interfaces import Movable, Hunger, Aging
+from forest import Forest, ForestChanges, Hectare
+from reproduction import GenderReproduction, NonGenderReproduction
+from random_streams import RandomStream
+import random_streams
+import species_profiles
+import configs
+from pedigree import Pedigree
+
+
+_state_getters = {}  # class of creature -> (names of slots of its state, getter of its state)
+
+
+def feed_hectare(hectare: Hectare) -> None:
+    """Provokes hungry creatures of hectare to find food in it"""
+    for creature in hectare.creations:
+        if isinstance(creature, Hunger):
+            creature.search_for_food(hectare)
+
+
+def breed_hectare(hectare: Hectare, kinship: Pedigree) -> List:
+    """Provokes animals of hectare to make children, returns children
+
+    kinship - pedigree for kinship checks of animals
+    Children are added to hectare after all animals tried, so they are not provoked in the cycle of their birth
+    """
+    children = []
+    for creature in hectare.creations:
+        if isinstance(creature, GenderReproduction):
+            children.extend(creature.reproduction(hectare, kinship))
+    hectare.extend_hectare(children)
+    return children
+
+
+def sow_hectare(hectare: Hectare, forest_size: Tuple[int, int]) -> List[Tuple[NonGenderReproduction, Tuple[int, int]]]:
+    """Provokes plants of hectare to make offsprings, returns (offspring, position of dispersion) for every offspring
+
+    Offsprings are not added to forest
+    """
+    offsprings = []
+    for creature in hectare.creations:
+        if isinstance(creature, NonGenderReproduction):
+            for offspring in creature.reproduction():
+                offsprings.append((offspring, offspring.choose_dispersion_position(hectare.position, forest_size)))
+    return offsprings
+
+
+def choose_moves(hectare: Hectare, forest_size: Tuple[int, int]) -> List[Tuple[int, Tuple[int, int]]]:
+    """Provokes movable creatures of hectare to choose destinations, returns (place in hectare, destination)
+
+    Chances to move are drawn by one batch for all movable creatures of hectare, creatures are not moved
+    """
+    movable_places = [place for place, creature in enumerate(hectare.creations) if isinstance(creature, Movable)]
+    chances_to_move = random_streams.active().randint_batch(1, 3, len(movable_places))
+    moves = []
+    for place, chance_to_move in zip(movable_places, chances_to_move):
+        if chance_to_move == 1:
+            destination = hectare.creations[place].choose_destination_from(hectare.position, forest_size,
+                                                                           chance_to_move)
+            if destination is not None:
+                moves.append((place, destination))
+    return moves
+
+
+def age_hectare(hectare: Hectare, offsprings: List[Tuple[NonGenderReproduction, Tuple[int, int]]]) -> None:
+    """Changes time-depended parameters of creatures of hectare and of offsprings of its plants"""
+    for creature in hectare.creations + [offspring for offspring, _ in offsprings]:
+        if isinstance(creature, Aging):
+            creature.live_time_cycle()
+
+
+def hectare_seeds(forest: Forest, stream: RandomStream) -> List[List[int]]:
+    """Draws seeds of random substreams of hectares of forest for one cycle (lines of seeds)"""
+    return [stream.spawn_seeds(forest.horizontal_length) for _ in range(forest.vertical_length)]
+
+
+class CyclePlan:
+
+    def __init__(self, forest: Forest, stream: RandomStream):
+        """Creates plan of cycle of forest that is made phase by phase for whole forest
+
+        forest - data container for creatures
+        stream - random stream of ecosystem (seeds of substreams of hectares are drawn from it)
+        streams - lines of random substreams of hectares (same as substreams of tiled cycle)
+        moves - (creature, destination) for every creature that moves to other hectare
+        offsprings - (offspring, position of dispersion) of plants of every hectare (lists in order of hectares)
+        Every hectare draws its numbers from its own substream in the same order as in tiled cycle, so phased cycle
+        gives the same result as tiled one
+        """
+        self._forest = forest
+        self.streams = [[RandomStream(seed) for seed in seeds_line] for seeds_line in hectare_seeds(forest, stream)]
+        self.moves = []
+        self.offsprings = []
+
+    def hectares(self):
+        """Generates hectares of forest in order of lines, substream of hectare is active while it's processed"""
+        for hectare_line, streams_line in zip(self._forest.hectares, self.streams):
+            for hectare, stream in zip(hectare_line, streams_line):
+                with random_streams.activated(stream):
+                    yield hectare
+
+    def commit(self) -> None:
+        """Moves creatures and adds dispersed offsprings to forest (moves first, as in tiled cycle)"""
+        changes = ForestChanges(self._forest)
+        for creature, destination in self.moves:
+            changes.move_creature(creature, *destination)
+        for offsprings in self.offsprings:
+            for offspring, position in offsprings:
+                changes.add_creature(offspring, *position)
+        changes.commit()
+
+
+def split_into_strips(vertical_length: int, strips_amount: int) -> List[range]:
+    """Splits lines of forest into strips_amount (or less if there are not enough lines) strips of neighbour lines"""
+    strips_amount = max(1, min(strips_amount, vertical_length))
+    bounds = [vertical_length * i // strips_amount for i in range(strips_amount + 1)]
+    return [range(bounds[i], bounds[i + 1]) for i in range(strips_amount)]
+
+
+def _state_getter(kind: type) -> Tuple[Tuple[str, ...], attrgetter]:
+    """Returns names of slots of state of creature of kind (every slot but hectare) and getter of them"""
+    state_getter = _state_getters.get(kind)
+    if state_getter is None:
+        slots = []
+        for base in reversed(kind.__mro__):
+            slots.extend(slot for slot in base.__dict__.get("__slots__", ())
+                         if slot != "_hectare" and slot not in slots)
+        state_getter = _state_getters[kind] = (tuple(slots), attrgetter(*slots))
+    return state_getter
+
+
+def _state_of(creature) -> Tuple:
+    """Returns values of slots of creature (every slot but hectare)"""
+    return _state_getter(type(creature))[1](creature)
+
+
+def _restore_state(creature, state: Tuple) -> None:
+    """Sets values of slots of creature from state made by _state_of"""
+    for slot, value in zip(_state_getter(type(creature))[0], state):
+        setattr(creature, slot, value)
+
+
+def _cycle_hectare(hectare: Hectare, stream: RandomStream, forest_size: Tuple[int, int], kinship: Pedigree) \
+        -> Tuple[List, List[Tuple[NonGenderReproduction, Tuple[int, int]]], List[Tuple[int, Tuple[int, int]]]]:
+    """Makes hectare-local phases of cycle (same phases as CyclePlan) with hectare's own random stream
+
+    kinship - pedigree for kinship checks of animals
+    returns (children, offsprings, moves), children are added to hectare, moves and offsprings are not applied
+    """
+    with random_streams.activated(stream):
+        feed_hectare(hectare)
+        children = breed_hectare(hectare, kinship)
+        offsprings = sow_hectare(hectare, forest_size)
+        moves = choose_moves(hectare, forest_size)
+        age_hectare(hectare, offsprings)
+    return children, offsprings, moves
+
+
+def tiled_cycle(forest: Forest, stream: RandomStream, animals_pedigree: Pedigree) -> None:
+    """Makes movement, nutrition, reproduction and aging of creatures of forest hectare by hectare in main process
+
+    forest - data container for creatures
+    stream - random stream of ecosystem (seeds of substreams of hectares are drawn from it)
+    animals_pedigree - pedigree of ecosystem (newborn animals are recorded to it)
+    Every hectare gets its own substream of random stream (same as in CyclePlan and ResidentTiles), so result depends
+    only on the stream, not on the amount of workers. Moves and offsprings are committed after all hectares are
+    processed: moves first, then offsprings
+    """
+    forest_size = (forest.vertical_length, forest.horizontal_length)
+    changes = ForestChanges(forest)
+    offsprings = []
+    for hectare_line, seeds_line in zip(forest.hectares, hectare_seeds(forest, stream)):
+        for hectare, seed in zip(hectare_line, seeds_line):
+            children, hectare_offsprings, moves = _cycle_hectare(hectare, RandomStream(seed), forest_size,
+                                                                 animals_pedigree)
+            animals_pedigree.record_creatures(children)
+            for place, destination in moves:
+                changes.move_creature(hectare.creations[place], *destination)
+            offsprings.extend(hectare_offsprings)
+    for offspring, position in offsprings:
+        changes.add_creature(offspring, *position)
+    changes.commit()
+
+
+def _normalized_position(position: Tuple[int, int], forest_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Returns position of hectare (negative numbers are counted from the end of forest, as by ForestChanges)
+
+    raise IndexError if position is out of forest
+    """
+    return range(forest_size[0])[position[0]], range(forest_size[1])[position[1]]
+
+
+class _ResidentTile:
+
+    def __init__(self, first_row: int, hectares: List[List[Hectare]], forest_size: Tuple[int, int], profiles: Dict,
+                 kinship_pedigree: Optional[Pedigree]):
+        """Creates tile of forest that is kept by worker process between cycles
+
+        first_row - vertical number of the first line of hectares of tile
+        hectares - lines of hectares of tile (copies of hectares of forest of main process)
+        forest_size - (vertical length, horizontal length) of forest
+        profiles - active profiles of species of main process
+        kinship_pedigree - pedigree of ecosystem for kinship checks older than parents (None if KINSHIP_GENERATIONS
+            is 1 - parents are kept by animals)
+        Hectares of tile mark creatures whose state was changed until tile is pulled by main process
+        """
+        if species_profiles.active_profiles() != profiles:
+            species_profiles.activate(profiles)
+        self._first_row = first_row
+        self._hectares = hectares
+        self._forest_size = forest_size
+        self._kinship_pedigree = kinship_pedigree
+        self._newborns = []  # Newborns of current cycle (numbers are temporary until commit)
+        self._departures = []  # Creatures that left hectares of tile in current cycle: movers, then offsprings
+        for hectare_line in self._hectares:
+            for hectare in hectare_line:
+                hectare._changed_states = set()
+
+    def _departure(self, creature, destination: Tuple[int, int], newborn: bool) -> Tuple:
+        """Returns (destination, creature or None if destination is in tile, True if creature is newborn)"""
+        destination = _normalized_position(destination, self._forest_size)
+        if self._first_row <= destination[0] < self._first_row + len(self._hectares):
+            return destination, None, newborn
+        return destination, creature, newborn
+
+    def cycle(self, seeds: List[List[int]], profiles: Optional[Dict]) -> Tuple[Dict[type, int], List, List, List]:
+        """Makes hectare-local phases of cycle for every hectare of tile, removes movers from their hectares
+
+        seeds - lines of seeds of substreams of hectares of tile
+        profiles - active profiles of species of main process if they were switched since previous cycle, else None
+        returns (births, records, moves, offsprings):
+            births - amount of newborns of tile of every kind, newborns of kind get temporary numbers 0, 1... in order
+                of hectares
+            records - pedigree entries of children (with temporary numbers)
+            moves, offsprings - (destination, creature or None, newborn flag) for every mover and every offspring in
+                order of hectares, creature is sent only if it leaves tile
+        """
+        if profiles is not None:
+            species_profiles.activate(profiles)
+        kinship = Pedigree() if self._kinship_pedigree is None else self._kinship_pedigree
+        births = {}
+        records = []
+        moves = []
+        offsprings = []
+        for hectare_line, seeds_line in zip(self._hectares, seeds):
+            for hectare, seed in zip(hectare_line, seeds_line):
+                children, hectare_offsprings, hectare_moves = _cycle_hectare(hectare, RandomStream(seed),
+                                                                             self._forest_size, kinship)
+                for newborn in children + [offspring for offspring, _ in hectare_offsprings]:
+                    kind = type(newborn)
+                    newborn._number = births.get(kind, 0)
+                    births[kind] = newborn._number + 1
+                    self._newborns.append(newborn)
+                records.extend(Pedigree.entry_of(child) for child in children)
+                moves.extend((hectare, hectare.creations[place], destination) for place, destination in hectare_moves)
+                offsprings.extend(hectare_offsprings)
+        leaving = {}
+        for hectare, creature, _ in moves:
+            leaving.setdefault(hectare, {})[creature] = None
+        for hectare, leaving_creatures in leaving.items():
+            hectare.remove_creatures(leaving_creatures)
+        newborns = set(self._newborns)
+        self._departures = [creature for _, creature, _ in moves] + [offspring for offspring, _ in offsprings]
+        return (births, records,
+                [self._departure(creature, destination, creature in newborns) for _, creature, destination in moves],
+                [self._departure(offspring, position, True) for offspring, position in offsprings])
+
+    def commit(self, bases: Dict[type, int], arrivals: List[Tuple[Tuple[int, int], object]],
+               kinship_records: Optional[List], bury: bool, prune: bool) \
+            -> Tuple[Dict[type, Tuple[int, int]], Optional[Dict[type, Set[int]]]]:
+        """Gives newborns their numbers, adds arriving creatures to hectares of tile, buries dead creatures
+
+        bases - number of the first newborn of tile of every kind
+        arrivals - (position, creature or place of departure of this tile) in order of commit of forest
+        kinship_records - pedigree entries of newborn animals of every tile (None if kinship pedigree is not kept)
+        bury - True if deadly worm removes dead creatures after cycle
+        prune - True if pedigree of ecosystem is pruned after cycle
+        returns (population of tile, numbers kept by prune of pedigree for animals of tile or None if not prune)
+        """
+        for newborn in self._newborns:
+            newborn._number += bases.get(type(newborn), 0)
+        arriving = {}
+        for position, creature in arrivals:
+            if isinstance(creature, int):
+                creature = self._departures[creature]
+            arriving.setdefault(position, []).append(creature)
+        for (vertical_number, horizontal_number), arriving_creatures in arriving.items():
+            self._hectares[vertical_number - self._first_row][horizontal_number].extend_hectare(arriving_creatures)
+        self._newborns = []
+        self._departures = []
+        if kinship_records is not None and self._kinship_pedigree is not None:
+            for entry in kinship_records:
+                self._kinship_pedigree.record_entry(*entry)
+        population = {}
+        for hectare_line in self._hectares:
+            for hectare in hectare_line:
+                if bury:
+                    hectare.remove_dead_creatures()
+                for kind, (alive, dead) in hectare.population().items():
+                    counted_alive, counted_dead = population.get(kind, (0, 0))
+                    population[kind] = (counted_alive + alive, counted_dead + dead)
+        kept_numbers = None
+        if prune:
+            kept_numbers = Pedigree.kept_numbers(creature for hectare_line in self._hectares for hectare in hectare_line
+                                                 for creature in hectare.creatures_of(GenderReproduction))
+        return population, kept_numbers
+
+    def pull(self) -> List[List[Tuple[List[Tuple[type, int, Tuple]], List[int]]]]:
+        """Returns lines of hectares of tile, for every hectare - ((kind, number, state) of its creatures, places of
+        creatures whose state was changed since previous pull)"""
+        lines = []
+        for hectare_line in self._hectares:
+            line = []
+            for hectare in hectare_line:
+                changed_states = hectare._changed_states
+                hectare._changed_states = set()
+                line.append(([(type(creature), creature._number, _state_of(creature))
+                              for creature in hectare.creations],
+                             [place for place, creature in enumerate(hectare.creations) if creature in changed_states]))
+            lines.append(line)
+        return lines
+
+
+def _serve_tile(connection) -> None:
+    """Keeps tile of forest and runs commands of main process on it until connection is closed (runs in worker
+    process)
+
+    Every command is (name of method of tile or "load", arguments), reply is (exception or None, result)
+    """
+    tile = None
+    while True:
+        try:
+            command, arguments = connection.recv()
+        except EOFError:
+            return
+        try:
+            if command == "load":
+                tile = _ResidentTile(*arguments)
+                reply = (None, None)
+            else:
+                reply = (None, getattr(tile, command)(*arguments))
+        except Exception as error:
+            reply = (error, None)
+        connection.send(reply)
+
+
+def _stop_workers(connections: List, processes: List) -> None:
+    """Closes connections with worker processes and waits for their end"""
+    for connection in connections:
+        connection.close()
+    for process in processes:
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+    connections.clear()
+    processes.clear()
+
+
+class ResidentTiles:
+
+    def __init__(self, workers: int):
+        """Creates tiles of forest that are kept by long-lived worker processes between cycles
+
+        workers - amount of worker processes, every worker keeps one strip of neighbour lines of hectares
+        Worker processes are started by the first cycle and stopped by close (or when tiles are collected). Cycle
+        sends only seeds of substreams of hectares, creatures that cross borders of strips, numbers of newborns and
+        counters of population; states of creatures are pulled to forest only when forest is read. Tiles are sent to
+        workers again if forest was changed after pull
+        raise ValueError if workers < 2
+        """
+        if workers < 2:
+            raise ValueError(f"Amount of workers of resident tiles must be >= 2, {workers} got instead")
+        self._workers = workers
+        self._connections = []
+        self._processes = []
+        self._finalizer = None
+        self._forest = None  # Forest whose copy is kept by workers
+        self._version = None  # Version of forest when tiles were loaded or pulled
+        self._strips = []
+        self._tile_of_line = []  # Vertical number of hectare -> number of tile
+        self._profiles = None  # Profiles of species that are active in workers
+        self._population = {}
+        self._stale = False
+
+    @property
+    def is_stale(self) -> bool:
+        """Returns True if states of creatures of forest are older than states of tiles (forest must be pulled)"""
+        return self._stale
+
+    def population(self) -> Dict[type, Tuple[int, int]]:
+        """Returns (amount of alive creatures, amount of dead creatures) for every kind of creatures of tiles after
+        the last cycle"""
+        return dict(self._population)
+
+    def close(self) -> None:
+        """Stops worker processes (states of creatures that are not pulled are lost)"""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._forest = None
+        self._stale = False
+
+    def _start_workers(self) -> None:
+        """Starts worker processes"""
+        for _ in range(self._workers):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve_tile, args=(worker_connection,), daemon=True)
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+        self._finalizer = weakref.finalize(self, _stop_workers, self._connections, self._processes)
+
+    def _run(self, commands: List[Tuple[str, Tuple]]) -> List:
+        """Sends one command to every worker and returns their results
+
+        raise exception of worker if command failed (tiles are not resident after it)
+        """
+        for connection, command in zip(self._connections, commands):
+            connection.send(command)
+        replies = [connection.recv() for connection in self._connections[:len(commands)]]
+        for error, _ in replies:
+            if error is not None:
+                self._forest = None
+                self._stale = False
+                raise error
+        return [result for _, result in replies]
+
+    def _load(self, forest: Forest, animals_pedigree: Pedigree) -> None:
+        """Sends strips of hectares of forest to workers"""
+        if not self._processes:
+            self._start_workers()
+        forest_size = (forest.vertical_length, forest.horizontal_length)
+        self._strips = split_into_strips(forest.vertical_length, self._workers)
+        self._tile_of_line = [tile_number for tile_number, strip in enumerate(self._strips) for _ in strip]
+        self._profiles = species_profiles.active_profiles()
+        # Pedigree is sent to workers only if kinship checks need ancestors older than parents
+        kinship_pedigree = animals_pedigree if configs.KINSHIP_GENERATIONS > 1 else None
+        self._run([("load", (strip.start, forest.hectares[strip.start:strip.stop], forest_size, self._profiles,
+                             kinship_pedigree)) for strip in self._strips])
+        self._forest = forest
+        self._version = forest._version
+        self._stale = False
+
+    def cycle(self, forest: Forest, stream: RandomStream, animals_pedigree: Pedigree, bury: bool, prune: bool) \
+            -> Optional[Dict[type, Set[int]]]:
+        """Makes movement, nutrition, reproduction and aging of creatures of tiles (same result as tiled_cycle)
+
+        forest - data container for creatures (it is sent to workers if they don't keep its current copy)
+        stream - random stream of ecosystem (seeds of substreams of hectares are drawn from it)
+        animals_pedigree - pedigree of ecosystem (newborn animals are recorded to it after they get their ids)
+        bury - True if deadly worm removes dead creatures after cycle
+        prune - True if pedigree of ecosystem is pruned after cycle
+        returns numbers of animals of forest and of their parents for Pedigree.prune_numbers if prune, else None
+        Newborns get their ids in order of tiles and hectares, then moves and offsprings are committed in the same
+        order as by tiled_cycle
+        """
+        if self._forest is not forest or self._version != forest._version:
+            self._load(forest, animals_pedigree)
+        seeds = hectare_seeds(forest, stream)
+        profiles = species_profiles.active_profiles()
+        switched_profiles = None if profiles == self._profiles else profiles
+        self._profiles = profiles
+        replies = self._run([("cycle", (seeds[strip.start:strip.stop], switched_profiles)) for strip in self._strips])
+
+        counters = {}
+        tiles_bases = []
+        for births, _, _, _ in replies:
+            bases = {}
+            for kind, amount in births.items():
+                if kind not in counters:
+                    counters[kind] = kind.get_id_counter()
+                bases[kind] = counters[kind]
+                counters[kind] += amount
+            tiles_bases.append(bases)
+        for kind, id_counter in counters.items():
+            kind.rewrite_id_counter(id_counter)
+        kinship_records = [] if configs.KINSHIP_GENERATIONS > 1 else None
+        for bases, (_, records, _, _) in zip(tiles_bases, replies):
+            for kind, number, gender, mother, father in records:
+                entry = (kind, number + bases[kind], gender, mother, father)
+                animals_pedigree.record_entry(*entry)
+                if kinship_records is not None:
+                    kinship_records.append(entry)
+
+        arrivals = [[] for _ in self._strips]
+        for departures_place in (2, 3):  # Moves of every tile, then offsprings of every tile
+            for bases, reply in zip(tiles_bases, replies):
+                first_place = 0 if departures_place == 2 else len(reply[2])
+                for place, (destination, creature, newborn) in enumerate(reply[departures_place], first_place):
+                    if creature is None:
+                        arrivals[self._tile_of_line[destination[0]]].append((destination, place))
+                        continue
+                    if newborn:
+                        creature._number += bases[type(creature)]
+                    arrivals[self._tile_of_line[destination[0]]].append((destination, creature))
+
+        results = self._run([("commit", (bases, tile_arrivals, kinship_records, bury, prune))
+                             for bases, tile_arrivals in zip(tiles_bases, arrivals)])
+        self._stale = True
+        self._population = {}
+        kept_numbers = {} if prune else None
+        for population, tile_kept_numbers in results:
+            for kind, (alive, dead) in population.items():
+                counted_alive, counted_dead = self._population.get(kind, (0, 0))
+                self._population[kind] = (counted_alive + alive, counted_dead + dead)
+            if prune:
+                for kind, numbers in tile_kept_numbers.items():
+                    kept_numbers.setdefault(kind, set()).update(numbers)
+        return kept_numbers
+
+    def pull(self) -> None:
+        """Pulls states of creatures of tiles to forest
+
+        Creatures of forest stay the same objects (they are matched by kind and number), hectares are changed only if
+        creatures arrived, left or died in them. Creatures marked by hectares of tiles are marked by hectares of forest
+        (changes of forest are tracked as if cycles were made in main process)
+        """
+        if not self._stale:
+            return
+        contents = [content for lines in self._run([("pull", ())] * len(self._strips))
+                    for line in lines for content in line]
+        hectares = [hectare for hectare_line in self._forest.hectares for hectare in hectare_line]
+        known = {}
+        for hectare in hectares:
+            for creature in hectare.creations:
+                known.setdefault((type(creature), creature._number), []).append(creature)
+        plans = []
+        for hectare, (creatures, _) in zip(hectares, contents):
+            new_creations = []
+            for kind, number, _ in creatures:
+                same_creatures = known.get((kind, number))
+                new_creations.append(same_creatures.pop(0) if same_creatures else kind.__new__(kind))
+            kept_creations = set(new_creations)
+            staying = [creature for creature in hectare.creations if creature in kept_creations]
+            if new_creations[:len(staying)] != staying:
+                staying = []  # Order of creatures was changed, all creatures of hectare are added again
+            if len(staying) != len(hectare.creations):
+                staying_creatures = set(staying)
+                hectare.remove_creatures({creature: None for creature in hectare.creations
+                                          if creature not in staying_creatures})
+            plans.append((new_creations, len(staying)))
+        for hectare, (new_creations, staying_amount), (creatures, changed) in zip(hectares, plans, contents):
+            for creature, (_, _, state) in zip(new_creations[:staying_amount], creatures):
+                was_dead = creature.is_dead()
+                _restore_state(creature, state)
+                if not was_dead and creature.is_dead():
+                    hectare.mark_dead(creature)
+            for creature, (_, _, state) in zip(new_creations[staying_amount:], creatures[staying_amount:]):
+                _restore_state(creature, state)
+            hectare.extend_hectare(new_creations[staying_amount:])
+            for place in changed:
+                hectare.mark_changed(new_creations[place])
+        self._version = self._forest._version
+        self._stale = False
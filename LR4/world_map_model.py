@@ -0,0 +1,81 @@
+#Author Vodohleb04
+from PyQt5 import QtCore, QtGui
+
+import configs
+from world_view import WorldView
+
+
+class WorldMapModel(QtCore.QAbstractTableModel):
+
+    def __init__(self, parent=None):
+        """Creates model of world map (one cell per hectare)
+
+        Model keeps only the last view of world, view of table asks data of visible cells only, so size of map
+        doesn't change cost of update
+        """
+        super().__init__(parent)
+        self._view = None
+        self._brushes = []
+        for level in range(configs.MAP_COLOR_LEVELS):
+            shade = 64 * level // max(configs.MAP_COLOR_LEVELS - 1, 1)
+            brush = QtGui.QBrush(QtGui.QColor(224 - shade, 224 - shade, 255))
+            brush.setStyle(QtCore.Qt.SolidPattern)
+            self._brushes.append(brush)
+        self._wasteland_brush = QtGui.QBrush(QtGui.QColor(244, 224, 255))
+        self._wasteland_brush.setStyle(QtCore.Qt.SolidPattern)
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        """Returns amount of lines of hectares"""
+        if parent.isValid() or self._view is None:
+            return 0
+        return len(self._view.counts)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        """Returns amount of columns of hectares"""
+        if parent.isValid() or self._view is None or not self._view.counts:
+            return 0
+        return len(self._view.counts[0])
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        """Returns text (amount of creatures), tooltip or background of hectare"""
+        if not index.isValid() or self._view is None:
+            return None
+        amount = self._view.counts[index.row()][index.column()]
+        if role == QtCore.Qt.DisplayRole:
+            if self._view.wasteland:
+                return configs.GuiMessages.WASTELAND_MAP_INFO.value
+            return configs.GuiMessages.HECTARE_MAP_INFO.value.format(amount)
+        if role == QtCore.Qt.ToolTipRole:
+            return configs.GuiMessages.HECTARE_TOOLTIP.value.format(index.row() + 1, index.column() + 1, amount)
+        if role == QtCore.Qt.BackgroundRole:
+            if self._view.wasteland:
+                return self._wasteland_brush
+            level = min(amount * (configs.MAP_COLOR_LEVELS - 1) // configs.MAP_FULL_COLOR_AMOUNT,
+                        configs.MAP_COLOR_LEVELS - 1)
+            return self._brushes[level]
+        return None
+
+    def headerData(self, section: int, orientation, role=QtCore.Qt.DisplayRole):
+        """Returns number of line or column of hectares (counted from 1)"""
+        if role == QtCore.Qt.DisplayRole:
+            return str(section + 1)
+        return None
+
+    def set_view(self, view: WorldView) -> None:
+        """Shows new view of world
+
+        Model is reset if view is full or map is changed completely (wasteland), otherwise only rectangle around
+        changed hectares is redrawn
+        """
+        previous_view = self._view
+        if view.full or previous_view is None or view.wasteland != previous_view.wasteland:
+            self.beginResetModel()
+            self._view = view
+            self.endResetModel()
+            return
+        self._view = view
+        if view.changed:
+            rows = [i for i, _ in view.changed]
+            columns = [j for _, j in view.changed]
+            self.dataChanged.emit(self.index(min(rows), min(columns)), self.index(max(rows), max(columns)),
+                                  [QtCore.Qt.DisplayRole, QtCore.Qt.ToolTipRole, QtCore.Qt.BackgroundRole])
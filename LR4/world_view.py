@@ -0,0 +1,90 @@
+#Author Vodohleb04
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+from ecosystem import EcoSystem
+
+
+class WorldView(NamedTuple):
+    """Immutable view of world that is published by simulation for drawing
+
+    counts - amount of creatures of every hectare (lines of hectares)
+    changed - positions of hectares changed since previous view (every hectare for full view)
+    wasteland - True if there is no creatures in forest
+    selected - position of selected hectare or None
+    selected_ids - ids of creatures of selected hectare in order of creations
+    selected_species - english names of species of these creatures (in the same order)
+    full - True if view is not based on previous view (world is new, every item must be drawn again)
+    cycles - amount of periods made since previous view
+    elapsed - time spent on these periods (seconds)
+    """
+    counts: Tuple[Tuple[int, ...], ...]
+    changed: FrozenSet[Tuple[int, int]]
+    wasteland: bool
+    selected: Optional[Tuple[int, int]]
+    selected_ids: Tuple[str, ...]
+    selected_species: Tuple[str, ...]
+    full: bool
+    cycles: int = 0
+    elapsed: float = 0.0
+
+
+class WorldViewPublisher:
+
+    def __init__(self):
+        """Creates builder of views of world
+
+        Counts of hectares are kept between views, only lines of changed hectares are built again. Creatures of
+        selected hectare are kept too, they are listed again only if hectare was changed or selected
+        """
+        self._forest = None
+        self._counts = ()
+        self._selected = None
+        self._selected_ids = ()
+        self._selected_species = ()
+        self._species_names = {}  # class of creature -> english name of species
+
+    def reset(self) -> None:
+        """Makes the next view full"""
+        self._forest = None
+
+    def publish(self, ecosystem: EcoSystem, selected: Optional[Tuple[int, int]], cycles=0,
+                elapsed=0.0) -> WorldView:
+        """Returns view of current state of ecosystem
+
+        ecosystem - ecosystem to show (must not be changed by other thread while view is built)
+        selected - position of selected hectare or None
+        cycles, elapsed - amount of periods made since previous view and time spent on them
+        View is full if it is the first view, if reset was called or if forest of ecosystem was replaced
+        """
+        forest = ecosystem.forest
+        changed = ecosystem.take_changed_hectares()
+        full = forest is not self._forest
+        if full:
+            self._forest = forest
+            self._counts = tuple(tuple(len(hectare.creations) for hectare in hectare_line)
+                                 for hectare_line in forest.hectares)
+            changed = {(i, j) for i in range(forest.vertical_length) for j in range(forest.horizontal_length)}
+        elif changed:
+            counts = list(self._counts)
+            for i in {i for i, _ in changed}:
+                counts[i] = tuple(len(hectare.creations) for hectare in forest.hectares[i])
+            self._counts = tuple(counts)
+
+        if selected is None or not (0 <= selected[0] < forest.vertical_length and
+                                    0 <= selected[1] < forest.horizontal_length):
+            selected = None
+            self._selected_ids, self._selected_species = (), ()
+        elif full or selected != self._selected or selected in changed:
+            creations = forest.hectares[selected[0]][selected[1]].creations
+            self._selected_ids = tuple(creature.id for creature in creations)
+            self._selected_species = tuple(self._species_name(creature) for creature in creations)
+        self._selected = selected
+        return WorldView(self._counts, frozenset(changed), ecosystem.is_wasteland(), selected, self._selected_ids,
+                         self._selected_species, full, cycles, elapsed)
+
+    def _species_name(self, creature) -> str:
+        """Returns english name of species of creature (names are cached by class of creature)"""
+        creature_class = type(creature)
+        if creature_class not in self._species_names:
+            self._species_names[creature_class] = EcoSystem._define_creature_type(creature)
+        return self._species_names[creature_class]